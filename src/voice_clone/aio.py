@@ -0,0 +1,111 @@
+"""Running the blocking engines from asyncio.
+
+Inference runs on an ``AsyncRunner``: a thread pool whose size bounds how
+many calls run at once, while further requests wait without holding a
+thread. Cancelling the awaiting task cancels a queued call outright; a
+running call cannot be interrupted inside the model, so the engines call
+``check_cancelled()`` between model calls (segments, batches) and the call
+unwinds there, freeing its slot early.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_state = threading.local()
+_DONE = object()
+
+
+class InferenceCancelled(Exception):
+    """Raised inside a runner thread when its request has been abandoned."""
+
+
+def check_cancelled() -> None:
+    """Raise ``InferenceCancelled`` if the call running on this thread was cancelled.
+
+    A no-op outside an ``AsyncRunner`` (i.e. for plain synchronous calls).
+    """
+    token = getattr(_state, "token", None)
+    if token is not None and token.is_set():
+        raise InferenceCancelled()
+
+
+def _call(token: threading.Event, fn: Callable[[], T]) -> T:
+    _state.token = token
+    try:
+        check_cancelled()
+        return fn()
+    finally:
+        _state.token = None
+
+
+class AsyncRunner:
+    """Bounded thread pool for blocking inference calls made from asyncio."""
+
+    def __init__(self, max_workers: int = 1, name: str = "voice-clone"):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+
+    async def run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Run ``fn(*args, **kwargs)`` on a runner thread and await its result."""
+        token = threading.Event()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, _call, token, functools.partial(fn, *args, **kwargs))
+        try:
+            return await future
+        except asyncio.CancelledError:
+            token.set()
+            raise
+
+    async def iterate(self, fn: Callable[..., Iterator[T]], *args, **kwargs) -> AsyncIterator[T]:
+        """Run generator ``fn(*args, **kwargs)`` on one runner thread, yielding its items.
+
+        The generator keeps its slot until it is exhausted or the consumer
+        stops (``break``, ``aclose()`` or cancellation); in the latter case
+        it is closed at its next ``check_cancelled()`` or item.
+        """
+        token = threading.Event()
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def put(item) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, (item, None))
+            except RuntimeError:
+                # The event loop is already closed: nobody is listening
+                token.set()
+
+        def produce() -> None:
+            generator = fn(*args, **kwargs)
+            try:
+                for item in generator:
+                    check_cancelled()
+                    put(item)
+            finally:
+                generator.close()
+
+        def finished(future: asyncio.Future) -> None:
+            # Scheduled after every item the thread put, so it always comes last
+            error = InferenceCancelled() if future.cancelled() else future.exception()
+            queue.put_nowait((_DONE, error))
+
+        future = loop.run_in_executor(self._executor, _call, token, produce)
+        future.add_done_callback(finished)
+        try:
+            while True:
+                item, error = await queue.get()
+                if item is _DONE:
+                    if error is not None:
+                        raise error
+                    return
+                yield item
+        finally:
+            token.set()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the runner threads (after the running calls finish if ``wait``)."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -1,6 +1,17 @@
 """Audio recording and device management."""
 
-from .devices import list_audio_devices, get_default_device
-from .recorder import Recorder
-
 __all__ = ["list_audio_devices", "get_default_device", "Recorder"]
+
+
+def __getattr__(name: str):
+    # Resolved lazily so that the DSP modules (e.g. resample) can be imported
+    # without sounddevice/PortAudio
+    if name in ("list_audio_devices", "get_default_device"):
+        from . import devices
+
+        return getattr(devices, name)
+    if name == "Recorder":
+        from .recorder import Recorder
+
+        return Recorder
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,13 @@
 """Audio device management for WSL/Linux."""
 
+import importlib.util
+import re
+import shutil
+import subprocess
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
-import sounddevice as sd
-
 
 @dataclass
 class AudioDevice:
@@ -29,6 +32,8 @@ class AudioDevice:
 
 def list_audio_devices() -> list[AudioDevice]:
     """List all available audio devices."""
+    import sounddevice as sd
+
     devices = []
     for idx, device in enumerate(sd.query_devices()):
         devices.append(
@@ -57,6 +62,8 @@ def list_output_devices() -> list[AudioDevice]:
 
 def get_default_device(input_device: bool = True) -> Optional[AudioDevice]:
     """Get the default input or output device."""
+    import sounddevice as sd
+
     try:
         if input_device:
             idx = sd.default.device[0]
@@ -96,30 +103,70 @@ def get_device_by_index(index: int) -> Optional[AudioDevice]:
     return None
 
 
+def torch_cuda_version() -> Optional[str]:
+    """CUDA version the installed torch was built with, without importing torch.
+
+    Returns:
+        The version (e.g. "12.1"), "" for a CPU-only build, or None if torch
+        is not installed
+    """
+    spec = importlib.util.find_spec("torch")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    try:
+        source = (Path(spec.submodule_search_locations[0]) / "version.py").read_text()
+    except OSError:
+        return None
+    match = re.search(r"^cuda\b[^=]*=\s*['\"]([^'\"]*)['\"]", source, re.MULTILINE)
+    return match.group(1) if match else ""
+
+
 def get_gpu_info() -> dict:
-    """Get GPU information for TTS."""
+    """Get GPU information for TTS.
+
+    GPUs are listed by ``nvidia-smi`` and the torch build is read from its
+    version file, so that listing devices does not pay for importing torch
+    and initializing CUDA. ``cuda_available`` requires both, matching what
+    ``torch.cuda.is_available()`` would report to ``QwenTTS``.
+    """
     info = {
         "cuda_available": False,
+        "torch_cuda": torch_cuda_version(),
         "device_count": 0,
         "devices": [],
     }
 
+    nvidia_smi = shutil.which("nvidia-smi")
+    if nvidia_smi is None:
+        return info
+
     try:
-        import torch
-
-        info["cuda_available"] = torch.cuda.is_available()
-        if info["cuda_available"]:
-            info["device_count"] = torch.cuda.device_count()
-            for i in range(info["device_count"]):
-                props = torch.cuda.get_device_properties(i)
-                info["devices"].append(
-                    {
-                        "index": i,
-                        "name": props.name,
-                        "total_memory_gb": props.total_memory / (1024**3),
-                    }
-                )
-    except ImportError:
-        pass
+        result = subprocess.run(
+            [nvidia_smi, "--query-gpu=index,name,memory.total", "--format=csv,noheader,nounits"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return info
+
+    for line in result.stdout.splitlines():
+        fields = [f.strip() for f in line.split(",")]
+        if len(fields) != 3:
+            continue
+        index, name, memory_mib = fields
+        try:
+            info["devices"].append(
+                {
+                    "index": int(index),
+                    "name": name,
+                    "total_memory_gb": float(memory_mib) / 1024,
+                }
+            )
+        except ValueError:
+            continue
 
+    info["device_count"] = len(info["devices"])
+    info["cuda_available"] = info["device_count"] > 0 and bool(info["torch_cuda"])
     return info
@@ -0,0 +1,197 @@
+"""Shared audio loading with decode/downmix/resample caching.
+
+Reference audio is decoded once into a canonical float32 mono array,
+memoized by (path, mtime, size), and each target sample rate is derived
+from that array once. Decoded arrays can optionally be persisted as ``.npy``
+files that are memory-mapped on reuse.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import soundfile as sf
+
+from ..metrics import metrics
+from .resample import resample
+
+DEFAULT_AUDIO_CACHE_DIR = Path.home() / ".voice-clone" / "audio-cache"
+
+
+def hash_file(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Compute the SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class _FileKey:
+    path: str
+    mtime_ns: int
+    size: int
+
+    @classmethod
+    def of(cls, path: Path) -> "_FileKey":
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Audio file not found: {path}")
+        st = path.stat()
+        return cls(str(path.resolve()), st.st_mtime_ns, st.st_size)
+
+    def token(self) -> str:
+        return hashlib.sha256(f"{self.path}|{self.mtime_ns}|{self.size}".encode()).hexdigest()
+
+
+@dataclass
+class AudioCacheStats:
+    """Hit/miss counters for the audio cache."""
+
+    hits: int = 0
+    disk_hits: int = 0
+    decodes: int = 0
+    resamples: int = 0
+
+
+class AudioCache:
+    """LRU cache of decoded mono float32 audio, per file and sample rate."""
+
+    def __init__(self, max_entries: int = 32, cache_dir: Optional[Path] = None):
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.stats = AudioCacheStats()
+        self._arrays: OrderedDict[tuple, tuple[np.ndarray, int]] = OrderedDict()
+        self._digests: dict[_FileKey, str] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key: tuple) -> Optional[tuple[np.ndarray, int]]:
+        with self._lock:
+            entry = self._arrays.get(key)
+            if entry is not None:
+                self._arrays.move_to_end(key)
+                self.stats.hits += 1
+            return entry
+
+    def _put(self, key: tuple, audio: np.ndarray, sample_rate: int) -> None:
+        audio.setflags(write=False)
+        with self._lock:
+            self._arrays[key] = (audio, sample_rate)
+            self._arrays.move_to_end(key)
+            while len(self._arrays) > self.max_entries:
+                self._arrays.popitem(last=False)
+
+    def _disk_path(self, file_key: _FileKey, rate: Optional[int]) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{file_key.token()}-{rate or 'native'}.npy"
+
+    def _load_disk(self, file_key: _FileKey, rate: Optional[int]) -> Optional[tuple[np.ndarray, int]]:
+        path = self._disk_path(file_key, rate)
+        if path is None or not path.exists():
+            return None
+        try:
+            audio = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        native_rate = int(path.with_suffix(".rate").read_text()) if rate is None else rate
+        self.stats.disk_hits += 1
+        return audio, native_rate
+
+    def _save_disk(self, file_key: _FileKey, rate: Optional[int], audio: np.ndarray, sample_rate: int) -> None:
+        path = self._disk_path(file_key, rate)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if rate is None:
+            path.with_suffix(".rate").write_text(str(sample_rate))
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+        np.save(tmp_path, audio)
+        os.replace(tmp_path, path)
+
+    def _decode(self, file_key: _FileKey) -> tuple[np.ndarray, int]:
+        key = (file_key, None)
+        entry = self._get(key)
+        if entry is not None:
+            return entry
+
+        entry = self._load_disk(file_key, None)
+        if entry is None:
+            with metrics.timer("audio_decode"):
+                audio, sample_rate = sf.read(file_key.path, dtype="float32", always_2d=True)
+                audio = np.ascontiguousarray(audio.mean(axis=1, dtype=np.float32))
+            self.stats.decodes += 1
+            self._save_disk(file_key, None, audio, sample_rate)
+            entry = (audio, sample_rate)
+
+        self._put(key, *entry)
+        return entry
+
+    def load(self, path: Path, sample_rate: Optional[int] = None) -> tuple[np.ndarray, int]:
+        """Load a file as read-only mono float32, optionally at a given rate.
+
+        Args:
+            path: Audio file
+            sample_rate: Target sample rate (None = the file's own rate)
+
+        Returns:
+            Tuple of (audio, sample_rate)
+        """
+        file_key = _FileKey.of(path)
+        audio, native_rate = self._decode(file_key)
+        if sample_rate is None or sample_rate == native_rate:
+            return audio, native_rate
+
+        key = (file_key, sample_rate)
+        entry = self._get(key)
+        if entry is None:
+            entry = self._load_disk(file_key, sample_rate)
+            if entry is None:
+                with metrics.timer("audio_resample"):
+                    entry = (resample(audio, native_rate, sample_rate), sample_rate)
+                self.stats.resamples += 1
+                self._save_disk(file_key, sample_rate, *entry)
+            self._put(key, *entry)
+        return entry
+
+    def digest(self, path: Path) -> str:
+        """SHA-256 of a file's contents, memoized by (path, mtime, size)."""
+        file_key = _FileKey.of(path)
+        with self._lock:
+            digest = self._digests.get(file_key)
+        if digest is None:
+            digest = hash_file(Path(file_key.path))
+            with self._lock:
+                self._digests[file_key] = digest
+        return digest
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (disk entries are kept)."""
+        with self._lock:
+            self._arrays.clear()
+            self._digests.clear()
+
+
+# Shared by QwenTTS and VoskSTT so a reference is decoded once per process
+default_audio_cache = AudioCache()
+
+
+def load_audio(path: Path, sample_rate: Optional[int] = None) -> tuple[np.ndarray, int]:
+    """Load audio through the shared cache (see ``AudioCache.load``)."""
+    return default_audio_cache.load(path, sample_rate)
+
+
+def file_digest(path: Path) -> str:
+    """Content hash through the shared cache (see ``AudioCache.digest``)."""
+    return default_audio_cache.digest(path)
+
+
+def enable_disk_cache(cache_dir: Path = DEFAULT_AUDIO_CACHE_DIR) -> None:
+    """Persist decoded audio for the shared cache as memory-mapped ``.npy`` files."""
+    default_audio_cache.cache_dir = Path(cache_dir)
@@ -0,0 +1,144 @@
+"""Real-time playback of generated audio."""
+
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+import sounddevice as sd
+
+from .devices import get_device_by_index
+from .ring import RingBuffer
+
+
+class Player:
+    """Play audio chunks as they are produced, through a jitter buffer.
+
+    Chunks are written into a ring buffer that an output-stream callback
+    drains. Playback starts (and, after an underrun, resumes) only once
+    enough audio is buffered to cover the time the next chunk is expected
+    to take to generate, estimated from the measured real-time factor
+    (generation time / audio time) of the chunks so far.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        device: Optional[int] = None,
+        min_prebuffer: float = 0.2,
+        safety: float = 1.25,
+        buffer_seconds: float = 120.0,
+    ):
+        """Initialize the player.
+
+        Args:
+            sample_rate: Sample rate of the chunks
+            device: Output device index (see ``voice-clone devices --audio``)
+            min_prebuffer: Seconds buffered before playback starts, at least
+            safety: Margin applied to the estimated generation time
+            buffer_seconds: Capacity of the jitter buffer
+        """
+        if device is not None:
+            info = get_device_by_index(device)
+            if info is None or not info.is_output:
+                raise ValueError(f"Not an output device: {device}")
+
+        self.sample_rate = sample_rate
+        self.device = device
+        self.min_prebuffer = min_prebuffer
+        self.safety = safety
+        self.underruns = 0
+        self.rtf: Optional[float] = None
+
+        self._ring = RingBuffer(int(sample_rate * buffer_seconds), 1, "float32")
+        self._playing = False
+        self._finished = False
+        self._drained = threading.Event()
+        self._stream: Optional[sd.OutputStream] = None
+        self._last_write: Optional[float] = None
+        self._chunk_seconds: Optional[float] = None
+
+    def _callback(self, outdata: np.ndarray, frames: int, time_info, status) -> None:
+        if not self._playing:
+            outdata.fill(0)
+            return
+        n = len(self._ring.read(outdata))
+        if n < frames:
+            outdata[n:] = 0
+            if self._finished:
+                self._drained.set()
+            else:
+                # Ran dry mid-stream: pause and rebuffer
+                self._playing = False
+                self.underruns += 1
+
+    @property
+    def buffered(self) -> float:
+        """Seconds of audio waiting to be played."""
+        return len(self._ring) / self.sample_rate
+
+    @property
+    def prebuffer(self) -> float:
+        """Seconds to buffer before (re)starting playback."""
+        if self.rtf is None or self._chunk_seconds is None:
+            return self.min_prebuffer
+        # The next chunk takes about rtf * chunk length to generate
+        return max(self.min_prebuffer, self.rtf * self._chunk_seconds * self.safety)
+
+    def start(self) -> None:
+        """Open the output stream and start timing generation."""
+        if self._stream is None:
+            self._last_write = time.perf_counter()
+            self._stream = sd.OutputStream(
+                samplerate=self.sample_rate,
+                channels=1,
+                dtype="float32",
+                device=self.device,
+                callback=self._callback,
+            )
+            self._stream.start()
+
+    def write(self, chunk: np.ndarray) -> None:
+        """Queue a mono chunk, blocking while the buffer is full.
+
+        Call ``start`` when generation begins so the first chunk's
+        generation time is measured too.
+        """
+        now = time.perf_counter()
+        seconds = len(chunk) / self.sample_rate
+        if seconds and self._last_write is not None:
+            rtf = (now - self._last_write) / seconds
+            # Smooth so one slow or fast chunk does not swing the buffer size
+            self.rtf = rtf if self.rtf is None else 0.5 * self.rtf + 0.5 * rtf
+            self._chunk_seconds = seconds if self._chunk_seconds is None else max(self._chunk_seconds, seconds)
+
+        self.start()
+        data = np.asarray(chunk, dtype=np.float32).reshape(-1, 1)
+        while len(data):
+            written = self._ring.write(data[: self._ring.capacity - len(self._ring)])
+            data = data[written:]
+            if len(data):
+                self._playing = True
+                time.sleep(0.05)
+
+        if not self._playing and self.buffered >= self.prebuffer:
+            self._playing = True
+        self._last_write = time.perf_counter()
+
+    def close(self) -> None:
+        """Play out whatever is buffered, then close the stream."""
+        if self._stream is None:
+            return
+        self._finished = True
+        self._playing = True
+        if len(self._ring):
+            self._drained.wait(self.buffered + 1.0)
+        self._stream.stop()
+        self._stream.close()
+        self._stream = None
+
+    def __enter__(self) -> "Player":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,16 +1,17 @@
 """Audio recording functionality."""
 
-import queue
 import sys
 import threading
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import numpy as np
 import sounddevice as sd
 import soundfile as sf
 
 from ..config import AudioConfig
+from .ring import RingBuffer
+from .vad import VAD, LiveTrimmer
 
 
 class Recorder:
@@ -19,22 +20,79 @@ class Recorder:
     def __init__(self, config: Optional[AudioConfig] = None, device: Optional[int] = None):
         self.config = config or AudioConfig()
         self.device = device
-        self._audio_queue: queue.Queue = queue.Queue()
         self._recording = False
-        self._recorded_frames: list[np.ndarray] = []
+        self._ring = RingBuffer(
+            int(self.config.sample_rate * self.config.buffer_seconds),
+            self.config.channels,
+            self.config.dtype,
+        )
+        self._input_overflows = 0
 
     def _audio_callback(self, indata: np.ndarray, frames: int, time_info, status):
-        """Callback for audio stream."""
-        if status:
-            print(f"Recording status: {status}", file=sys.stderr)
-        self._audio_queue.put(indata.copy())
+        """Callback for audio stream (runs on the audio thread, so it must not allocate)."""
+        if status.input_overflow:
+            self._input_overflows += 1
+        self._ring.write(indata)
+
+    @property
+    def overruns(self) -> int:
+        """Overruns in the last capture, from PortAudio or a full ring buffer."""
+        return self._input_overflows + self._ring.overruns
+
+    def stream(self, stop_event: threading.Event, poll_seconds: float = 0.05) -> Iterator[np.ndarray]:
+        """Capture from the input device until ``stop_event`` is set.
 
-    def record_fixed(self, duration: float, output_path: Path) -> Path:
+        The audio callback only copies into a preallocated ring buffer; this
+        generator drains it every ``poll_seconds``, so memory stays constant
+        for any recording length.
+
+        Args:
+            stop_event: Set to end the capture
+            poll_seconds: Interval between drains
+
+        Yields:
+            ``(frames, channels)`` blocks. The array is reused between
+            iterations, so copy it if it must outlive the loop body.
+        """
+        self._ring.clear()
+        self._input_overflows = 0
+        block = np.empty((self._ring.capacity, self.config.channels), dtype=self.config.dtype)
+
+        self._recording = True
+        try:
+            with sd.InputStream(
+                samplerate=self.config.sample_rate,
+                channels=self.config.channels,
+                dtype=self.config.dtype,
+                device=self.device,
+                callback=self._audio_callback,
+            ):
+                while not stop_event.wait(poll_seconds):
+                    data = self._ring.read(block)
+                    if len(data):
+                        yield data
+        finally:
+            self._recording = False
+
+        data = self._ring.read(block)
+        if len(data):
+            yield data
+
+    def _report_overruns(self) -> None:
+        if self.overruns:
+            print(
+                f"Warning: {self.overruns} overruns during recording "
+                f"({self._ring.dropped_frames} frames dropped by a full buffer)",
+                file=sys.stderr,
+            )
+
+    def record_fixed(self, duration: float, output_path: Path, trim: bool = False) -> Path:
         """Record audio for a fixed duration.
 
         Args:
             duration: Recording duration in seconds
             output_path: Path to save the recorded audio
+            trim: Cut leading and trailing silence before saving
 
         Returns:
             Path to the saved audio file
@@ -56,6 +114,11 @@ class Recorder:
 
         print("Recording finished.")
 
+        if trim:
+            segments = VAD(self.config.sample_rate).segments(audio_data.mean(axis=1))
+            if segments:
+                audio_data = audio_data[segments[0][0] : segments[-1][1]]
+
         sf.write(
             output_path,
             audio_data,
@@ -66,11 +129,36 @@ class Recorder:
 
         return output_path
 
-    def record_interactive(self, output_path: Path) -> Path:
+    def _open_output(self, output_path: Path, append: bool) -> sf.SoundFile:
+        if append and output_path.exists():
+            f = sf.SoundFile(output_path, mode="r+")
+            if f.samplerate != self.config.sample_rate or f.channels != self.config.channels:
+                f.close()
+                raise ValueError(
+                    f"Cannot append to {output_path}: it is {f.samplerate} Hz / {f.channels} ch"
+                )
+            f.seek(0, sf.SEEK_END)
+            return f
+        return sf.SoundFile(
+            output_path,
+            mode="w",
+            samplerate=self.config.sample_rate,
+            channels=self.config.channels,
+            format=self.config.format,
+            subtype=self.config.subtype,
+        )
+
+    def record_interactive(self, output_path: Path, append: bool = False, trim: bool = False) -> Path:
         """Record audio interactively (Enter to start/stop).
 
+        Audio is written to disk as it is captured, so long recordings use
+        constant memory.
+
         Args:
             output_path: Path to save the recorded audio
+            append: Append to an existing file instead of overwriting it
+            trim: Drop silence before the first and after the last speech
+                while recording (long pauses are shortened to one second)
 
         Returns:
             Path to the saved audio file
@@ -78,14 +166,10 @@ class Recorder:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self._recorded_frames = []
-        self._recording = False
-
         print("Press Enter to start recording...")
         input()
 
         print("Recording... Press Enter to stop.")
-        self._recording = True
 
         stop_event = threading.Event()
 
@@ -96,37 +180,29 @@ class Recorder:
         stop_thread = threading.Thread(target=wait_for_stop, daemon=True)
         stop_thread.start()
 
-        with sd.InputStream(
-            samplerate=self.config.sample_rate,
-            channels=self.config.channels,
-            dtype=self.config.dtype,
-            device=self.device,
-            callback=self._audio_callback,
-        ):
-            while not stop_event.is_set():
-                try:
-                    data = self._audio_queue.get(timeout=0.1)
-                    self._recorded_frames.append(data)
-                except queue.Empty:
-                    continue
+        trimmer = LiveTrimmer(self.config.sample_rate) if trim else None
+        recorded = 0
+        with self._open_output(output_path, append) as f:
+            for block in self.stream(stop_event):
+                if trimmer:
+                    block = trimmer.process(block)
+                f.write(block)
+                recorded += len(block)
+            if trimmer:
+                tail = trimmer.flush()
+                f.write(tail)
+                recorded += len(tail)
 
-        self._recording = False
         print("Recording stopped.")
+        self._report_overruns()
 
-        if self._recorded_frames:
-            audio_data = np.concatenate(self._recorded_frames, axis=0)
-            sf.write(
-                output_path,
-                audio_data,
-                self.config.sample_rate,
-                format=self.config.format,
-                subtype=self.config.subtype,
-            )
-            duration = len(audio_data) / self.config.sample_rate
-            print(f"Saved {duration:.2f} seconds of audio to {output_path}")
-        else:
+        if not recorded:
+            if not append:
+                output_path.unlink(missing_ok=True)
             raise RuntimeError("No audio data recorded")
 
+        duration = recorded / self.config.sample_rate
+        print(f"Saved {duration:.2f} seconds of audio to {output_path}")
         return output_path
 
     def test_recording(self, duration: float = 1.0) -> bool:
@@ -0,0 +1,138 @@
+"""Polyphase sample-rate conversion.
+
+Rational-ratio polyphase resampling replaces whole-signal FFT resampling
+(``scipy.signal.resample``): it runs in linear time with small temporaries,
+does not care whether the length is a power of two, and can process audio
+chunk by chunk. The anti-aliasing filter is designed once per rate pair.
+"""
+
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+
+
+def _ratio(src_rate: int, dst_rate: int) -> tuple[int, int]:
+    g = gcd(int(src_rate), int(dst_rate))
+    return int(dst_rate) // g, int(src_rate) // g
+
+
+@lru_cache(maxsize=32)
+def design_filter(up: int, down: int) -> np.ndarray:
+    """Design the low-pass FIR filter for an up/down ratio (cached).
+
+    Matches the default filter of ``scipy.signal.resample_poly``: a
+    Kaiser-windowed sinc (beta 5.0) with cutoff at the lower Nyquist rate.
+    """
+    from scipy.signal import firwin
+
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    h = firwin(2 * half_len + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+    h.setflags(write=False)
+    return h
+
+
+def resample(audio: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    """Resample a whole mono signal.
+
+    Args:
+        audio: Mono signal
+        src_rate: Sample rate of ``audio``
+        dst_rate: Target sample rate
+
+    Returns:
+        Resampled float32 signal with ``ceil(len(audio) * dst_rate / src_rate)`` samples
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    if src_rate == dst_rate:
+        return audio
+
+    from scipy.signal import resample_poly
+
+    up, down = _ratio(src_rate, dst_rate)
+    return resample_poly(audio, up, down, window=design_filter(up, down)).astype(np.float32)
+
+
+class StreamingResampler:
+    """Chunk-by-chunk polyphase resampler with carried state.
+
+    Feeding a signal through ``process`` in any chunking and then calling
+    ``flush`` yields the same samples as ``resample`` on the whole signal.
+    Output lags input by about half the filter length until flushed.
+    """
+
+    def __init__(self, src_rate: int, dst_rate: int):
+        self.src_rate = src_rate
+        self.dst_rate = dst_rate
+        self.up, self.down = _ratio(src_rate, dst_rate)
+
+        h = design_filter(self.up, self.down) * self.up
+        self._half_len = (len(h) - 1) // 2
+        self._taps = -(-len(h) // self.up)
+        padded = np.zeros(self._taps * self.up, dtype=np.float32)
+        padded[: len(h)] = h
+        # Row p holds the taps of phase p, reversed to match input windows
+        self._phases = np.ascontiguousarray(padded.reshape(self._taps, self.up).T[:, ::-1])
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all carried state."""
+        # Leading zeros stand in for samples before the start of the signal
+        self._buf = np.zeros(self._taps - 1, dtype=np.float32)
+        self._buf_start = -(self._taps - 1)
+        self._received = 0
+        self._next_out = 0
+
+    def _last_input(self, n: np.ndarray) -> np.ndarray:
+        return (n * self.down + self._half_len) // self.up
+
+    def _emit(self, n_end: int) -> np.ndarray:
+        if n_end <= self._next_out:
+            return np.zeros(0, dtype=np.float32)
+
+        n = np.arange(self._next_out, n_end)
+        t = n * self.down + self._half_len
+        last = t // self.up
+        windows = np.lib.stride_tricks.sliding_window_view(self._buf, self._taps)
+        out = np.einsum(
+            "nt,nt->n",
+            windows[last - (self._taps - 1) - self._buf_start],
+            self._phases[t % self.up],
+        ).astype(np.float32)
+
+        # Drop input no longer needed by later outputs
+        self._next_out = n_end
+        keep_from = int(self._last_input(np.array(n_end))) - (self._taps - 1)
+        drop = min(max(0, keep_from - self._buf_start), len(self._buf))
+        self._buf = self._buf[drop:]
+        self._buf_start += drop
+        return out
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        """Feed a mono chunk and return the output samples now available."""
+        chunk = np.asarray(chunk, dtype=np.float32)
+        if self.up == self.down:
+            return chunk
+
+        self._buf = np.concatenate([self._buf, chunk])
+        self._received += len(chunk)
+
+        # Output n is ready once its last input sample has arrived
+        n_end = -(-(self._received * self.up - self._half_len) // self.down)
+        return self._emit(max(n_end, self._next_out))
+
+    def flush(self) -> np.ndarray:
+        """Return the remaining output, treating samples after the end as zero."""
+        if self.up == self.down:
+            return np.zeros(0, dtype=np.float32)
+
+        n_total = -(-self._received * self.up // self.down)
+        if n_total <= self._next_out:
+            return np.zeros(0, dtype=np.float32)
+
+        needed = int(self._last_input(np.array(n_total - 1))) + 1
+        pad = needed - (self._buf_start + len(self._buf))
+        if pad > 0:
+            self._buf = np.concatenate([self._buf, np.zeros(pad, dtype=np.float32)])
+        return self._emit(n_total)
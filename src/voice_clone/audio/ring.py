@@ -0,0 +1,63 @@
+"""Preallocated ring buffer for the audio capture path."""
+
+from typing import Optional
+
+import numpy as np
+
+
+class RingBuffer:
+    """Single-producer/single-consumer ring buffer of audio frames.
+
+    The producer (a PortAudio callback) copies blocks into a preallocated
+    array without allocating, and a consumer thread drains them. Each side
+    only advances its own counter, so no lock is needed. When the consumer
+    falls behind and the buffer is full, incoming frames are dropped and
+    counted as overruns rather than blocking the audio thread.
+    """
+
+    def __init__(self, frames: int, channels: int = 1, dtype: str = "float32"):
+        self.capacity = frames
+        self.channels = channels
+        self._buf = np.zeros((frames, channels), dtype=dtype)
+        self._written = 0  # Total frames written (producer only)
+        self._read = 0  # Total frames read (consumer only)
+        self.overruns = 0
+        self.dropped_frames = 0
+
+    def __len__(self) -> int:
+        return self._written - self._read
+
+    def write(self, data: np.ndarray) -> int:
+        """Copy a ``(frames, channels)`` block in; returns the frames kept."""
+        n = len(data)
+        free = self.capacity - (self._written - self._read)
+        if n > free:
+            self.overruns += 1
+            self.dropped_frames += n - free
+            n = free
+
+        start = self._written % self.capacity
+        first = min(n, self.capacity - start)
+        self._buf[start : start + first] = data[:first]
+        self._buf[: n - first] = data[first:n]
+        self._written += n
+        return n
+
+    def read(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Drain buffered frames, into ``out`` if given (up to its length)."""
+        n = len(self)
+        if out is None:
+            out = np.empty((n, self.channels), dtype=self._buf.dtype)
+        n = min(n, len(out))
+
+        start = self._read % self.capacity
+        first = min(n, self.capacity - start)
+        out[:first] = self._buf[start : start + first]
+        out[first:n] = self._buf[: n - first]
+        self._read += n
+        return out[:n]
+
+    def clear(self) -> None:
+        """Discard buffered frames and reset the counters (no writer may be active)."""
+        self._written = self._read = 0
+        self.overruns = self.dropped_frames = 0
@@ -0,0 +1,237 @@
+"""Energy-based voice activity detection for reference audio.
+
+Leading/trailing silence in a reference take is encoded into the voice
+prompt and transcribed by Vosk for nothing. Frames are classified as speech
+when their level is a margin above the estimated noise floor; the offline
+``VAD`` works on whole arrays with vectorized framing, and ``LiveTrimmer``
+applies the same rule to blocks as they are recorded.
+"""
+
+from collections import deque
+from typing import Optional
+
+import numpy as np
+
+# Frames quieter than this are treated as digital silence, not the noise floor
+_MIN_LEVEL_DB = -70.0
+
+
+def frame_levels(audio: np.ndarray, sample_rate: int, frame_ms: float = 20.0) -> np.ndarray:
+    """RMS level in dBFS of each non-overlapping frame of a mono signal."""
+    frame = max(1, int(sample_rate * frame_ms / 1000))
+    n = len(audio) // frame
+    if n == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = np.asarray(audio[: n * frame], dtype=np.float32).reshape(n, frame)
+    power = np.einsum("ij,ij->i", frames, frames) / frame
+    return (10 * np.log10(power + 1e-12)).astype(np.float32)
+
+
+def _runs(mask: np.ndarray) -> list[tuple[int, int]]:
+    """[start, end) index ranges of the True runs in a boolean array."""
+    edges = np.diff(np.concatenate([[0], mask.astype(np.int8), [0]]))
+    return list(zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)))
+
+
+class VAD:
+    """Offline energy VAD: trimming, utterance splitting and reference selection."""
+
+    def __init__(
+        self,
+        sample_rate: int,
+        frame_ms: float = 20.0,
+        margin_db: float = 12.0,
+        min_speech_ms: float = 120.0,
+        min_silence_ms: float = 300.0,
+        pad_ms: float = 150.0,
+    ):
+        self.sample_rate = sample_rate
+        self.frame_ms = frame_ms
+        self.frame = max(1, int(sample_rate * frame_ms / 1000))
+        self.margin_db = margin_db
+        self.min_speech = max(1, round(min_speech_ms / frame_ms))
+        self.min_silence = max(1, round(min_silence_ms / frame_ms))
+        self.pad = round(pad_ms / frame_ms)
+
+    def noise_floor(self, levels: np.ndarray) -> float:
+        """Estimate the noise floor (dBFS) as a low percentile of frame levels."""
+        if len(levels) == 0:
+            return _MIN_LEVEL_DB
+        return max(float(np.percentile(levels, 10)), _MIN_LEVEL_DB)
+
+    def speech_mask(self, audio: np.ndarray) -> np.ndarray:
+        """Per-frame speech decision, with short gaps and blips smoothed out."""
+        levels = frame_levels(audio, self.sample_rate, self.frame_ms)
+        mask = levels > self.noise_floor(levels) + self.margin_db
+
+        # Bridge pauses shorter than min_silence, then drop blips shorter than min_speech
+        for start, end in _runs(~mask):
+            if 0 < start and end < len(mask) and end - start < self.min_silence:
+                mask[start:end] = True
+        for start, end in _runs(mask):
+            if end - start < self.min_speech:
+                mask[start:end] = False
+        return mask
+
+    def segments(self, audio: np.ndarray) -> list[tuple[int, int]]:
+        """Speech regions as padded ``[start, end)`` sample ranges."""
+        mask = self.speech_mask(audio)
+        return [
+            (max(0, start - self.pad) * self.frame, min(len(audio), (end + self.pad) * self.frame))
+            for start, end in _runs(mask)
+        ]
+
+    def trim(self, audio: np.ndarray) -> np.ndarray:
+        """Cut leading and trailing silence (the input is returned if no speech is found)."""
+        segments = self.segments(audio)
+        if not segments:
+            return audio
+        return audio[segments[0][0] : segments[-1][1]]
+
+    def clip_ranges(self, audio: np.ndarray, max_seconds: float = 10.0) -> list[tuple[int, int]]:
+        """Group utterances into clips of at most ``max_seconds``.
+
+        Neighbouring utterances are merged while the clip stays under
+        ``max_seconds``; a single longer utterance is kept whole.
+        """
+        max_len = int(max_seconds * self.sample_rate)
+        clips: list[tuple[int, int]] = []
+        for start, end in self.segments(audio):
+            if clips and end - clips[-1][0] <= max_len:
+                clips[-1] = (clips[-1][0], end)
+            else:
+                clips.append((start, end))
+        return clips
+
+    def split(self, audio: np.ndarray, max_seconds: float = 10.0) -> list[np.ndarray]:
+        """Split a long take into utterance clips (see ``clip_ranges``)."""
+        return [audio[start:end] for start, end in self.clip_ranges(audio, max_seconds)]
+
+    def best_window(
+        self,
+        audio: np.ndarray,
+        min_seconds: float = 3.0,
+        max_seconds: float = 10.0,
+    ) -> Optional[tuple[int, int]]:
+        """Pick the cleanest reference window.
+
+        Candidates start and end on speech boundaries and last between
+        ``min_seconds`` and ``max_seconds``. Each is scored by the SNR of its
+        speech frames against the noise floor, weighted by the fraction of
+        the window that is speech.
+
+        Returns:
+            ``(start, end)`` sample range, or None if no window fits
+        """
+        levels = frame_levels(audio, self.sample_rate, self.frame_ms)
+        if len(levels) == 0:
+            return None
+        mask = self.speech_mask(audio)
+        noise = self.noise_floor(levels)
+
+        # Prefix sums make each candidate's score O(1)
+        power = 10 ** (levels / 10) * mask
+        cum_power = np.concatenate([[0.0], np.cumsum(power)])
+        cum_speech = np.concatenate([[0], np.cumsum(mask)])
+
+        segments = self.segments(audio)
+        min_len = min_seconds * self.sample_rate
+        max_len = max_seconds * self.sample_rate
+        best, best_score = None, -np.inf
+        for i, (start, _) in enumerate(segments):
+            for _, end in segments[i:]:
+                length = end - start
+                if length > max_len:
+                    break
+                if length < min_len:
+                    continue
+                f0, f1 = start // self.frame, min(len(levels), -(-end // self.frame))
+                speech = cum_speech[f1] - cum_speech[f0]
+                if not speech:
+                    continue
+                snr = 10 * np.log10((cum_power[f1] - cum_power[f0]) / speech) - noise
+                score = snr * speech / (f1 - f0)
+                if score > best_score:
+                    best, best_score = (start, end), score
+        return best
+
+
+class LiveTrimmer:
+    """Drop leading/trailing silence from blocks as they are recorded.
+
+    Audio before the first speech is held only as a short pre-roll, and
+    silence after speech is held back until speech resumes, so what is
+    written never starts or ends with more than ``pad_ms`` of silence.
+    Pauses longer than ``max_pause_ms`` are shortened to that length, which
+    keeps memory bounded.
+
+    The noise floor is tracked from the quietest recent frames, so it
+    adapts to the room without a calibration step. Until a second of audio
+    has been seen it is capped at ``initial_floor_db``, so speech right at
+    the start is kept rather than mistaken for the floor.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        frame_ms: float = 20.0,
+        margin_db: float = 12.0,
+        pad_ms: float = 150.0,
+        max_pause_ms: float = 1000.0,
+        noise_window_s: float = 5.0,
+        initial_floor_db: float = -50.0,
+    ):
+        self.sample_rate = sample_rate
+        self.frame_ms = frame_ms
+        self.frame = max(1, int(sample_rate * frame_ms / 1000))
+        self.margin_db = margin_db
+        self.initial_floor_db = initial_floor_db
+        self.started = False
+        self._warmup = max(1, round(1000 / frame_ms))
+        self._levels: deque = deque(maxlen=max(1, int(noise_window_s * 1000 / frame_ms)))
+        self._preroll: deque = deque(maxlen=max(1, round(pad_ms / frame_ms)))
+        self._pause: deque = deque(maxlen=max(1, round(max_pause_ms / frame_ms)))
+        self._pad = self._preroll.maxlen
+        self._remainder: Optional[np.ndarray] = None
+
+    def _floor(self) -> float:
+        floor = max(float(np.percentile(self._levels, 10)), _MIN_LEVEL_DB)
+        if len(self._levels) < self._warmup:
+            floor = min(floor, self.initial_floor_db)
+        return floor
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """Feed a ``(frames, channels)`` block; return the frames to keep."""
+        block = np.asarray(block, dtype=np.float32)
+        if block.ndim == 1:
+            block = block[:, None]
+        if self._remainder is not None and len(self._remainder):
+            block = np.concatenate([self._remainder, block])
+        n = len(block) // self.frame
+        self._remainder = block[n * self.frame :].copy()
+
+        frames = block[: n * self.frame].reshape(n, self.frame, block.shape[1])
+        levels = frame_levels(frames.mean(axis=2).ravel(), self.sample_rate, self.frame_ms)
+        out = []
+        for frame, level in zip(frames, levels):
+            self._levels.append(level)
+            if level > self._floor() + self.margin_db:
+                if not self.started:
+                    out.extend(self._preroll)
+                    self.started = True
+                out.extend(self._pause)
+                self._pause.clear()
+                out.append(frame.copy())
+            elif self.started:
+                self._pause.append(frame.copy())
+            else:
+                self._preroll.append(frame.copy())
+        return np.concatenate(out) if out else block[:0]
+
+    def flush(self) -> np.ndarray:
+        """Return the trailing pad after the last speech."""
+        tail = list(self._pause)[: self._pad] if self.started else []
+        self._pause.clear()
+        if tail:
+            return np.concatenate(tail)
+        return self._remainder[:0] if self._remainder is not None else np.zeros((0, 1), dtype=np.float32)
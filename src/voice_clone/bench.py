@@ -0,0 +1,297 @@
+"""Benchmark suite for the TTS and STT hot paths.
+
+Each stage of the clone pipeline (reference load, prompt build, generation,
+time to first audio, resample, write, transcription) is timed over several
+rounds after a warm-up round, in the manner of pytest-benchmark. Reports
+serialize to JSON with stable keys so runs can be compared across commits.
+Use the ``stub`` model to run the suite without the Qwen weights.
+"""
+
+import json
+import platform
+import re
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+import soundfile as sf
+
+from .config import TTSConfig
+
+BENCH_TEXTS = [
+    "こんにちは。",
+    "本日の会議は午後三時から、第二会議室で行います。資料は事前に共有フォルダへ置いておきます。",
+    (
+        "まもなく一番線に、東京行きの電車が参ります。危ないですから、黄色い線の内側までお下がりください。"
+        "この電車は各駅に停まります。お乗り換えのお客様は、次の駅でお降りください。"
+    ),
+]
+BENCH_SCHEMA = 1
+
+
+def peak_rss() -> int:
+    """Peak resident memory of this process, in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def token_rate(model_name: str) -> float:
+    """Codec tokens per second of audio, from the ``12Hz`` in the model name."""
+    match = re.search(r"(\d+(?:\.\d+)?)Hz", model_name)
+    return float(match.group(1)) if match else 12.0
+
+
+@dataclass
+class StageResult:
+    """Timings of one stage over all rounds."""
+
+    name: str
+    times: list[float] = field(default_factory=list)  # Seconds per round
+    audio_seconds: float = 0.0  # Audio consumed or produced per round
+    tokens: float = 0.0  # Codec tokens generated per round
+    peak_rss: int = 0  # Process peak after the stage, in bytes
+    skipped: Optional[str] = None  # Why the stage did not run
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times) if self.times else 0.0
+
+    @property
+    def rtf(self) -> Optional[float]:
+        """Real-time factor: median time / audio seconds."""
+        return self.median / self.audio_seconds if self.audio_seconds and self.times else None
+
+    @property
+    def tokens_per_second(self) -> Optional[float]:
+        return self.tokens / self.median if self.tokens and self.median else None
+
+    def to_dict(self) -> dict:
+        times = self.times
+        return {
+            "times": times,
+            "rounds": len(times),
+            "min": min(times) if times else None,
+            "max": max(times) if times else None,
+            "mean": statistics.fmean(times) if times else None,
+            "median": self.median if times else None,
+            "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+            "audio_seconds": self.audio_seconds,
+            "rtf": self.rtf,
+            "tokens_per_second": self.tokens_per_second,
+            "peak_rss": self.peak_rss,
+            "skipped": self.skipped,
+        }
+
+
+@dataclass
+class BenchReport:
+    """Result of a benchmark run."""
+
+    model: str
+    device: str
+    precision: Optional[str]
+    rounds: int
+    references: list[str]
+    stages: dict[str, StageResult] = field(default_factory=dict)
+    started: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat(timespec="seconds"))
+
+    @property
+    def time_to_first_audio(self) -> Optional[float]:
+        stage = self.stages.get("first audio")
+        return stage.median if stage and stage.times else None
+
+    def to_dict(self) -> dict:
+        return {
+            "schema": BENCH_SCHEMA,
+            "started": self.started,
+            "model": self.model,
+            "device": self.device,
+            "precision": self.precision,
+            "rounds": self.rounds,
+            "references": self.references,
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "machine": platform.machine(),
+                "processor": platform.processor(),
+            },
+            "time_to_first_audio": self.time_to_first_audio,
+            "peak_rss": max((s.peak_rss for s in self.stages.values()), default=0),
+            "stages": {name: stage.to_dict() for name, stage in self.stages.items()},
+        }
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def compare_reports(baseline: dict, current: dict) -> list[tuple[str, Optional[float], Optional[float], Optional[float]]]:
+    """Median time per stage in two report dicts.
+
+    Returns:
+        ``(stage, baseline median, current median, relative change)`` rows;
+        a negative change means the current run is faster
+    """
+    rows = []
+    names = list(dict.fromkeys([*baseline.get("stages", {}), *current.get("stages", {})]))
+    for name in names:
+        old = baseline.get("stages", {}).get(name, {}).get("median")
+        new = current.get("stages", {}).get(name, {}).get("median")
+        change = (new - old) / old if old and new is not None else None
+        rows.append((name, old, new, change))
+    return rows
+
+
+def _measure(stage: StageResult, fn: Callable[[], None], rounds: int, warmup: int = 1) -> None:
+    for _ in range(warmup):
+        fn()
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        stage.times.append(time.perf_counter() - start)
+    stage.peak_rss = peak_rss()
+
+
+def run_bench(
+    references: list[Path],
+    config: Optional[TTSConfig] = None,
+    texts: Optional[list[str]] = None,
+    rounds: int = 3,
+    language: Optional[str] = "ja",
+    on_stage: Optional[Callable[[str], None]] = None,
+) -> BenchReport:
+    """Run every stage of the pipeline over the references.
+
+    Args:
+        references: Reference voices; every round processes all of them
+        config: TTS configuration (model ``stub`` runs without weights)
+        texts: Texts synthesized per reference (default: ``BENCH_TEXTS``)
+        rounds: Timed rounds per stage, after one warm-up round
+        language: Vosk language for the transcription stage (None skips it)
+        on_stage: Called with each stage name before it runs
+
+    Returns:
+        The report
+    """
+    from .audio.loader import default_audio_cache, load_audio
+    from .audio.resample import resample
+    from .tts.qwen_tts import QwenTTS
+
+    texts = texts or BENCH_TEXTS
+    references = [Path(r) for r in references]
+    # Cold caches every round, and a fixed seed so runs are comparable
+    config = replace(config or TTSConfig(), prompt_cache_dir=None, output_cache_dir=None)
+    if config.seed is None:
+        config.seed = 0
+    tts = QwenTTS(config=config)
+
+    report = BenchReport(config.model_name, tts.device, None, rounds, [str(r) for r in references])
+
+    def stage(name: str) -> StageResult:
+        if on_stage:
+            on_stage(name)
+        report.stages[name] = StageResult(name)
+        return report.stages[name]
+
+    result = stage("model load")
+    start = time.perf_counter()
+    tts.load_model()
+    result.times.append(time.perf_counter() - start)
+    result.peak_rss = peak_rss()
+    report.precision = tts.precision
+
+    reference_seconds = sum(sf.info(r).duration for r in references)
+
+    def load_references():
+        default_audio_cache.clear()
+        for reference in references:
+            load_audio(reference)
+
+    result = stage("reference load")
+    result.audio_seconds = reference_seconds
+    _measure(result, load_references, rounds)
+
+    def build_prompts():
+        tts.prompt_cache.clear()
+        for reference in references:
+            tts.get_voice_prompt(reference)
+
+    result = stage("prompt build")
+    result.audio_seconds = reference_seconds
+    _measure(result, build_prompts, rounds)
+
+    generated = []
+
+    def generate():
+        generated.clear()
+        for reference in references:
+            generated.extend(tts.synthesize(texts, reference, sample_rate=24000))
+
+    result = stage("generation")
+    _measure(result, generate, rounds)
+    result.audio_seconds = sum(len(audio) for audio in generated) / 24000
+    result.tokens = result.audio_seconds * token_rate(config.model_name)
+
+    def first_audio():
+        chunks = tts.stream(texts[-1], references[0], sample_rate=24000)
+        next(chunks)
+        chunks.close()
+
+    result = stage("first audio")
+    _measure(result, first_audio, rounds)
+
+    def resample_outputs():
+        for audio in generated:
+            resample(audio, 24000, 16000)
+            resample(audio, 24000, 44100)
+
+    result = stage("resample")
+    result.audio_seconds = sum(len(audio) for audio in generated) / 24000
+    _measure(result, resample_outputs, rounds)
+
+    with tempfile.TemporaryDirectory(prefix="voice-clone-bench-") as tmp:
+
+        def write_outputs():
+            for i, audio in enumerate(generated):
+                sf.write(Path(tmp) / f"{i:03d}.wav", audio, 24000)
+
+        result = stage("write")
+        result.audio_seconds = sum(len(audio) for audio in generated) / 24000
+        _measure(result, write_outputs, rounds)
+
+    result = stage("transcription")
+    stt = None
+    if not language:
+        result.skipped = "disabled"
+    else:
+        try:
+            import vosk  # noqa: F401
+
+            from .stt import VoskSTT
+
+            stt = VoskSTT(language=language)
+            if not stt.is_available:
+                result.skipped = f"Vosk model for '{language}' not installed"
+                stt = None
+        except ImportError:
+            result.skipped = "vosk not installed"
+
+    if stt is not None:
+
+        def transcribe():
+            for reference in references:
+                stt.transcribe(reference)
+
+        result.audio_seconds = reference_seconds
+        # The warm-up round includes loading the Vosk model
+        _measure(result, transcribe, rounds)
+
+    return report
@@ -1,15 +1,29 @@
 """CLI commands for voice-clone."""
 
+import contextlib
+import sys
 from pathlib import Path
 from typing import Optional
 
 import click
-from rich.console import Console
-from rich.table import Table
 
 from .config import AudioConfig, TTSConfig, get_default_config
 
-console = Console()
+
+class _LazyConsole:
+    """Rich console created on first use, so ``--help`` never imports rich."""
+
+    _console = None
+
+    def __getattr__(self, name: str):
+        if _LazyConsole._console is None:
+            from rich.console import Console
+
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
+
+
+console = _LazyConsole()
 
 
 @click.group()
@@ -19,10 +33,35 @@ def main():
     pass
 
 
+def _instrument(metrics_path: Optional[str], profile_path: Optional[str]) -> None:
+    """Record stage metrics and/or a profile until the current command finishes."""
+    ctx = click.get_current_context()
+    if metrics_path:
+        from .metrics import metrics
+
+        def report():
+            metrics.disable()
+            if metrics.stages or metrics.counters:
+                console.print("[blue]Stages:[/blue]")
+                console.print(metrics.summary(), markup=False, highlight=False)
+            console.print(f"[green]Metrics:[/green] {metrics_path}")
+
+        metrics.enable(Path(metrics_path))
+        ctx.call_on_close(report)
+    if profile_path:
+        from .metrics import profile_run
+
+        # Registered first so it runs after the profile is written
+        ctx.call_on_close(lambda: console.print(f"[green]Profile:[/green] {profile_path}"))
+        ctx.with_resource(profile_run(Path(profile_path)))
+
+
 @main.command()
 @click.option("-o", "--output", required=True, type=click.Path(), help="Output file path")
 @click.option("-d", "--duration", type=float, default=None, help="Recording duration in seconds")
 @click.option("--interactive", is_flag=True, help="Interactive mode (Enter to start/stop)")
+@click.option("--append", is_flag=True, help="Interactive mode: append to an existing output file")
+@click.option("--trim", is_flag=True, help="Drop leading/trailing silence (live in interactive mode)")
 @click.option("--device", type=int, default=None, help="Audio device index")
 @click.option("--list-devices", is_flag=True, help="List available audio devices")
 @click.option("--sample-rate", type=int, default=24000, help="Sample rate (default: 24000)")
@@ -33,6 +72,8 @@ def record(
     device: Optional[int],
     list_devices: bool,
     sample_rate: int,
+    append: bool,
+    trim: bool,
 ):
     """Record audio for voice cloning.
 
@@ -61,9 +102,9 @@ def record(
 
     try:
         if interactive:
-            recorder.record_interactive(output_path)
+            recorder.record_interactive(output_path, append=append, trim=trim)
         else:
-            recorder.record_fixed(duration, output_path)
+            recorder.record_fixed(duration, output_path, trim=trim)
 
         console.print(f"[green]Saved:[/green] {output_path}")
 
@@ -72,26 +113,186 @@ def record(
         raise SystemExit(1)
 
 
+@main.command()
+@click.option("-t", "--text", required=True, help="Text to synthesize in the recorded voice")
+@click.option("-o", "--output", required=True, type=click.Path(), help="Output file path")
+@click.option("--reference-output", default="samples/live_reference.wav", type=click.Path(), help="Where to save the recorded reference")
+@click.option("-l", "--language", default="ja", type=click.Choice(["ja", "en", "zh"]), help="Language of the recording (default: ja)")
+@click.option("--input-device", type=int, default=None, help="Audio input device index")
+@click.option("--device", type=click.Choice(["auto", "cpu", "cuda"]), default="auto", help="Compute device")
+@click.option("--model", default="Qwen/Qwen3-TTS-12Hz-0.6B-Base", help="Model name")
+@click.option("--precision", type=click.Choice(["auto", "fp32", "bf16", "int8"]), default="auto", help="Model precision (auto: bf16 on CUDA, fp32 on CPU; int8: CPU only)")
+@click.option("--sample-rate", type=int, default=24000, help="Output sample rate")
+@click.option("--temperature", type=float, default=1.0, help="Sampling temperature")
+@click.option("--no-trim", is_flag=True, help="Keep leading/trailing silence in the reference")
+def live(
+    text: str,
+    output: str,
+    reference_output: str,
+    language: str,
+    input_device: Optional[int],
+    device: str,
+    model: str,
+    precision: str,
+    sample_rate: int,
+    temperature: float,
+    no_trim: bool,
+):
+    """Record a voice and clone it in one step.
+
+    The reference is transcribed while you speak and the TTS model loads in
+    the background, so synthesis starts as soon as you press Enter.
+
+    Examples:
+
+        voice-clone live -t "こんにちは" -o outputs/live.wav
+    """
+    from .live import run_live
+
+    try:
+        timings = run_live(
+            text,
+            Path(output),
+            Path(reference_output),
+            tts_config=TTSConfig(model_name=model, device=device, precision=precision),
+            language=language,
+            device=input_device,
+            sample_rate=sample_rate,
+            temperature=temperature,
+            trim=not no_trim,
+        )
+        console.print(f"[green]Generated:[/green] {output}")
+        console.print("[blue]Latency by stage:[/blue]")
+        console.print(str(timings), markup=False, highlight=False)
+
+    except Exception as e:
+        console.print(f"[red]Live pipeline failed:[/red] {e}")
+        raise SystemExit(1)
+
+
+@main.command()
+@click.option("-i", "--input", "input_file", required=True, type=click.Path(exists=True), help="Recorded audio file")
+@click.option("-o", "--output", default=None, type=click.Path(), help="Output file (default: <input>_trimmed.wav)")
+@click.option("--split", "split_dir", default=None, type=click.Path(), help="Write utterance clips to this directory instead")
+@click.option("--best", is_flag=True, help="Keep only the cleanest reference window (by SNR)")
+@click.option("--min-seconds", type=float, default=3.0, help="Shortest reference window for --best (default: 3)")
+@click.option("--max-seconds", type=float, default=10.0, help="Longest window for --best / clip for --split (default: 10)")
+def trim(
+    input_file: str,
+    output: Optional[str],
+    split_dir: Optional[str],
+    best: bool,
+    min_seconds: float,
+    max_seconds: float,
+):
+    """Trim silence from a recording, split it or pick the best reference window.
+
+    Examples:
+
+        voice-clone trim -i samples/take.wav -o samples/speaker.wav
+
+        voice-clone trim -i samples/take.wav --best -o samples/speaker.wav
+
+        voice-clone trim -i samples/long_take.wav --split samples/clips
+    """
+    import soundfile as sf
+
+    from .audio.vad import VAD
+
+    input_path = Path(input_file)
+    try:
+        audio, sample_rate = sf.read(input_path, dtype="float32", always_2d=True)
+        vad = VAD(sample_rate)
+        mono = audio.mean(axis=1)
+        total = len(audio) / sample_rate
+
+        if split_dir:
+            split_path = Path(split_dir)
+            split_path.mkdir(parents=True, exist_ok=True)
+            clips = vad.clip_ranges(mono, max_seconds)
+            for n, (start, end) in enumerate(clips):
+                sf.write(split_path / f"{input_path.stem}_{n:03d}.wav", audio[start:end], sample_rate)
+            console.print(f"[green]Wrote {len(clips)} clips[/green] to {split_path}")
+            return
+
+        if best:
+            window = vad.best_window(mono, min_seconds, max_seconds)
+            if window is None:
+                console.print(f"[yellow]No {min_seconds:g}-{max_seconds:g}s speech window found; trimming instead[/yellow]")
+        else:
+            window = None
+        if window is None:
+            segments = vad.segments(mono)
+            window = (segments[0][0], segments[-1][1]) if segments else (0, len(audio))
+
+        output_path = Path(output) if output else input_path.with_name(f"{input_path.stem}_trimmed.wav")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        sf.write(output_path, audio[window[0] : window[1]], sample_rate)
+        kept = (window[1] - window[0]) / sample_rate
+        console.print(
+            f"[green]Saved:[/green] {output_path} "
+            f"({kept:.2f}s of {total:.2f}s, from {window[0] / sample_rate:.2f}s)"
+        )
+
+    except Exception as e:
+        console.print(f"[red]Trim failed:[/red] {e}")
+        raise SystemExit(1)
+
+
 @main.command()
 @click.option("-r", "--reference", required=True, type=click.Path(exists=True), help="Reference audio file")
 @click.option("-t", "--text", required=True, help="Text to synthesize")
-@click.option("-o", "--output", required=True, type=click.Path(), help="Output file path")
+@click.option("-o", "--output", default=None, type=click.Path(), help="Output file path ('-' for raw PCM16 on stdout with --stream)")
 @click.option("--ref-text", default=None, help="Text spoken in reference audio (improves accuracy)")
 @click.option("--auto-transcribe", is_flag=True, help="Auto-transcribe reference audio using Vosk")
 @click.option("--device", type=click.Choice(["auto", "cpu", "cuda"]), default="auto", help="Compute device")
 @click.option("--model", default="Qwen/Qwen3-TTS-12Hz-0.6B-Base", help="Model name")
+@click.option("--precision", type=click.Choice(["auto", "fp32", "bf16", "int8"]), default="auto", help="Model precision (auto: bf16 on CUDA, fp32 on CPU; int8: CPU only)")
 @click.option("--sample-rate", type=int, default=24000, help="Output sample rate")
 @click.option("--temperature", type=float, default=1.0, help="Sampling temperature (1.2-1.5: high tension, 0.7-0.9: calm)")
+@click.option(
+    "--cache-prompt",
+    is_flag=True,
+    help="Persist the voice prompt (and decoded reference audio) under ~/.voice-clone for reuse",
+)
+@click.option("--cache-output", is_flag=True, help="Reuse identical earlier outputs from ~/.voice-clone/outputs instead of regenerating")
+@click.option("--seed", type=int, default=None, help="Random seed for reproducible sampling")
+@click.option("--warm-start", is_flag=True, help="Load the model from its local snapshot recorded in ~/.voice-clone/snapshots.json (no Hub lookups)")
+@click.option("--shared-weights", is_flag=True, help="CPU: memory-map the weights from ~/.voice-clone/weights so worker processes share one copy")
+@click.option("--stream", is_flag=True, help="Write audio sentence by sentence as it is generated")
+@click.option("--play", is_flag=True, help="Play audio through the default output device while generating (implies --stream)")
+@click.option("--output-device", type=int, default=None, help="Audio output device index for --play (see 'voice-clone devices --audio')")
+@click.option("--max-chars-per-segment", type=int, default=120, help="Split long text into segments of at most N characters (0: no split)")
+@click.option("--server", default=None, help="Synthesis server URL (default: $VOICE_CLONE_SERVER or http://127.0.0.1:8765)")
+@click.option("--no-server", is_flag=True, help="Always run locally, even if a server is running")
+@click.option("--workers", type=int, default=1, help="CPU worker processes for long text (0: auto from cores and RAM)")
+@click.option("--metrics", "metrics_path", default=None, type=click.Path(), help="Append per-stage timings and memory as JSON lines to this file")
+@click.option("--profile", "profile_path", default=None, type=click.Path(), help="Profile this run (.json: torch profiler trace, otherwise cProfile stats)")
 def generate(
     reference: str,
     text: str,
-    output: str,
+    output: Optional[str],
     ref_text: Optional[str],
     auto_transcribe: bool,
     device: str,
     model: str,
+    precision: str,
     sample_rate: int,
     temperature: float,
+    cache_prompt: bool,
+    cache_output: bool,
+    seed: Optional[int],
+    warm_start: bool,
+    shared_weights: bool,
+    stream: bool,
+    play: bool,
+    output_device: Optional[int],
+    max_chars_per_segment: int,
+    server: Optional[str],
+    no_server: bool,
+    workers: int,
+    metrics_path: Optional[str],
+    profile_path: Optional[str],
 ):
     """Generate speech using voice cloning.
 
@@ -106,23 +307,85 @@ def generate(
         voice-clone generate -r samples/speaker.wav --ref-text "Reference speech" -t "New text" -o outputs/out.wav
 
         voice-clone generate -r samples/speaker.wav --auto-transcribe -t "New text" -o outputs/out.wav
+
+        voice-clone generate -r samples/speaker.wav -t "Again" -o outputs/again.wav --cache-prompt
+
+        voice-clone generate -r samples/speaker.wav -t "Announcement" -o outputs/announce.wav --cache-output --seed 0
+
+        voice-clone generate -r samples/speaker.wav -t "Long text..." -o outputs/long.wav --stream
+
+        voice-clone generate -r samples/speaker.wav -t "Long text..." --play
+
+        voice-clone generate -r samples/speaker.wav -t "Long text..." -o - --stream | aplay -f S16_LE -r 24000 -c 1
+
+        voice-clone generate -r samples/speaker.wav -t "Fast" -o outputs/fast.wav --server unix:///tmp/voice-clone.sock
+
+        voice-clone generate -r samples/speaker.wav -t "$(cat script.txt)" -o outputs/script.wav --device cpu --workers 0
+
+        voice-clone generate -r samples/speaker.wav -t "Test" -o outputs/test.wav --metrics outputs/metrics.jsonl --profile outputs/generate.prof
     """
-    from .tts.qwen_tts import QwenTTS
+    if output is None and not play:
+        console.print("[red]Error:[/red] Specify --output or --play")
+        raise SystemExit(1)
+    if output == "-" and not (stream or play):
+        console.print("[red]Error:[/red] --output - requires --stream")
+        raise SystemExit(1)
+
+    pcm_out = None
+    if output == "-":
+        # Keep stdout clean for PCM; route all messages to stderr
+        pcm_out = sys.stdout.buffer
+        click.get_current_context().with_resource(contextlib.redirect_stdout(sys.stderr))
+    _instrument(metrics_path, profile_path)
 
-    config = TTSConfig(model_name=model, device=device)
+    from .tts.output_cache import DEFAULT_OUTPUT_CACHE_DIR
+    from .tts.prompt_cache import DEFAULT_PROMPT_CACHE_DIR
+    from .tts.qwen_tts import QwenTTS
+    from .tts.shared_weights import DEFAULT_SHARED_WEIGHTS_DIR
+    from .tts.warm_start import DEFAULT_SNAPSHOT_INDEX
+
+    config = TTSConfig(
+        model_name=model,
+        device=device,
+        precision=precision,
+        prompt_cache_dir=DEFAULT_PROMPT_CACHE_DIR if cache_prompt else None,
+        max_chars_per_segment=max_chars_per_segment,
+        output_cache_dir=DEFAULT_OUTPUT_CACHE_DIR if cache_output else None,
+        seed=seed,
+        warm_start_index=DEFAULT_SNAPSHOT_INDEX if warm_start else None,
+        shared_weights_dir=DEFAULT_SHARED_WEIGHTS_DIR if shared_weights else None,
+    )
     tts = QwenTTS(config=config)
+    if cache_prompt:
+        from .audio.loader import enable_disk_cache
+
+        enable_disk_cache()
 
     reference_path = Path(reference)
-    output_path = Path(output)
+    output_path = Path(output) if output and output != "-" else None
+
+    # Forward to a resident server with the same model if one is running
+    server_client = None
+    # The server does not take a seed, and profiles/metrics are of this process, so those runs stay local
+    if not (no_server or stream or play or workers != 1 or seed is not None or metrics_path or profile_path):
+        from .client import find_server
+
+        server_client = find_server(server, model=model, precision=precision)
+        if server_client:
+            console.print(f"[blue]Server:[/blue] {server_client.url}")
 
     # Auto-transcribe reference audio if requested
     if auto_transcribe and not ref_text:
-        from .stt import VoskSTT
-
         console.print("[blue]Auto-transcribing reference audio...[/blue]")
         with console.status("[bold green]Transcribing..."):
-            stt = VoskSTT(language="ja")
-            ref_text = stt.transcribe(reference_path)
+            if server_client:
+                ref_text = server_client.transcribe(reference_path, language="ja")
+            else:
+                from .stt import TranscriptCache, VoskSTT
+
+                # Known references are answered from the transcript cache without loading Vosk
+                stt = VoskSTT(language="ja", cache=TranscriptCache())
+                ref_text = stt.transcribe(reference_path)
 
         if ref_text:
             console.print(f"[green]Transcribed:[/green] {ref_text}")
@@ -138,27 +401,354 @@ def generate(
         if temperature != 1.0:
             console.print(f"[blue]Temperature:[/blue] {temperature}")
 
-        with console.status("[bold green]Generating speech..."):
-            tts.generate(
-                text=text,
-                reference_audio=reference_path,
-                output_path=output_path,
-                sample_rate=sample_rate,
-                ref_text=ref_text,
-                temperature=temperature,
+        if stream or play:
+            _generate_stream(
+                tts, text, reference_path, output_path, pcm_out, play, sample_rate, ref_text, temperature, output_device
             )
-
-        console.print(f"[green]Generated:[/green] {output_path}")
+        elif workers != 1 or (server_client and tts.output_cache is not None):
+            # Cache hits are answered locally; misses go to the worker pool or the server and are kept
+            key = None
+            cached = False
+            if tts.output_cache is not None:
+                key = tts.output_key(text, reference_path, sample_rate, ref_text, temperature, max_chars_per_segment)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                cached = tts.output_cache.fetch(key, output_path)
+
+            if cached:
+                console.print(f"[green]Cached:[/green] {output_path}")
+            else:
+                if workers != 1:
+                    from .tts.pool import TTSWorkerPool
+
+                    with TTSWorkerPool(config, workers or None) as pool:
+                        pool.generate(
+                            text, reference_path, output_path, sample_rate, ref_text, temperature, max_chars_per_segment
+                        )
+                else:
+                    with console.status("[bold green]Generating speech..."):
+                        server_client.generate(
+                            text=text,
+                            reference_audio=reference_path,
+                            output_path=output_path,
+                            sample_rate=sample_rate,
+                            ref_text=ref_text,
+                            temperature=temperature,
+                            max_chars_per_segment=max_chars_per_segment,
+                        )
+                if key is not None:
+                    tts.output_cache.store(key, output_path)
+                console.print(f"[green]Generated:[/green] {output_path}")
+        else:
+            with console.status("[bold green]Generating speech..."):
+                (server_client or tts).generate(
+                    text=text,
+                    reference_audio=reference_path,
+                    output_path=output_path,
+                    sample_rate=sample_rate,
+                    ref_text=ref_text,
+                    temperature=temperature,
+                    max_chars_per_segment=max_chars_per_segment,
+                )
+
+            console.print(f"[green]Generated:[/green] {output_path}")
+        if cache_prompt and not server_client:
+            console.print(f"[blue]Prompt cache:[/blue] {tts.prompt_cache.stats}")
+        if tts.output_cache is not None:
+            cache = tts.output_cache
+            console.print(f"[blue]Output cache:[/blue] {cache.hits} hits, {cache.misses} misses")
 
     except Exception as e:
         console.print(f"[red]Generation failed:[/red] {e}")
         raise SystemExit(1)
 
 
+def _generate_stream(
+    tts,
+    text: str,
+    reference_path: Path,
+    output_path: Optional[Path],
+    pcm_out,
+    play: bool,
+    sample_rate: int,
+    ref_text: Optional[str],
+    temperature: float,
+    output_device: Optional[int] = None,
+):
+    """Stream generated audio to a file, a raw PCM pipe and/or the output device."""
+    import time
+
+    import numpy as np
+    import soundfile as sf
+
+    with contextlib.ExitStack() as stack:
+        wav_out = None
+        player = None
+
+        if output_path is not None:
+            from .tts.output_cache import detach
+
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            detach(output_path)
+            wav_out = stack.enter_context(
+                sf.SoundFile(output_path, "w", samplerate=sample_rate, channels=1, subtype="PCM_16")
+            )
+
+        if play:
+            from .audio.player import Player
+
+            player = stack.enter_context(Player(sample_rate, device=output_device))
+
+        load_start = time.perf_counter()
+        tts.load_model()
+        console.print(f"[blue]Model load:[/blue] {time.perf_counter() - load_start:.2f}s")
+
+        start = time.perf_counter()
+        if player is not None:
+            player.start()
+        first_audio = None
+        total_samples = 0
+
+        for chunk in tts.stream(text, reference_path, sample_rate, ref_text, temperature):
+            if first_audio is None:
+                first_audio = time.perf_counter() - start
+                console.print(f"[blue]Time to first audio:[/blue] {first_audio:.2f}s")
+
+            if pcm_out is not None:
+                pcm = (np.clip(chunk, -1.0, 1.0) * 32767).astype(np.int16)
+                pcm_out.write(pcm.tobytes())
+                pcm_out.flush()
+            if wav_out is not None:
+                wav_out.write(chunk)
+                wav_out.flush()
+            if player is not None:
+                player.write(chunk)
+
+            total_samples += len(chunk)
+
+        elapsed = time.perf_counter() - start
+        duration = total_samples / sample_rate
+        console.print(f"[green]Streamed:[/green] {duration:.2f}s of audio in {elapsed:.2f}s")
+        if player is not None:
+            console.print(f"[blue]Playback:[/blue] RTF {player.rtf or 0:.2f}, {player.underruns} underruns")
+        if wav_out is not None:
+            console.print(f"[green]Generated:[/green] {output_path}")
+
+
 @main.command()
-@click.option("-i", "--input", "input_file", required=True, type=click.Path(exists=True), help="Audio file to transcribe")
+@click.option("-m", "--manifest", required=True, type=click.Path(exists=True), help="CSV or JSONL manifest (id, text, reference, ref_text, temperature, output)")
+@click.option("-o", "--output-dir", default="outputs/batch", type=click.Path(), help="Directory for rows without an output column")
+@click.option("--results", default=None, type=click.Path(), help="Results JSONL (default: <output-dir>/results.jsonl)")
+@click.option("-r", "--reference", default=None, type=click.Path(exists=True), help="Reference for rows without one")
+@click.option("--ref-text", default=None, help="Reference text for rows without one")
+@click.option("--device", type=click.Choice(["auto", "cpu", "cuda"]), default="auto", help="Compute device")
+@click.option("--model", default="Qwen/Qwen3-TTS-12Hz-0.6B-Base", help="Model name")
+@click.option("--precision", type=click.Choice(["auto", "fp32", "bf16", "int8"]), default="auto", help="Model precision (auto: bf16 on CUDA, fp32 on CPU; int8: CPU only)")
+@click.option("--sample-rate", type=int, default=24000, help="Output sample rate")
+@click.option("--temperature", type=float, default=1.0, help="Temperature for rows without one")
+@click.option("--workers", type=int, default=1, help="CPU worker processes (0: auto from cores and RAM)")
+@click.option("--chunk-size", type=int, default=256, help="Manifest rows held in memory at a time")
+@click.option("--cache-prompt", is_flag=True, help="Persist voice prompts under ~/.voice-clone/prompts")
+@click.option("--warm-start", is_flag=True, help="Load the model from its local snapshot recorded in ~/.voice-clone/snapshots.json (no Hub lookups)")
+@click.option("--shared-weights", is_flag=True, help="CPU: memory-map the weights from ~/.voice-clone/weights so worker processes share one copy")
+def batch(
+    manifest: str,
+    output_dir: str,
+    results: Optional[str],
+    reference: Optional[str],
+    ref_text: Optional[str],
+    device: str,
+    model: str,
+    precision: str,
+    sample_rate: int,
+    temperature: float,
+    workers: int,
+    chunk_size: int,
+    cache_prompt: bool,
+    warm_start: bool,
+    shared_weights: bool,
+):
+    """Generate speech for every row of a manifest.
+
+    Rows whose output already exists and is valid audio are skipped, so an
+    interrupted run can be resumed by running the same command again.
+
+    Examples:
+
+        voice-clone batch -m lines.csv -o outputs/lines
+
+        voice-clone batch -m lines.jsonl -r samples/speaker.wav --device cpu --workers 0
+    """
+    from .manifest import read_manifest, run_manifest
+    from .tts.prompt_cache import DEFAULT_PROMPT_CACHE_DIR
+    from .tts.shared_weights import DEFAULT_SHARED_WEIGHTS_DIR
+    from .tts.warm_start import DEFAULT_SNAPSHOT_INDEX
+
+    config = TTSConfig(
+        model_name=model,
+        device=device,
+        precision=precision,
+        prompt_cache_dir=DEFAULT_PROMPT_CACHE_DIR if cache_prompt else None,
+        warm_start_index=DEFAULT_SNAPSHOT_INDEX if warm_start else None,
+        shared_weights_dir=DEFAULT_SHARED_WEIGHTS_DIR if shared_weights else None,
+    )
+    output_dir_path = Path(output_dir)
+    results_path = Path(results) if results else output_dir_path / "results.jsonl"
+
+    try:
+        console.print(f"[blue]Manifest:[/blue] {manifest}")
+        console.print(f"[blue]Results:[/blue] {results_path}")
+
+        rows = read_manifest(
+            Path(manifest),
+            output_dir_path,
+            default_reference=Path(reference) if reference else None,
+            default_ref_text=ref_text,
+            default_temperature=temperature,
+        )
+
+        with contextlib.ExitStack() as stack:
+            if workers != 1:
+                from .tts.pool import TTSWorkerPool
+
+                engine = stack.enter_context(TTSWorkerPool(config, workers or None))
+            else:
+                from .tts.qwen_tts import QwenTTS
+
+                engine = QwenTTS(config=config)
+
+            summary = run_manifest(rows, engine, results_path, sample_rate, chunk_size)
+
+        console.print(f"[green]Done:[/green] {summary}")
+        if summary.failed:
+            raise SystemExit(1)
+
+    except SystemExit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Batch failed:[/red] {e}")
+        raise SystemExit(1)
+
+
+@main.command("compare-precision")
+@click.option(
+    "-p",
+    "--precision",
+    "precisions",
+    multiple=True,
+    default=("fp32", "bf16", "int8"),
+    type=click.Choice(["fp32", "bf16", "int8"]),
+    help="Precision to compare against fp32, repeatable (default: all)",
+)
+@click.option("-r", "--reference", "references", multiple=True, type=click.Path(exists=True), help="Reference audio, repeatable (default: sample_voices/*.wav)")
+@click.option("-t", "--text", "texts", multiple=True, help="Text to synthesize, repeatable (default: built-in sentences)")
+@click.option("-o", "--output-dir", default="outputs/precision", type=click.Path(), help="Where to keep the generated audio")
+@click.option("--model", default="Qwen/Qwen3-TTS-12Hz-0.6B-Base", help="Model name")
+@click.option("--seed", type=int, default=0, help="Random seed shared by all runs")
+@click.option("-l", "--language", default="ja", type=click.Choice(["ja", "en", "zh"]), help="Vosk language for the CER check (default: ja)")
+def compare_precision(
+    precisions: tuple[str, ...],
+    references: tuple[str, ...],
+    texts: tuple[str, ...],
+    output_dir: str,
+    model: str,
+    seed: int,
+    language: str,
+):
+    """Compare CPU speed, memory and quality of model precisions against fp32.
+
+    Each precision loads the model in a fresh process and synthesizes the
+    same texts with the same seed. Quality is reported as the mel-spectrum
+    distance from the fp32 outputs and, if a Vosk model is installed, the
+    character error rate of their transcripts.
+
+    Examples:
+
+        voice-clone compare-precision
+
+        voice-clone compare-precision -p int8 -r samples/speaker.wav -t "テストです"
+    """
+    from rich.table import Table
+
+    from .config import get_project_root
+    from .tts.compare import compare_precisions
+
+    if references:
+        reference_paths = [Path(r) for r in references]
+    else:
+        reference_paths = sorted((get_project_root() / "sample_voices").glob("*.wav"))
+    if not reference_paths:
+        console.print("[red]Error:[/red] No reference audio (pass -r)")
+        raise SystemExit(1)
+
+    config = TTSConfig(model_name=model, device="cpu", seed=seed)
+
+    try:
+        results = compare_precisions(
+            reference_paths,
+            list(precisions),
+            list(texts) or None,
+            config=config,
+            output_dir=Path(output_dir),
+            language=language,
+        )
+    except Exception as e:
+        console.print(f"[red]Comparison failed:[/red] {e}")
+        raise SystemExit(1)
+
+    baseline = results[0]
+    table = Table(title=f"Precision comparison ({model}, CPU)")
+    table.add_column("Precision", style="cyan")
+    table.add_column("Load", justify="right")
+    table.add_column("RTF", justify="right")
+    table.add_column("Speedup", justify="right")
+    table.add_column("Peak RSS", justify="right")
+    table.add_column("Mel dist (dB)", justify="right")
+    table.add_column("CER", justify="right")
+    for result in results:
+        name = result.precision if result.resolved == result.precision else f"{result.precision} → {result.resolved}"
+        table.add_row(
+            name,
+            f"{result.load_seconds:.1f}s",
+            f"{result.rtf:.2f}",
+            f"{baseline.rtf / result.rtf:.2f}x" if result.rtf else "-",
+            f"{result.peak_rss / 1024**2:.0f} MB",
+            f"{result.spectral_distance:.2f}",
+            f"{result.cer:.1%}" if result.cer is not None else "-",
+        )
+    console.print(table)
+    console.print(f"[blue]Audio:[/blue] {output_dir}")
+
+
+@main.command()
+@click.option(
+    "-i",
+    "--input",
+    "input_file",
+    required=True,
+    type=click.Path(exists=True),
+    help="Audio file, or a directory / manifest (.jsonl, .csv, .txt) for bulk mode",
+)
 @click.option("-l", "--language", default="ja", type=click.Choice(["ja", "en", "zh"]), help="Language (default: ja)")
-def transcribe(input_file: str, language: str):
+@click.option("--server", default=None, help="Synthesis server URL (default: $VOICE_CLONE_SERVER or http://127.0.0.1:8765)")
+@click.option("--no-server", is_flag=True, help="Always run locally, even if a server is running")
+@click.option("--stream", is_flag=True, help="Print timestamped segments as they are recognized (bounded memory, runs locally)")
+@click.option("-o", "--output", default="outputs/transcripts.jsonl", type=click.Path(), help="Bulk mode: results JSONL (default: outputs/transcripts.jsonl)")
+@click.option("-w", "--workers", type=int, default=0, help="Bulk mode: worker processes (default: 0 = one per CPU)")
+@click.option("--cache", is_flag=True, help="Reuse and fill the transcript cache used by --auto-transcribe")
+@click.option("--metrics", "metrics_path", default=None, type=click.Path(), help="Append per-stage timings and memory as JSON lines to this file")
+@click.option("--profile", "profile_path", default=None, type=click.Path(), help="Profile this run (.json: torch profiler trace, otherwise cProfile stats)")
+def transcribe(
+    input_file: str,
+    language: str,
+    server: Optional[str],
+    no_server: bool,
+    stream: bool,
+    output: str,
+    workers: int,
+    cache: bool,
+    metrics_path: Optional[str],
+    profile_path: Optional[str],
+):
     """Transcribe audio file to text using Vosk.
 
     Examples:
@@ -166,18 +756,46 @@ def transcribe(input_file: str, language: str):
         voice-clone transcribe -i samples/speaker.wav
 
         voice-clone transcribe -i samples/english.wav -l en
-    """
-    from .stt import VoskSTT
 
+        voice-clone transcribe -i long_recording.wav --stream
+
+        voice-clone transcribe -i voices/ -o voices/transcripts.jsonl -w 8
+
+        voice-clone transcribe -i voices/ --cache  # pre-warm --auto-transcribe
+
+        voice-clone transcribe -i samples/speaker.wav --metrics outputs/metrics.jsonl --profile outputs/transcribe.prof
+    """
     input_path = Path(input_file)
+    _instrument(metrics_path, profile_path)
+
+    if input_path.is_dir() or input_path.suffix.lower() in (".jsonl", ".ndjson", ".csv", ".txt"):
+        _transcribe_bulk(input_path, language, Path(output), workers, cache)
+        return
+
+    if stream:
+        _transcribe_stream(input_path, language)
+        return
+
+    server_client = None
+    if not (no_server or metrics_path or profile_path):
+        from .client import find_server
+
+        server_client = find_server(server)
 
     try:
         console.print(f"[blue]Input:[/blue] {input_path}")
         console.print(f"[blue]Language:[/blue] {language}")
+        if server_client:
+            console.print(f"[blue]Server:[/blue] {server_client.url}")
 
         with console.status("[bold green]Transcribing..."):
-            stt = VoskSTT(language=language)
-            text = stt.transcribe(input_path)
+            if server_client:
+                text = server_client.transcribe(input_path, language=language)
+            else:
+                from .stt import TranscriptCache, VoskSTT
+
+                stt = VoskSTT(language=language, cache=TranscriptCache() if cache else None)
+                text = stt.transcribe(input_path)
 
         if text:
             console.print(f"[green]Result:[/green] {text}")
@@ -189,9 +807,281 @@ def transcribe(input_file: str, language: str):
         raise SystemExit(1)
 
 
+def _transcribe_bulk(input_path: Path, language: str, results_path: Path, workers: int, cache: bool) -> None:
+    """Transcribe a directory or manifest of files across worker processes."""
+    from .stt.bulk import iter_audio_files, transcribe_files
+    from .stt.transcript_cache import DEFAULT_TRANSCRIPT_CACHE_DIR
+
+    try:
+        console.print(f"[blue]Input:[/blue] {input_path}")
+        console.print(f"[blue]Language:[/blue] {language}")
+        console.print(f"[blue]Results:[/blue] {results_path}")
+
+        summary = transcribe_files(
+            iter_audio_files(input_path),
+            results_path,
+            language,
+            workers or None,
+            cache_dir=DEFAULT_TRANSCRIPT_CACHE_DIR if cache else None,
+        )
+
+        console.print(f"[green]Done:[/green] {summary}")
+        if summary.failed:
+            raise SystemExit(1)
+
+    except SystemExit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Transcription failed:[/red] {e}")
+        raise SystemExit(1)
+
+
+def _transcribe_stream(input_path: Path, language: str) -> None:
+    """Print final segments as they arrive, with the partial hypothesis in a status line."""
+    from .stt import VoskSTT
+
+    def stamp(seconds: float) -> str:
+        minutes, seconds = divmod(seconds, 60)
+        return f"{int(minutes):02d}:{seconds:05.2f}"
+
+    try:
+        console.print(f"[blue]Input:[/blue] {input_path}")
+        console.print(f"[blue]Language:[/blue] {language}")
+
+        stt = VoskSTT(language=language)
+        found = False
+        with console.status("[bold green]Transcribing...") as status:
+            for segment in stt.transcribe_stream(input_path):
+                if segment.final:
+                    found = True
+                    console.print(f"[cyan]{stamp(segment.start)} → {stamp(segment.end)}[/cyan] {segment.text}")
+                    status.update("[bold green]Transcribing...")
+                else:
+                    status.update(f"[bold green]{stamp(segment.end)}[/bold green] {segment.text}")
+
+        if not found:
+            console.print("[yellow]No speech detected[/yellow]")
+
+    except Exception as e:
+        console.print(f"[red]Transcription failed:[/red] {e}")
+        raise SystemExit(1)
+
+
+@main.command()
+@click.option("-r", "--reference", "references", multiple=True, type=click.Path(exists=True), help="Reference audio, repeatable (default: sample_voices/*.wav)")
+@click.option("--model", default="Qwen/Qwen3-TTS-12Hz-0.6B-Base", help="Model name ('stub' runs without the Qwen weights)")
+@click.option("--device", type=click.Choice(["auto", "cpu", "cuda"]), default="auto", help="Compute device")
+@click.option("--precision", type=click.Choice(["auto", "fp32", "bf16", "int8"]), default="auto", help="Model precision")
+@click.option("--warm-start", is_flag=True, help="Load the model from its local snapshot recorded in ~/.voice-clone/snapshots.json (no Hub lookups)")
+@click.option("--shared-weights", is_flag=True, help="CPU: memory-map the weights from ~/.voice-clone/weights so worker processes share one copy")
+@click.option("--rounds", type=int, default=3, help="Timed rounds per stage, after one warm-up round (default: 3)")
+@click.option("-l", "--language", default="ja", type=click.Choice(["ja", "en", "zh"]), help="Vosk language for the transcription stage (default: ja)")
+@click.option("--no-stt", is_flag=True, help="Skip the transcription stage")
+@click.option("--json", "json_path", default=None, type=click.Path(), help="Write the report as JSON")
+@click.option("--compare", "compare_path", default=None, type=click.Path(exists=True), help="Earlier JSON report to compare against")
+def bench(
+    references: tuple[str, ...],
+    model: str,
+    device: str,
+    precision: str,
+    warm_start: bool,
+    shared_weights: bool,
+    rounds: int,
+    language: str,
+    no_stt: bool,
+    json_path: Optional[str],
+    compare_path: Optional[str],
+):
+    """Benchmark each stage of the TTS and STT pipeline.
+
+    Stages: model load, reference load, prompt build, generation, first
+    audio, resample, write and transcription.
+
+    Examples:
+
+        voice-clone bench --model stub --json outputs/bench/stub.json
+
+        voice-clone bench --device cpu --json outputs/bench/new.json --compare outputs/bench/old.json
+    """
+    import json
+
+    from rich.table import Table
+
+    from .bench import compare_reports, run_bench
+    from .config import get_project_root
+    from .tts.shared_weights import DEFAULT_SHARED_WEIGHTS_DIR
+    from .tts.warm_start import DEFAULT_SNAPSHOT_INDEX
+
+    if references:
+        reference_paths = [Path(r) for r in references]
+    else:
+        reference_paths = sorted((get_project_root() / "sample_voices").glob("*.wav"))
+    if not reference_paths:
+        console.print("[red]Error:[/red] No reference audio (pass -r)")
+        raise SystemExit(1)
+
+    config = TTSConfig(
+        model_name=model,
+        device=device,
+        precision=precision,
+        warm_start_index=DEFAULT_SNAPSHOT_INDEX if warm_start else None,
+        shared_weights_dir=DEFAULT_SHARED_WEIGHTS_DIR if shared_weights else None,
+    )
+
+    try:
+        with console.status("[bold green]Benchmarking...") as status:
+            report = run_bench(
+                reference_paths,
+                config,
+                rounds=rounds,
+                language=None if no_stt else language,
+                on_stage=lambda name: status.update(f"[bold green]Benchmarking {name}..."),
+            )
+    except Exception as e:
+        console.print(f"[red]Benchmark failed:[/red] {e}")
+        raise SystemExit(1)
+
+    table = Table(title=f"Benchmark ({report.model}, {report.device}, {report.precision})")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Median", justify="right")
+    table.add_column("Min", justify="right")
+    table.add_column("Stddev", justify="right")
+    table.add_column("RTF", justify="right")
+    table.add_column("Tokens/s", justify="right")
+    table.add_column("Peak RSS", justify="right")
+    for name, stage in report.stages.items():
+        if stage.skipped:
+            table.add_row(name, f"[yellow]skipped: {stage.skipped}[/yellow]", "", "", "", "", "")
+            continue
+        stats = stage.to_dict()
+        table.add_row(
+            name,
+            f"{stats['median'] * 1000:.1f} ms",
+            f"{stats['min'] * 1000:.1f} ms",
+            f"{stats['stddev'] * 1000:.1f} ms",
+            f"{stage.rtf:.3f}" if stage.rtf is not None else "-",
+            f"{stage.tokens_per_second:.1f}" if stage.tokens_per_second else "-",
+            f"{stage.peak_rss / 1024**2:.0f} MB",
+        )
+    console.print(table)
+    if report.time_to_first_audio is not None:
+        console.print(f"[blue]Time to first audio:[/blue] {report.time_to_first_audio:.3f}s")
+
+    current = report.to_dict()
+    if json_path:
+        report.save(Path(json_path))
+        console.print(f"[green]Saved:[/green] {json_path}")
+
+    if compare_path:
+        baseline = json.loads(Path(compare_path).read_text(encoding="utf-8"))
+        table = Table(title=f"Compared with {compare_path}")
+        table.add_column("Stage", style="cyan")
+        table.add_column("Before", justify="right")
+        table.add_column("After", justify="right")
+        table.add_column("Change", justify="right")
+        for name, old, new, change in compare_reports(baseline, current):
+            if change is None:
+                shown = "-"
+            else:
+                color = "green" if change < 0 else "red"
+                shown = f"[{color}]{change:+.1%}[/{color}]"
+            table.add_row(
+                name,
+                f"{old * 1000:.1f} ms" if old is not None else "-",
+                f"{new * 1000:.1f} ms" if new is not None else "-",
+                shown,
+            )
+        console.print(table)
+
+
+@main.command()
+@click.option("--host", default="127.0.0.1", help="Listen address (default: 127.0.0.1)")
+@click.option("--port", type=int, default=8765, help="Listen port (default: 8765)")
+@click.option("--socket", "socket_path", default=None, type=click.Path(), help="Listen on a Unix socket instead of TCP")
+@click.option("--device", type=click.Choice(["auto", "cpu", "cuda"]), default="auto", help="Compute device")
+@click.option("--model", default="Qwen/Qwen3-TTS-12Hz-0.6B-Base", help="Model name")
+@click.option("--precision", type=click.Choice(["auto", "fp32", "bf16", "int8"]), default="auto", help="Model precision (auto: bf16 on CUDA, fp32 on CPU; int8: CPU only)")
+@click.option("--stt", "stt_languages", multiple=True, type=click.Choice(["ja", "en", "zh"]), help="Preload a Vosk model (repeatable)")
+@click.option("--cache-prompt", is_flag=True, help="Persist voice prompts under ~/.voice-clone/prompts")
+@click.option("--warm-start", is_flag=True, help="Load the model from its local snapshot recorded in ~/.voice-clone/snapshots.json (no Hub lookups)")
+@click.option("--shared-weights", is_flag=True, help="CPU: memory-map the weights from ~/.voice-clone/weights so worker processes share one copy")
+@click.option("--batch-window-ms", type=float, default=20.0, help="Time to collect concurrent requests into one batch (default: 20)")
+@click.option("--max-batch-size", type=int, default=8, help="Maximum requests per batch (default: 8)")
+@click.option("--max-queue", type=int, default=64, help="Pending requests before returning 503 (default: 64)")
+@click.option("--metrics-log", default=None, type=click.Path(), help="Also append per-stage metrics as JSON lines to this file")
+def serve(
+    host: str,
+    port: int,
+    socket_path: Optional[str],
+    device: str,
+    model: str,
+    precision: str,
+    stt_languages: tuple[str, ...],
+    cache_prompt: bool,
+    warm_start: bool,
+    shared_weights: bool,
+    batch_window_ms: float,
+    max_batch_size: int,
+    max_queue: int,
+    metrics_log: Optional[str],
+):
+    """Run a resident synthesis server that keeps models loaded.
+
+    While a server is running, `generate` and `transcribe` forward their
+    requests to it instead of loading models themselves. Concurrent generate
+    requests for the same voice are micro-batched into one forward pass.
+
+    Examples:
+
+        voice-clone serve
+
+        voice-clone serve --device cuda --stt ja
+
+        voice-clone serve --socket /tmp/voice-clone.sock
+    """
+    from .config import ServerConfig
+    from .server import serve as run_server
+    from .tts.prompt_cache import DEFAULT_PROMPT_CACHE_DIR
+    from .tts.shared_weights import DEFAULT_SHARED_WEIGHTS_DIR
+    from .tts.warm_start import DEFAULT_SNAPSHOT_INDEX
+
+    tts_config = TTSConfig(
+        model_name=model,
+        device=device,
+        precision=precision,
+        prompt_cache_dir=DEFAULT_PROMPT_CACHE_DIR if cache_prompt else None,
+        max_batch_size=max_batch_size,
+        warm_start_index=DEFAULT_SNAPSHOT_INDEX if warm_start else None,
+        shared_weights_dir=DEFAULT_SHARED_WEIGHTS_DIR if shared_weights else None,
+    )
+    server_config = ServerConfig(
+        host=host,
+        port=port,
+        socket_path=Path(socket_path) if socket_path else None,
+        batch_window_ms=batch_window_ms,
+        max_queue=max_queue,
+    )
+
+    try:
+        console.print(f"[blue]Model:[/blue] {model}")
+        run_server(tts_config, server_config, stt_languages, Path(metrics_log) if metrics_log else None)
+    except Exception as e:
+        console.print(f"[red]Server failed:[/red] {e}")
+        raise SystemExit(1)
+
+
 @main.command("download-model")
-@click.option("-l", "--language", default="ja", type=click.Choice(["ja", "en", "zh"]), help="Language (default: ja)")
-def download_model(language: str):
+@click.option(
+    "-l",
+    "--language",
+    "languages",
+    multiple=True,
+    default=("ja",),
+    type=click.Choice(["ja", "en", "zh"]),
+    help="Language, repeatable to download several models in parallel (default: ja)",
+)
+@click.option("--mirror", default=None, help="Directory or URL holding model zips (default: $VOICE_CLONE_VOSK_MIRROR)")
+def download_model(languages: tuple[str, ...], mirror: Optional[str]):
     """Download Vosk STT model.
 
     Examples:
@@ -199,13 +1089,17 @@ def download_model(language: str):
         voice-clone download-model
 
         voice-clone download-model -l en
+
+        voice-clone download-model -l ja -l en -l zh
+
+        voice-clone download-model --mirror /mnt/models/vosk
     """
-    from .stt import download_model as dl_model
+    from .stt import download_models
 
     try:
-        console.print(f"[blue]Downloading Vosk model for:[/blue] {language}")
-        model_path = dl_model(language)
-        console.print(f"[green]Model ready:[/green] {model_path}")
+        console.print(f"[blue]Downloading Vosk model for:[/blue] {', '.join(languages)}")
+        for model_path in download_models(languages, mirror=mirror).values():
+            console.print(f"[green]Model ready:[/green] {model_path}")
 
     except Exception as e:
         console.print(f"[red]Download failed:[/red] {e}")
@@ -241,6 +1135,8 @@ def devices(audio: bool, gpu: bool):
 
 def _show_audio_devices():
     """Display audio devices in a table."""
+    from rich.table import Table
+
     from .audio.devices import list_audio_devices, get_default_device
 
     devices = list_audio_devices()
@@ -280,6 +1176,8 @@ def _show_audio_devices():
 
 def _show_gpu_info():
     """Display GPU information."""
+    from rich.table import Table
+
     from .audio.devices import get_gpu_info
 
     info = get_gpu_info()
@@ -288,14 +1186,19 @@ def _show_gpu_info():
     table.add_column("Property", style="cyan")
     table.add_column("Value", style="white")
 
+    if info["torch_cuda"] is None:
+        torch_build = "torch not installed"
+    else:
+        torch_build = f"CUDA {info['torch_cuda']}" if info["torch_cuda"] else "CPU only"
+
     table.add_row("CUDA Available", "Yes" if info["cuda_available"] else "No")
+    table.add_row("Torch Build", torch_build)
     table.add_row("Device Count", str(info["device_count"]))
 
-    if info["devices"]:
-        for gpu in info["devices"]:
-            table.add_row(f"GPU {gpu['index']}", gpu["name"])
-            table.add_row(f"  Memory", f"{gpu['total_memory_gb']:.1f} GB")
-    else:
+    for gpu in info["devices"]:
+        table.add_row(f"GPU {gpu['index']}", gpu["name"])
+        table.add_row(f"  Memory", f"{gpu['total_memory_gb']:.1f} GB")
+    if not info["cuda_available"]:
         table.add_row("Note", "CPU mode will be used")
 
     console.print(table)
@@ -0,0 +1,160 @@
+"""Thin client for the resident synthesis server."""
+
+import http.client
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+from .config import ServerConfig
+
+SERVER_URL_ENV = "VOICE_CLONE_SERVER"
+
+
+class ServerError(RuntimeError):
+    """Error reported by the synthesis server."""
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class ServerClient:
+    """Client for a running ``voice-clone serve`` instance.
+
+    Paths are sent as absolute paths; the server reads and writes them
+    directly, so it must share the client's filesystem.
+    """
+
+    def __init__(self, url: str, timeout: Optional[float] = None):
+        self.url = url
+        self.timeout = timeout
+
+    def _connection(self, timeout: Optional[float]) -> http.client.HTTPConnection:
+        parsed = urlparse(self.url)
+        if parsed.scheme == "unix":
+            return _UnixHTTPConnection(parsed.path, timeout=timeout)
+        return http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=timeout)
+
+    def _request(self, method: str, path: str, body: Optional[dict] = None, timeout: Optional[float] = None) -> dict:
+        conn = self._connection(timeout if timeout is not None else self.timeout)
+        try:
+            data = json.dumps(body or {}, ensure_ascii=False).encode("utf-8") if method == "POST" else None
+            headers = {"Content-Type": "application/json"} if data is not None else {}
+            conn.request(method, path, body=data, headers=headers)
+            response = conn.getresponse()
+            result = json.loads(response.read() or b"{}")
+        finally:
+            conn.close()
+
+        if response.status != 200:
+            raise ServerError(result.get("error", f"HTTP {response.status}"))
+        return result
+
+    def health(self, timeout: Optional[float] = None) -> dict:
+        """Get server status, including the loaded model name."""
+        return self._request("GET", "/health", timeout=timeout)
+
+    def generate(
+        self,
+        text: str,
+        reference_audio: Path,
+        output_path: Path,
+        sample_rate: int = 24000,
+        ref_text: Optional[str] = None,
+        temperature: float = 1.0,
+        max_chars_per_segment: Optional[int] = None,
+    ) -> Path:
+        """Generate speech on the server (see ``QwenTTS.generate``)."""
+        result = self._request(
+            "POST",
+            "/generate",
+            {
+                "text": text,
+                "reference": str(Path(reference_audio).resolve()),
+                "output": str(Path(output_path).resolve()),
+                "sample_rate": sample_rate,
+                "ref_text": ref_text,
+                "temperature": temperature,
+                "max_chars_per_segment": max_chars_per_segment,
+            },
+        )
+        return Path(result["output"])
+
+    def generate_batch(
+        self,
+        texts: list[str],
+        reference_audio: Path,
+        output_dir: Path,
+        sample_rate: int = 24000,
+        prefix: str = "output",
+        ref_text: Optional[str] = None,
+        temperature: float = 1.0,
+    ) -> list[Path]:
+        """Generate multiple files on the server (see ``QwenTTS.generate_batch``)."""
+        result = self._request(
+            "POST",
+            "/batch",
+            {
+                "texts": texts,
+                "reference": str(Path(reference_audio).resolve()),
+                "output_dir": str(Path(output_dir).resolve()),
+                "sample_rate": sample_rate,
+                "prefix": prefix,
+                "ref_text": ref_text,
+                "temperature": temperature,
+            },
+        )
+        return [Path(p) for p in result["outputs"]]
+
+    def transcribe(self, audio_path: Path, language: str = "ja") -> str:
+        """Transcribe a file on the server (see ``VoskSTT.transcribe``)."""
+        result = self._request(
+            "POST",
+            "/transcribe",
+            {"input": str(Path(audio_path).resolve()), "language": language},
+        )
+        return result["text"]
+
+
+def default_server_url() -> str:
+    """Server URL from $VOICE_CLONE_SERVER, or the default listen address."""
+    return os.environ.get(SERVER_URL_ENV) or ServerConfig().url
+
+
+def find_server(
+    url: Optional[str] = None,
+    model: Optional[str] = None,
+    timeout: float = 0.5,
+    precision: Optional[str] = None,
+) -> Optional[ServerClient]:
+    """Return a client for a running server, or None if none is usable.
+
+    Args:
+        url: Server URL (default: ``default_server_url()``)
+        model: Only accept a server that has this TTS model loaded
+        timeout: Connection timeout for the health check in seconds
+        precision: Only accept a server running this precision ("auto" accepts any)
+    """
+    client = ServerClient(url or default_server_url())
+    try:
+        info = client.health(timeout=timeout)
+    except (OSError, ServerError, ValueError):
+        return None
+    if model is not None and info.get("model") != model:
+        return None
+    if precision not in (None, "auto") and info.get("precision") != precision:
+        return None
+    return client
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 from dataclasses import dataclass, field
+from typing import Optional
 
 
 @dataclass
@@ -13,6 +14,7 @@ class AudioConfig:
     dtype: str = "float32"
     format: str = "WAV"
     subtype: str = "PCM_16"
+    buffer_seconds: float = 2.0  # Capture ring buffer size
 
 
 @dataclass
@@ -21,7 +23,37 @@ class TTSConfig:
 
     model_name: str = "Qwen/Qwen3-TTS-12Hz-1.7B-Base"  # 高品質モデル（GPU推奨）
     device: str = "auto"  # "auto", "cpu", "cuda"
-    torch_dtype: str = "float32"  # CPU requires float32
+    precision: str = "auto"  # "auto" (bf16 on CUDA, fp32 on CPU), "fp32", "bf16", "int8" (CPU only)
+    prompt_cache_size: int = 16  # Voice prompts kept in memory (LRU)
+    prompt_cache_dir: Optional[Path] = None  # None = memory only
+    max_batch_size: int = 8  # Texts per generate_voice_clone call in generate_batch
+    max_batch_chars: int = 2000  # Padded character budget per batch (0 = unlimited)
+    max_chars_per_segment: int = 120  # Long-form split length (0 = no split)
+    crossfade_ms: float = 30.0  # Crossfade between long-form segments
+    output_cache_dir: Optional[Path] = None  # Reuse identical generated files (None = off)
+    output_cache_max_bytes: int = 1 << 30  # Output cache size before LRU eviction
+    seed: Optional[int] = None  # Reseed sampling before each model call (None = random)
+    warm_start_index: Optional[Path] = None  # Load from the recorded local snapshot (None = off)
+    shared_weights_dir: Optional[Path] = None  # Memory-map CPU weights shared across processes (None = off)
+    async_workers: int = 1  # Concurrent model calls from agenerate/asynthesize/astream
+
+
+@dataclass
+class ServerConfig:
+    """Synthesis server configuration."""
+
+    host: str = "127.0.0.1"
+    port: int = 8765
+    socket_path: Optional[Path] = None  # Listen on a Unix socket instead of TCP
+    batch_window_ms: float = 20.0  # How long to collect concurrent requests into a batch
+    max_queue: int = 64  # Pending generate requests before rejecting with 503
+
+    @property
+    def url(self) -> str:
+        """Client URL for this server."""
+        if self.socket_path:
+            return f"unix://{self.socket_path}"
+        return f"http://{self.host}:{self.port}"
 
 
 @dataclass
@@ -0,0 +1,123 @@
+"""Import-time budget for the lightweight entry points.
+
+Help, device listing, transcription and a server-forwarded ``generate``
+must not import torch, transformers or qwen_tts: those cost seconds and
+hundreds of MB before any work starts. Each entry point is run in a fresh
+interpreter, which reports the time taken and the top-level modules it
+loaded; a forbidden module or an exceeded budget fails the check.
+
+Run it with ``python -m voice_clone.import_budget`` (exit status 1 on
+failure). To find what pulled a module in, use ``python -X importtime``.
+"""
+
+import json
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Optional
+
+import click
+
+HEAVY = ("torch", "transformers", "qwen_tts")
+
+
+@dataclass
+class Target:
+    """One entry point and what it may cost."""
+
+    name: str
+    code: str  # Run in a fresh interpreter
+    forbidden: tuple[str, ...]
+    budget: float  # Seconds, excluding interpreter startup
+
+
+def _cli(*args: str) -> str:
+    return f"from voice_clone.cli import main\nmain({list(args)!r}, standalone_mode=False)"
+
+
+TARGETS = [
+    Target("voice-clone --help", _cli("--help"), HEAVY + ("rich", "sounddevice", "numpy"), 0.3),
+    Target("voice-clone generate --help", _cli("generate", "--help"), HEAVY + ("rich", "sounddevice", "numpy"), 0.3),
+    Target("voice-clone devices --gpu", _cli("devices", "--gpu"), HEAVY + ("sounddevice",), 1.0),
+    # Listing audio devices needs PortAudio, so only the import is checked
+    Target("voice-clone devices --audio", "import voice_clone.audio.devices", HEAVY + ("numpy",), 0.3),
+    Target("voice-clone transcribe", "import voice_clone.stt, voice_clone.stt.bulk", HEAVY, 1.0),
+    Target("voice-clone generate (before model load)", "import voice_clone.tts.qwen_tts", HEAVY, 1.0),
+    Target("voice_clone.client", "import voice_clone.client", HEAVY + ("numpy",), 0.3),
+]
+
+_CHILD = """
+import contextlib, io, json, sys, time
+start = time.perf_counter()
+error = None
+try:
+    with contextlib.redirect_stdout(io.StringIO()):
+        exec(compile(sys.argv[1], "<target>", "exec"), {"__name__": "__target__"})
+except SystemExit:
+    pass
+except Exception as e:
+    error = f"{type(e).__name__}: {e}"
+seconds = time.perf_counter() - start
+modules = sorted({name.partition(".")[0] for name in sys.modules})
+print(json.dumps({"seconds": seconds, "modules": modules, "error": error}))
+"""
+
+
+@dataclass
+class Result:
+    """Outcome of one target."""
+
+    target: Target
+    seconds: float
+    budget: float
+    loaded: list[str]  # Forbidden modules that were imported
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.loaded and self.seconds <= self.budget
+
+
+def measure(target: Target, scale: float = 1.0, repeat: int = 3) -> Result:
+    """Run ``target`` in fresh interpreters, keeping the fastest time."""
+    best = None
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-c", _CHILD, target.code],
+            capture_output=True,
+            text=True,
+        )
+        try:
+            report = json.loads(proc.stdout.strip().splitlines()[-1])
+        except (IndexError, ValueError):
+            return Result(target, 0.0, target.budget * scale, [], proc.stderr.strip() or "no report")
+        if best is None or report["seconds"] < best["seconds"]:
+            best = report
+    loaded = [m for m in target.forbidden if m in best["modules"]]
+    return Result(target, best["seconds"], target.budget * scale, loaded, best["error"])
+
+
+def check(scale: float = 1.0, repeat: int = 3) -> list[Result]:
+    """Measure every target."""
+    return [measure(target, scale, repeat) for target in TARGETS]
+
+
+@click.command()
+@click.option("--scale", type=float, default=1.0, help="Multiply every budget (e.g. 2 on a slow machine)")
+@click.option("--repeat", type=int, default=3, help="Runs per target; the fastest counts (default: 3)")
+def main(scale: float, repeat: int):
+    """Check that lightweight entry points stay within their import budget."""
+    failed = False
+    for result in check(scale, repeat):
+        status = "ok" if result.ok else "FAIL"
+        failed |= not result.ok
+        click.echo(f"{status:<4} {result.seconds:6.3f}s / {result.budget:.3f}s  {result.target.name}")
+        if result.loaded:
+            click.echo(f"     imports {', '.join(result.loaded)}")
+        if result.error:
+            click.echo(f"     {result.error}")
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Live record-to-clone pipeline.
+
+While the speaker is being recorded, captured frames are streamed into an
+incremental Vosk recognizer and the TTS model loads in the background, so
+synthesis can start as soon as recording stops.
+"""
+
+import queue
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+import soundfile as sf
+
+from .config import AudioConfig, TTSConfig
+
+
+@dataclass
+class LiveTimings:
+    """Per-stage timings of a live run, in seconds."""
+
+    record: float = 0.0  # Capture, until Enter
+    model_load: float = 0.0  # TTS load, overlapped with recording
+    stt_load: float = 0.0  # Vosk load, overlapped with recording
+    # Measured from the moment recording stopped
+    stages: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def end_to_end(self) -> float:
+        """Latency from the end of recording to the written output."""
+        return sum(self.stages.values())
+
+    def __str__(self) -> str:
+        lines = [
+            f"record          {self.record:7.2f}s",
+            f"tts load        {self.model_load:7.2f}s (in background)",
+            f"stt load        {self.stt_load:7.2f}s (in background)",
+        ]
+        lines += [f"{name:<15} {seconds:7.2f}s" for name, seconds in self.stages.items()]
+        lines.append(f"{'end-to-end':<15} {self.end_to_end:7.2f}s (after recording stopped)")
+        return "\n".join(lines)
+
+
+class _Background(threading.Thread):
+    """Run a function in a thread and keep its result, error and duration."""
+
+    def __init__(self, fn: Callable, name: str):
+        super().__init__(name=name, daemon=True)
+        self._fn = fn
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.seconds = 0.0
+
+    def run(self) -> None:
+        start = time.perf_counter()
+        try:
+            self.result = self._fn()
+        except BaseException as e:
+            self.error = e
+        self.seconds = time.perf_counter() - start
+
+    def wait(self):
+        self.join()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def run_live(
+    text: str,
+    output_path: Path,
+    reference_path: Path,
+    tts_config: Optional[TTSConfig] = None,
+    audio_config: Optional[AudioConfig] = None,
+    language: str = "ja",
+    device: Optional[int] = None,
+    sample_rate: int = 24000,
+    temperature: float = 1.0,
+    trim: bool = True,
+    on_partial: Optional[Callable[[str], None]] = None,
+) -> LiveTimings:
+    """Record a reference, transcribe it while recording, then clone ``text``.
+
+    Args:
+        text: Text to synthesize in the recorded voice
+        output_path: Generated audio file
+        reference_path: Where to save the recorded reference
+        tts_config: TTS configuration
+        audio_config: Recording configuration
+        language: Vosk language of the recording
+        device: Input device index
+        sample_rate: Output sample rate
+        temperature: Sampling temperature
+        trim: Drop leading/trailing silence while recording
+        on_partial: Called with the running transcript as it updates
+
+    Returns:
+        Per-stage timings
+    """
+    from .audio.recorder import Recorder
+    from .audio.vad import LiveTrimmer
+    from .stt import IncrementalTranscriber, VoskSTT
+    from .tts.qwen_tts import QwenTTS
+
+    audio_config = audio_config or AudioConfig()
+    output_path = Path(output_path)
+    reference_path = Path(reference_path)
+    reference_path.parent.mkdir(parents=True, exist_ok=True)
+    timings = LiveTimings()
+
+    # Both models load while the speaker talks
+    tts = QwenTTS(config=tts_config)
+    tts_loader = _Background(tts.load_model, "tts-load")
+    tts_loader.start()
+
+    stt = VoskSTT(language=language)
+    frames: queue.Queue = queue.Queue()
+
+    def transcribe():
+        load_start = time.perf_counter()
+        session = IncrementalTranscriber(stt, audio_config.sample_rate)
+        timings.stt_load = time.perf_counter() - load_start
+        # Frames captured during the load are queued and caught up here
+        while (block := frames.get()) is not None:
+            for segment in session.feed(block):
+                if on_partial:
+                    partial = "" if segment.final else segment.text
+                    on_partial(f"{session.text} {partial}".strip())
+        session.finish()
+        return session.text
+
+    transcriber = _Background(transcribe, "stt")
+    transcriber.start()
+
+    recorder = Recorder(config=audio_config, device=device)
+    trimmer = LiveTrimmer(audio_config.sample_rate) if trim else None
+    stop_event = threading.Event()
+
+    print("Press Enter to start recording...")
+    input()
+    print("Recording... Press Enter to stop.")
+
+    def wait_for_stop():
+        input()
+        stop_event.set()
+
+    threading.Thread(target=wait_for_stop, daemon=True).start()
+
+    record_start = time.perf_counter()
+    with sf.SoundFile(
+        reference_path,
+        mode="w",
+        samplerate=audio_config.sample_rate,
+        channels=audio_config.channels,
+        format=audio_config.format,
+        subtype=audio_config.subtype,
+    ) as f:
+        for block in recorder.stream(stop_event):
+            if trimmer:
+                block = trimmer.process(block)
+            f.write(block)
+            frames.put(block.mean(axis=1))
+        if trimmer:
+            tail = trimmer.flush()
+            f.write(tail)
+            frames.put(tail.mean(axis=1))
+    stopped = time.perf_counter()
+    timings.record = stopped - record_start
+    frames.put(None)
+    print("Recording stopped.")
+    if recorder.overruns:
+        print(f"Warning: {recorder.overruns} overruns during recording", file=sys.stderr)
+
+    try:
+        ref_text = transcriber.wait() or None
+    except Exception as e:
+        # Without a transcript the clone falls back to the x-vector-only prompt
+        print(f"Transcription failed, continuing without ref_text: {e}", file=sys.stderr)
+        ref_text = None
+    timings.stages["stt finalize"] = time.perf_counter() - stopped
+    print(f"Transcribed: {ref_text or '(nothing)'}")
+
+    mark = time.perf_counter()
+    tts_loader.wait()
+    timings.model_load = tts_loader.seconds
+    timings.stages["tts load wait"] = time.perf_counter() - mark
+
+    mark = time.perf_counter()
+    tts.get_voice_prompt(reference_path, ref_text)
+    timings.stages["voice prompt"] = time.perf_counter() - mark
+
+    mark = time.perf_counter()
+    audio = tts.synthesize([text], reference_path, sample_rate, ref_text, temperature)[0]
+    timings.stages["synthesis"] = time.perf_counter() - mark
+
+    mark = time.perf_counter()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    sf.write(output_path, audio, sample_rate)
+    timings.stages["write"] = time.perf_counter() - mark
+
+    print(f"Generated {len(audio) / sample_rate:.2f} seconds of audio to {output_path}")
+    return timings
@@ -0,0 +1,230 @@
+"""Manifest-driven bulk generation with resumability."""
+
+import csv
+import json
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+import soundfile as sf
+
+
+@dataclass
+class ManifestRow:
+    """One synthesis job from a manifest."""
+
+    id: str
+    text: str
+    reference: Path
+    output: Path
+    ref_text: Optional[str] = None
+    temperature: float = 1.0
+    error: Optional[str] = None  # Why the row cannot be synthesized, if it is invalid
+
+
+@dataclass
+class BatchSummary:
+    """Counts for a manifest run."""
+
+    ok: int = 0
+    skipped: int = 0
+    failed: int = 0
+    audio_seconds: float = 0.0
+    elapsed: float = 0.0
+
+    def __str__(self) -> str:
+        rtf = self.elapsed / self.audio_seconds if self.audio_seconds else 0.0
+        return (
+            f"{self.ok} generated, {self.skipped} skipped, {self.failed} failed; "
+            f"{self.audio_seconds:.1f}s of audio in {self.elapsed:.1f}s (RTF {rtf:.2f})"
+        )
+
+
+def _iter_records(path: Path) -> Iterator[dict]:
+    if path.suffix.lower() in (".jsonl", ".ndjson"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(path, encoding="utf-8", newline="") as f:
+            yield from csv.DictReader(f)
+
+
+def read_manifest(
+    path: Path,
+    output_dir: Path,
+    default_reference: Optional[Path] = None,
+    default_ref_text: Optional[str] = None,
+    default_temperature: float = 1.0,
+) -> Iterator[ManifestRow]:
+    """Stream rows from a CSV or JSONL manifest.
+
+    Columns: ``id``, ``text`` (required), ``reference``, ``ref_text``,
+    ``temperature`` and ``output``. Relative ``reference`` and ``output``
+    paths are resolved against the manifest's directory; a missing output
+    defaults to ``<output_dir>/<id>.wav``. An invalid row (no text, no
+    reference, a bad temperature) is yielded with ``error`` set rather than
+    ending the stream, so one bad line does not abort the run.
+
+    Args:
+        path: Manifest file (``.jsonl``/``.ndjson`` or CSV)
+        output_dir: Directory for rows without an explicit output
+        default_reference: Reference for rows without one
+        default_ref_text: ref_text for rows without one
+        default_temperature: Temperature for rows without one
+
+    Yields:
+        Manifest rows in file order
+    """
+    path = Path(path)
+    base = path.parent
+
+    for n, record in enumerate(_iter_records(path), 1):
+        row_id = str(record.get("id") or f"{n:06d}")
+        text = record.get("text") or ""
+        reference = record.get("reference") or default_reference
+        output = record.get("output")
+
+        error = None
+        temperature = record.get("temperature")
+        # CSV leaves empty cells as "": treat them like a missing key, but keep an explicit 0
+        if temperature is None or temperature == "":
+            temperature = default_temperature
+        try:
+            temperature = float(temperature)
+        except (TypeError, ValueError):
+            error = f"invalid temperature {temperature!r}"
+            temperature = default_temperature
+        if not reference:
+            error = "no reference (use --reference)"
+        if not text:
+            error = "no text"
+
+        yield ManifestRow(
+            id=row_id,
+            text=text,
+            reference=base / reference if record.get("reference") else Path(reference or ""),
+            output=base / output if output else Path(output_dir) / f"{row_id}.wav",
+            ref_text=record.get("ref_text") or default_ref_text,
+            temperature=temperature,
+            error=error,
+        )
+
+
+def is_valid_output(path: Path) -> bool:
+    """Check whether an output file exists and is a readable, non-empty audio file."""
+    try:
+        return sf.info(str(path)).frames > 0
+    except Exception:
+        return False
+
+
+def _chunks(rows: Iterator[ManifestRow], size: int) -> Iterator[list[ManifestRow]]:
+    chunk: list[ManifestRow] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_manifest(
+    rows: Iterator[ManifestRow],
+    engine,
+    results_path: Path,
+    sample_rate: int = 24000,
+    chunk_size: int = 256,
+) -> BatchSummary:
+    """Synthesize manifest rows, skipping outputs that already exist.
+
+    Rows are read ``chunk_size`` at a time, so memory stays bounded for any
+    manifest length. Within a chunk, rows sharing a reference, ref_text and
+    temperature are synthesized together, so the voice prompt is computed
+    once per speaker (and reused from the prompt cache across chunks). One
+    result line per row is appended to ``results_path`` as soon as it is
+    known, so an interrupted run can simply be restarted. Invalid rows are
+    recorded as errors without being synthesized.
+
+    Args:
+        rows: Rows from ``read_manifest``
+        engine: ``QwenTTS`` or ``TTSWorkerPool``
+        results_path: JSONL file to append per-row results to
+        sample_rate: Output sample rate
+        chunk_size: Rows held in memory at a time
+
+    Returns:
+        Summary of the run
+    """
+    summary = BatchSummary()
+    start = time.perf_counter()
+    results_path = Path(results_path)
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(results_path, "a", encoding="utf-8") as results:
+
+        def record(row: ManifestRow, status: str, **fields) -> None:
+            entry = {"id": row.id, "output": str(row.output), "status": status, **fields}
+            results.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            results.flush()
+
+        for chunk in _chunks(rows, chunk_size):
+            groups: dict[tuple, list[ManifestRow]] = {}
+            for row in chunk:
+                if row.error is not None:
+                    print(f"Invalid row {row.id}: {row.error}", file=sys.stderr)
+                    summary.failed += 1
+                    record(row, "error", error=row.error)
+                    continue
+                if is_valid_output(row.output):
+                    summary.skipped += 1
+                    record(row, "skipped")
+                    continue
+                key = (str(row.reference), row.ref_text, row.temperature)
+                groups.setdefault(key, []).append(row)
+
+            for (reference, ref_text, temperature), group in groups.items():
+                group_start = time.perf_counter()
+                try:
+                    audios = engine.synthesize(
+                        [r.text for r in group],
+                        Path(reference),
+                        sample_rate=sample_rate,
+                        ref_text=ref_text,
+                        temperature=temperature,
+                    )
+                except Exception as e:
+                    print(f"Failed {len(group)} rows for {reference}: {e}", file=sys.stderr)
+                    summary.failed += len(group)
+                    for row in group:
+                        record(row, "error", error=str(e))
+                    continue
+
+                # Synthesis runs per group, so its time is shared across rows
+                synth_seconds = (time.perf_counter() - group_start) / len(group)
+                for row, audio in zip(group, audios):
+                    write_start = time.perf_counter()
+                    row.output.parent.mkdir(parents=True, exist_ok=True)
+                    # Write to a temp name first so a crash never leaves a truncated output
+                    tmp_path = row.output.with_name(f".{row.output.name}.part")
+                    sf.write(tmp_path, audio, sample_rate, format="WAV")
+                    tmp_path.replace(row.output)
+
+                    duration = len(audio) / sample_rate
+                    summary.ok += 1
+                    summary.audio_seconds += duration
+                    record(
+                        row,
+                        "ok",
+                        duration=round(duration, 3),
+                        synth_seconds=round(synth_seconds, 3),
+                        write_seconds=round(time.perf_counter() - write_start, 3),
+                        batch_size=len(group),
+                    )
+
+    summary.elapsed = time.perf_counter() - start
+    return summary
@@ -0,0 +1,316 @@
+"""Per-stage timing, memory and counter instrumentation.
+
+Stages are wrapped in ``metrics.timer("stage")`` and events are counted
+with ``metrics.count("name")``. While the registry is disabled (the
+default), ``timer`` returns a shared no-op context and ``count`` returns
+immediately, so instrumented code pays one attribute check. When enabled,
+each stage's duration and resident memory are aggregated for export as
+Prometheus text, and every event can also be appended to a JSON-lines log.
+"""
+
+import contextlib
+import cProfile
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional, TextIO
+
+_NULL_TIMER = contextlib.nullcontext()
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss() -> int:
+    """Resident memory of this process, in bytes."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        # No procfs: fall back to the peak, which is the best available
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class MemoryUsage:
+    """Resident memory of this process, split into shared and private pages.
+
+    Shared pages (e.g. memory-mapped model weights used by several workers)
+    are counted in full by ``rss`` in every process that maps them; ``pss``
+    divides them among those processes, so summing ``pss`` over workers
+    gives their true total. ``anonymous`` is what no other process can
+    share (heap, activations, weights copied out of a file), i.e. the cost
+    of one more worker.
+    """
+
+    rss: int
+    shared: int
+    private: int
+    pss: Optional[int] = None  # None without /proc/self/smaps_rollup
+    anonymous: Optional[int] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "rss_bytes": self.rss,
+            "shared_bytes": self.shared,
+            "private_bytes": self.private,
+            "pss_bytes": self.pss,
+            "anonymous_bytes": self.anonymous,
+        }
+
+    def __str__(self) -> str:
+        text = f"RSS {self.rss / 1024**2:.0f} MB (shared {self.shared / 1024**2:.0f} MB, private {self.private / 1024**2:.0f} MB"
+        if self.pss is not None:
+            text += f", PSS {self.pss / 1024**2:.0f} MB, anonymous {self.anonymous / 1024**2:.0f} MB"
+        return text + ")"
+
+
+def memory_usage() -> MemoryUsage:
+    """Resident, shared and private memory of this process, in bytes."""
+    try:
+        fields = {}
+        with open("/proc/self/smaps_rollup", "rb") as f:
+            for line in f:
+                key, _, value = line.partition(b":")
+                parts = value.split()
+                if len(parts) == 2 and parts[1] == b"kB":
+                    fields[key.decode()] = int(parts[0]) * 1024
+        return MemoryUsage(
+            rss=fields["Rss"],
+            shared=fields["Shared_Clean"] + fields["Shared_Dirty"],
+            private=fields["Private_Clean"] + fields["Private_Dirty"],
+            pss=fields["Pss"],
+            anonymous=fields["Anonymous"],
+        )
+    except (OSError, KeyError):
+        pass
+    try:
+        # Older kernels: statm counts file-backed pages as shared
+        with open("/proc/self/statm", "rb") as f:
+            _, resident, shared = (int(v) * _PAGE_SIZE for v in f.read().split()[:3])
+        return MemoryUsage(rss=resident, shared=shared, private=resident - shared)
+    except OSError:
+        rss = current_rss()
+        return MemoryUsage(rss=rss, shared=0, private=rss)
+
+
+@dataclass
+class StageStats:
+    """Aggregated timings of one stage."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    rss: int = 0  # Resident memory after the most recent run
+    max_rss_growth: int = 0  # Largest increase in resident memory during one run
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_seconds": round(self.total, 6),
+            "mean_seconds": round(self.total / self.count, 6) if self.count else 0.0,
+            "max_seconds": round(self.max, 6),
+            "rss_bytes": self.rss,
+            "max_rss_growth_bytes": self.max_rss_growth,
+        }
+
+
+class _Timer:
+    __slots__ = ("_registry", "_name", "_start", "_rss")
+
+    def __init__(self, registry: "Metrics", name: str):
+        self._registry = registry
+        self._name = name
+
+    def __enter__(self) -> "_Timer":
+        self._rss = current_rss()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        seconds = time.perf_counter() - self._start
+        self._registry._record(self._name, seconds, self._rss, current_rss(), exc_type is not None)
+
+
+class Metrics:
+    """Registry of stage timers and counters."""
+
+    def __init__(self):
+        self.enabled = False
+        self.stages: dict[str, StageStats] = {}
+        self.counters: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._log: Optional[TextIO] = None
+
+    def enable(self, log_path: Optional[Path] = None) -> None:
+        """Start recording, appending events to ``log_path`` as JSON lines if given."""
+        with self._lock:
+            if log_path is not None and self._log is None:
+                log_path = Path(log_path)
+                log_path.parent.mkdir(parents=True, exist_ok=True)
+                self._log = open(log_path, "a", encoding="utf-8", buffering=1)
+            self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording and close the event log (aggregates are kept)."""
+        with self._lock:
+            self.enabled = False
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stages.clear()
+            self.counters.clear()
+
+    def timer(self, name: str):
+        """Context manager timing one run of stage ``name``."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def count(self, name: str, value: float = 1) -> None:
+        """Add ``value`` to counter ``name``."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+            self._write({"type": "counter", "name": name, "value": value})
+
+    def _record(self, name: str, seconds: float, rss_before: int, rss_after: int, failed: bool) -> None:
+        with self._lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats()
+            stats.count += 1
+            stats.total += seconds
+            stats.max = max(stats.max, seconds)
+            stats.rss = rss_after
+            stats.max_rss_growth = max(stats.max_rss_growth, rss_after - rss_before)
+            if failed:
+                self.counters[f"{name}_errors"] = self.counters.get(f"{name}_errors", 0) + 1
+            self._write({
+                "type": "stage",
+                "name": name,
+                "seconds": round(seconds, 6),
+                "rss_bytes": rss_after,
+                "rss_growth_bytes": rss_after - rss_before,
+                "failed": failed,
+            })
+
+    def _write(self, event: dict) -> None:
+        # Caller holds the lock
+        if self._log is not None:
+            event = {"ts": round(time.time(), 6), "pid": os.getpid(), **event}
+            self._log.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "stages": {name: stats.to_dict() for name, stats in self.stages.items()},
+                "counters": dict(self.counters),
+                "rss_bytes": current_rss(),
+                "memory": memory_usage().to_dict(),
+            }
+
+    def to_prometheus(self, prefix: str = "voice_clone") -> str:
+        """Render the registry in the Prometheus text exposition format."""
+        snapshot = self.to_dict()
+        lines = [
+            f"# HELP {prefix}_stage_seconds Time spent in each pipeline stage.",
+            f"# TYPE {prefix}_stage_seconds summary",
+        ]
+        for name, stats in snapshot["stages"].items():
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {stats["total_seconds"]}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {stats["count"]}')
+        lines += [
+            f"# HELP {prefix}_stage_seconds_max Longest run of each stage.",
+            f"# TYPE {prefix}_stage_seconds_max gauge",
+        ]
+        lines += [
+            f'{prefix}_stage_seconds_max{{stage="{name}"}} {stats["max_seconds"]}'
+            for name, stats in snapshot["stages"].items()
+        ]
+        lines += [
+            f"# HELP {prefix}_stage_rss_growth_bytes Largest resident memory increase during one run of a stage.",
+            f"# TYPE {prefix}_stage_rss_growth_bytes gauge",
+        ]
+        lines += [
+            f'{prefix}_stage_rss_growth_bytes{{stage="{name}"}} {stats["max_rss_growth_bytes"]}'
+            for name, stats in snapshot["stages"].items()
+        ]
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+        lines += [
+            f"# HELP {prefix}_resident_memory_bytes Resident memory of the process.",
+            f"# TYPE {prefix}_resident_memory_bytes gauge",
+            f"{prefix}_resident_memory_bytes {snapshot['rss_bytes']}",
+            f"# HELP {prefix}_shared_memory_bytes Resident memory shared with other processes (e.g. mapped weights).",
+            f"# TYPE {prefix}_shared_memory_bytes gauge",
+            f"{prefix}_shared_memory_bytes {snapshot['memory']['shared_bytes']}",
+            f"# HELP {prefix}_private_memory_bytes Resident memory used by this process alone.",
+            f"# TYPE {prefix}_private_memory_bytes gauge",
+            f"{prefix}_private_memory_bytes {snapshot['memory']['private_bytes']}",
+        ]
+        if snapshot["memory"]["pss_bytes"] is not None:
+            lines += [
+                f"# HELP {prefix}_proportional_memory_bytes Resident memory with shared pages divided among their users.",
+                f"# TYPE {prefix}_proportional_memory_bytes gauge",
+                f"{prefix}_proportional_memory_bytes {snapshot['memory']['pss_bytes']}",
+                f"# HELP {prefix}_anonymous_memory_bytes Resident memory not backed by a file (what one more worker costs).",
+                f"# TYPE {prefix}_anonymous_memory_bytes gauge",
+                f"{prefix}_anonymous_memory_bytes {snapshot['memory']['anonymous_bytes']}",
+            ]
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> str:
+        """Per-stage totals as aligned text lines."""
+        snapshot = self.to_dict()
+        lines = [
+            f"{name:<22} {s['count']:>5}x {s['total_seconds']:9.3f}s total {s['max_seconds']:8.3f}s max"
+            f" {s['max_rss_growth_bytes'] / 1024**2:+8.1f} MB"
+            for name, s in snapshot["stages"].items()
+        ]
+        lines += [f"{name:<22} {value:g}" for name, value in snapshot["counters"].items()]
+        return "\n".join(lines)
+
+
+# Process-wide registry used by the instrumented modules
+metrics = Metrics()
+
+
+@contextlib.contextmanager
+def profile_run(path: Path) -> Iterator[None]:
+    """Profile the enclosed code into ``path``.
+
+    A ``.json`` path records a ``torch.profiler`` trace (open it in
+    chrome://tracing or Perfetto); any other path records cProfile stats
+    (read them with ``python -m pstats`` or snakeviz).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if path.suffix == ".json":
+        import torch
+        from torch.profiler import ProfilerActivity, profile
+
+        activities = [ProfilerActivity.CPU]
+        if torch.cuda.is_available():
+            activities.append(ProfilerActivity.CUDA)
+        with profile(activities=activities, record_shapes=True, profile_memory=True) as prof:
+            yield
+        prof.export_chrome_trace(str(path))
+    else:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(str(path))
@@ -0,0 +1,248 @@
+"""Resident synthesis server for voice-clone.
+
+Keeps the Qwen3-TTS model (and optionally Vosk models) loaded and serves
+generate, batch and transcribe requests over a local HTTP or Unix-socket API.
+"""
+
+import json
+import os
+import socketserver
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+from .config import ServerConfig, TTSConfig
+from .metrics import metrics
+from .tts.output_cache import write_audio
+from .tts.scheduler import MicroBatchScheduler, QueueFullError, SchedulerStoppedError
+
+
+class RequestError(Exception):
+    """Invalid request from a client (reported as HTTP 400)."""
+
+
+class SynthesisService:
+    """Resident TTS/STT engines shared by all server requests."""
+
+    def __init__(
+        self,
+        tts_config: Optional[TTSConfig] = None,
+        stt_languages: tuple[str, ...] = (),
+        server_config: Optional[ServerConfig] = None,
+    ):
+        from .tts.qwen_tts import QwenTTS
+
+        server_config = server_config or ServerConfig()
+        self.tts = QwenTTS(config=tts_config)
+        self.scheduler = MicroBatchScheduler(
+            self.tts,
+            window_ms=server_config.batch_window_ms,
+            max_queue=server_config.max_queue,
+        )
+        self._stt: dict = {}
+        self._stt_lock = threading.Lock()
+        self._preload_stt = stt_languages
+
+    def load(self) -> None:
+        """Load the TTS model and any preloaded STT models."""
+        self.tts.load_model()
+        self.scheduler.start()
+        for language in self._preload_stt:
+            self._get_stt(language)._ensure_model()
+
+    def _get_stt(self, language: str):
+        from .stt import TranscriptCache, VoskSTT
+
+        if language not in self._stt:
+            self._stt[language] = VoskSTT(language=language, cache=TranscriptCache())
+        return self._stt[language]
+
+    def health(self, _: dict) -> dict:
+        return {
+            "status": "ok",
+            "model": self.tts.config.model_name,
+            "device": self.tts.device,
+            "precision": self.tts.precision,
+            "stt": sorted(self._stt),
+            "pid": os.getpid(),
+        }
+
+    def stats(self, _: dict) -> dict:
+        return {
+            "scheduler": self.scheduler.metrics.to_dict(),
+            "prompt_cache": vars(self.tts.prompt_cache.stats),
+            "stages": metrics.to_dict(),
+        }
+
+    def prometheus(self, _: dict) -> str:
+        lines = [metrics.to_prometheus().rstrip("\n")]
+        for name, value in self.scheduler.metrics.to_dict().items():
+            lines.append(f"# TYPE voice_clone_scheduler_{name} gauge")
+            lines.append(f"voice_clone_scheduler_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    def generate(self, req: dict) -> dict:
+        output_path = Path(_require(req, "output"))
+        sample_rate = req.get("sample_rate", 24000)
+        future = self.scheduler.submit(
+            _require(req, "text"),
+            Path(_require(req, "reference")),
+            sample_rate=sample_rate,
+            ref_text=req.get("ref_text"),
+            temperature=req.get("temperature", 1.0),
+            max_chars_per_segment=req.get("max_chars_per_segment"),
+        )
+        audio = future.result()
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        write_audio(output_path, audio, sample_rate)
+        return {"output": str(output_path), "duration": len(audio) / sample_rate}
+
+    def batch(self, req: dict) -> dict:
+        texts = _require(req, "texts")
+        output_dir = Path(_require(req, "output_dir"))
+        prefix = req.get("prefix", "output")
+        sample_rate = req.get("sample_rate", 24000)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Batch items wait for queue space rather than being rejected
+        futures = [
+            self.scheduler.submit(
+                text,
+                Path(_require(req, "reference")),
+                sample_rate=sample_rate,
+                ref_text=req.get("ref_text"),
+                temperature=req.get("temperature", 1.0),
+                block=True,
+            )
+            for text in texts
+        ]
+
+        outputs = []
+        for i, future in enumerate(futures):
+            output_path = output_dir / f"{prefix}_{i:03d}.wav"
+            audio = future.result()
+            write_audio(output_path, audio, sample_rate)
+            outputs.append(str(output_path))
+        return {"outputs": outputs}
+
+    def transcribe(self, req: dict) -> dict:
+        language = req.get("language", "ja")
+        with self._stt_lock:
+            text = self._get_stt(language).transcribe(Path(_require(req, "input")))
+        return {"text": text}
+
+
+def _require(req: dict, key: str):
+    if key not in req:
+        raise RequestError(f"Missing field: {key}")
+    return req[key]
+
+
+def _make_handler(service: SynthesisService):
+    routes = {
+        ("GET", "/health"): service.health,
+        ("GET", "/stats"): service.stats,
+        ("GET", "/metrics"): service.prometheus,
+        ("POST", "/generate"): service.generate,
+        ("POST", "/batch"): service.batch,
+        ("POST", "/transcribe"): service.transcribe,
+    }
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _dispatch(self, method: str) -> None:
+            route = routes.get((method, self.path))
+            if route is None:
+                self._reply(404, {"error": f"Not found: {method} {self.path}"})
+                return
+
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                req = json.loads(self.rfile.read(length)) if length else {}
+                self._reply(200, route(req))
+            except (RequestError, json.JSONDecodeError, FileNotFoundError) as e:
+                self._reply(400, {"error": str(e)})
+            except (QueueFullError, SchedulerStoppedError) as e:
+                self._reply(503, {"error": str(e)})
+            except Exception as e:
+                print(f"Request failed: {e}", file=sys.stderr)
+                self._reply(500, {"error": str(e)})
+
+        def _reply(self, status: int, body) -> None:
+            if isinstance(body, str):
+                # Prometheus text exposition
+                data = body.encode("utf-8")
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            else:
+                data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                content_type = "application/json"
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            self._dispatch("GET")
+
+        def do_POST(self):
+            self._dispatch("POST")
+
+        def address_string(self) -> str:
+            # Unix-socket clients have no (host, port) address
+            return self.client_address[0] if self.client_address else "unix"
+
+    return Handler
+
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(
+    tts_config: Optional[TTSConfig] = None,
+    server_config: Optional[ServerConfig] = None,
+    stt_languages: tuple[str, ...] = (),
+    metrics_log: Optional[Path] = None,
+) -> None:
+    """Load the models and serve requests until interrupted.
+
+    Stage metrics are always recorded while serving and exposed at
+    ``GET /metrics`` in the Prometheus text format.
+
+    Args:
+        tts_config: TTS model configuration
+        server_config: Listen address (TCP host/port or Unix socket path)
+        stt_languages: Vosk languages to load at startup
+        metrics_log: Also append every stage event to this JSON-lines file
+    """
+    server_config = server_config or ServerConfig()
+    metrics.enable(metrics_log)
+    service = SynthesisService(tts_config, stt_languages, server_config)
+    service.load()
+
+    handler = _make_handler(service)
+    if server_config.socket_path:
+        socket_path = Path(server_config.socket_path)
+        if socket_path.exists():
+            socket_path.unlink()
+        httpd = _ThreadingUnixHTTPServer(str(socket_path), handler)
+        print(f"Serving on unix://{socket_path}")
+    else:
+        httpd = ThreadingHTTPServer((server_config.host, server_config.port), handler)
+        print(f"Serving on http://{server_config.host}:{server_config.port}")
+
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        service.scheduler.stop()
+        metrics.disable()
+        if server_config.socket_path:
+            Path(server_config.socket_path).unlink(missing_ok=True)
@@ -1,5 +1,19 @@
 """Speech-to-Text module for voice-clone."""
 
-from .vosk_stt import VoskSTT, download_model
+from .transcript_cache import TranscriptCache
+from .vosk_stt import (
+    IncrementalTranscriber,
+    TranscriptSegment,
+    VoskSTT,
+    download_model,
+    download_models,
+)
 
-__all__ = ["VoskSTT", "download_model"]
+__all__ = [
+    "IncrementalTranscriber",
+    "TranscriptCache",
+    "TranscriptSegment",
+    "VoskSTT",
+    "download_model",
+    "download_models",
+]
@@ -0,0 +1,206 @@
+"""Parallel bulk transcription across a process pool.
+
+Vosk decoding is single-threaded, so a voice library of thousands of clips
+is transcribed fastest by running one recognizer per core. Each worker
+process loads the Vosk model once and reuses its recognizer for every file
+it is given.
+"""
+
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import soundfile as sf
+
+AUDIO_EXTENSIONS = {".wav", ".flac", ".ogg", ".mp3"}
+
+# Set in each worker process by _init_worker
+_worker_stt = None
+
+
+@dataclass
+class TranscribeSummary:
+    """Counts and throughput for a bulk transcription run."""
+
+    ok: int = 0
+    skipped: int = 0
+    failed: int = 0
+    audio_seconds: float = 0.0
+    elapsed: float = 0.0
+
+    def __str__(self) -> str:
+        speed = self.audio_seconds / self.elapsed if self.elapsed else 0.0
+        return (
+            f"{self.ok} transcribed, {self.skipped} skipped, {self.failed} failed; "
+            f"{self.audio_seconds:.1f}s of audio in {self.elapsed:.1f}s "
+            f"({speed:.1f} audio-s per wall-s)"
+        )
+
+
+def iter_audio_files(source: Path) -> Iterator[Path]:
+    """List the audio files to transcribe from a directory or manifest.
+
+    A directory is searched recursively for audio files. A manifest is a
+    ``.jsonl``/``.ndjson`` or CSV file with an ``audio`` column (relative
+    paths are resolved against the manifest's directory), or any other
+    text file with one path per line.
+    """
+    source = Path(source)
+    if source.is_dir():
+        for path in sorted(source.rglob("*")):
+            if path.suffix.lower() in AUDIO_EXTENSIONS and path.is_file():
+                yield path
+        return
+
+    base = source.parent
+    suffix = source.suffix.lower()
+    with open(source, encoding="utf-8", newline="") as f:
+        if suffix in (".jsonl", ".ndjson"):
+            entries = (json.loads(line)["audio"] for line in f if line.strip())
+        elif suffix == ".csv":
+            entries = (record["audio"] for record in csv.DictReader(f))
+        else:
+            entries = (line.strip() for line in f if line.strip())
+        for entry in entries:
+            yield base / entry
+
+
+def _completed(results_path: Path) -> set[str]:
+    """Paths already transcribed successfully in an earlier run."""
+    done: set[str] = set()
+    if not results_path.exists():
+        return done
+    with open(results_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn last line from an interrupted run
+            if entry.get("status") == "ok":
+                done.add(entry["path"])
+    return done
+
+
+def _init_worker(language: str, model_path: Optional[Path], cache_dir: Optional[Path]) -> None:
+    global _worker_stt
+
+    from .transcript_cache import TranscriptCache
+    from .vosk_stt import VoskSTT
+
+    cache = TranscriptCache(cache_dir) if cache_dir is not None else None
+    _worker_stt = VoskSTT(language=language, model_path=model_path, cache=cache)
+    _worker_stt._ensure_model()
+
+
+def _transcribe_job(path: str) -> dict:
+    start = time.perf_counter()
+    duration = sf.info(path).duration
+    stt = _worker_stt
+
+    text = stt.cache.get(Path(path), stt.language, stt.model_name) if stt.cache else None
+    cached = text is not None
+    if not cached:
+        # The streaming path keeps memory flat for long recordings too
+        text = " ".join(s.text for s in stt.transcribe_stream(Path(path), partials=False))
+        if stt.cache:
+            stt.cache.put(Path(path), stt.language, stt.model_name, text)
+
+    elapsed = time.perf_counter() - start
+    return {
+        "text": text,
+        "duration": round(duration, 3),
+        "seconds": round(elapsed, 3),
+        "rtf": round(elapsed / duration, 4) if duration else None,
+        "cached": cached,
+    }
+
+
+def transcribe_files(
+    paths: Iterable[Path],
+    results_path: Path,
+    language: str = "ja",
+    workers: Optional[int] = None,
+    model_path: Optional[Path] = None,
+    cache_dir: Optional[Path] = None,
+) -> TranscribeSummary:
+    """Transcribe many files across worker processes.
+
+    One JSON line per file (``path``, ``status``, ``text``, ``duration``,
+    ``seconds``, ``rtf``) is appended to ``results_path`` as each file
+    finishes. Files already recorded as ``ok`` there are skipped, so an
+    interrupted run can simply be restarted.
+
+    Args:
+        paths: Audio files, e.g. from ``iter_audio_files``
+        results_path: JSONL file to append results to
+        language: Vosk language code
+        workers: Worker processes (default: one per CPU)
+        model_path: Custom Vosk model directory
+        cache_dir: Transcript cache to reuse and fill (see ``TranscriptCache``)
+
+    Returns:
+        Summary of the run
+    """
+    from .vosk_stt import DEFAULT_MODEL_DIR, VOSK_MODELS, download_model
+
+    workers = workers or os.cpu_count() or 1
+    results_path = Path(results_path)
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    done = _completed(results_path)
+
+    # Download once up front rather than racing in every worker
+    if model_path is None and language in VOSK_MODELS:
+        if not (DEFAULT_MODEL_DIR / VOSK_MODELS[language]["name"]).exists():
+            download_model(language)
+
+    summary = TranscribeSummary()
+    start = time.perf_counter()
+    print(f"Starting {workers} transcription workers...")
+
+    with open(results_path, "a", encoding="utf-8") as results, ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(language, model_path, cache_dir),
+    ) as executor:
+
+        def record(path: str, status: str, **fields) -> None:
+            results.write(json.dumps({"path": path, "status": status, **fields}, ensure_ascii=False) + "\n")
+            results.flush()
+
+        def collect(finished) -> None:
+            for future in finished:
+                path = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"Failed {path}: {e}", file=sys.stderr)
+                    summary.failed += 1
+                    record(path, "error", error=str(e))
+                    continue
+                summary.ok += 1
+                summary.audio_seconds += result["duration"]
+                record(path, "ok", **result)
+
+        # Keep a bounded number of files in flight so any input size is fine
+        pending: dict = {}
+        for path in paths:
+            path = str(path)
+            if path in done:
+                summary.skipped += 1
+                continue
+            if len(pending) >= workers * 4:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(finished)
+            pending[executor.submit(_transcribe_job, path)] = path
+        collect(wait(pending)[0])
+
+    summary.elapsed = time.perf_counter() - start
+    return summary
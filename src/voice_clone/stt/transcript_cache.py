@@ -0,0 +1,58 @@
+"""Persistent transcript cache for reference audio."""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from ..audio.loader import file_digest
+
+DEFAULT_TRANSCRIPT_CACHE_DIR = Path.home() / ".voice-clone" / "transcripts"
+
+
+class TranscriptCache:
+    """Transcripts stored on disk, keyed by audio content, language and model.
+
+    A hit means Vosk never has to be loaded for that reference, so
+    ``--auto-transcribe`` costs only a file hash after the first run.
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_TRANSCRIPT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(audio_digest: str, language: str, model_name: str) -> str:
+        """Build a cache key from the audio hash, language and Vosk model."""
+        payload = json.dumps([audio_digest, language, model_name])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, audio_path: Path, language: str, model_name: str) -> Path:
+        key = self.make_key(file_digest(audio_path), language, model_name)
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, audio_path: Path, language: str, model_name: str) -> Optional[str]:
+        """Return the stored transcript for a file, or None on a miss."""
+        path = self._path(audio_path, language, model_name)
+        try:
+            text = json.loads(path.read_text(encoding="utf-8"))["text"]
+        except (OSError, ValueError, KeyError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return text
+
+    def put(self, audio_path: Path, language: str, model_name: str, text: str) -> None:
+        """Store a transcript for a file."""
+        path = self._path(audio_path, language, model_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {"text": text, "source": str(Path(audio_path).resolve()), "language": language, "model": model_name}
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
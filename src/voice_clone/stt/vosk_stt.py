@@ -1,16 +1,30 @@
 """Vosk-based Speech-to-Text for voice-clone."""
 
-import io
+import hashlib
 import json
+import os
+import shutil
 import sys
+import tempfile
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Iterable, Iterator, Optional
+from urllib.parse import urlparse
+from urllib.request import url2pathname
 
 import numpy as np
 import soundfile as sf
 
-# Vosk model URLs
+from ..aio import AsyncRunner, check_cancelled
+from ..audio.loader import load_audio
+from ..audio.resample import StreamingResampler
+from ..metrics import metrics
+from .transcript_cache import TranscriptCache
+
+# Vosk model URLs (an optional "sha256" entry pins the archive checksum)
 VOSK_MODELS = {
     "ja": {
         "name": "vosk-model-small-ja-0.22",
@@ -28,6 +42,28 @@ VOSK_MODELS = {
 
 DEFAULT_MODEL_DIR = Path.home() / ".voice-clone" / "models"
 
+# Directory or base URL to fetch model archives from instead of alphacephei.com
+VOSK_MIRROR_ENV = "VOICE_CLONE_VOSK_MIRROR"
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Vosk recognizer input rate
+STT_SAMPLE_RATE = 16000
+
+
+@dataclass
+class TranscriptSegment:
+    """A piece of a streaming transcription.
+
+    Partial segments are the recognizer's current hypothesis for the
+    utterance in progress and may change; final segments do not.
+    """
+
+    text: str
+    start: float
+    end: float
+    final: bool
+
 
 class VoskSTT:
     """Vosk-based Speech-to-Text engine."""
@@ -36,16 +72,24 @@ class VoskSTT:
         self,
         language: str = "ja",
         model_path: Optional[Path] = None,
+        cache: Optional[TranscriptCache] = None,
+        async_workers: int = 1,
     ) -> None:
         """Initialize Vosk STT.
 
         Args:
             language: Language code (ja, en, zh).
             model_path: Custom path to Vosk model directory.
+            cache: Transcript cache checked before (and filled after) ``transcribe``.
+            async_workers: Concurrent recognitions from ``atranscribe``.
         """
         self.language = language
+        self.cache = cache
+        self.async_workers = async_workers
         self._model = None
         self._model_path = model_path
+        self._local = threading.local()
+        self._runner: Optional[AsyncRunner] = None
 
         if self._model_path is None:
             model_info = VOSK_MODELS.get(language, VOSK_MODELS["ja"])
@@ -71,7 +115,8 @@ class VoskSTT:
             SetLogLevel(-1)
 
             print(f"Loading Vosk model from {self._model_path}...")
-            self._model = Model(str(self._model_path))
+            with metrics.timer("stt_model_load"):
+                self._model = Model(str(self._model_path))
             print("Vosk model loaded.")
 
         except ImportError:
@@ -81,6 +126,22 @@ class VoskSTT:
             print(f"Error loading Vosk model: {e}", file=sys.stderr)
             raise
 
+    def _recognizer(self):
+        """Return this thread's recognizer, reset for a new stream.
+
+        Recognizers are reused across files rather than rebuilt per call.
+        """
+        recognizer = getattr(self._local, "recognizer", None)
+        if recognizer is None:
+            from vosk import KaldiRecognizer
+
+            recognizer = KaldiRecognizer(self._model, STT_SAMPLE_RATE)
+            recognizer.SetWords(True)
+            self._local.recognizer = recognizer
+        else:
+            recognizer.Reset()
+        return recognizer
+
     def transcribe(self, audio_path: Path) -> str:
         """Transcribe audio file to text.
 
@@ -90,29 +151,22 @@ class VoskSTT:
         Returns:
             Transcribed text.
         """
-        self._ensure_model()
-
         audio_path = Path(audio_path)
         if not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-        # Load audio file
-        audio_data, sample_rate = sf.read(audio_path)
-
-        # Convert to mono if stereo
-        if len(audio_data.shape) > 1:
-            audio_data = audio_data.mean(axis=1)
+        if self.cache is not None:
+            text = self.cache.get(audio_path, self.language, self.model_name)
+            if text is not None:
+                metrics.count("transcript_cache_hits")
+                return text
+            metrics.count("transcript_cache_misses")
 
-        # Convert to float32
-        audio_data = audio_data.astype(np.float32)
-
-        # Resample to 16kHz if needed (Vosk works best at 16kHz)
-        if sample_rate != 16000:
-            import scipy.signal as signal
+        self._ensure_model()
 
-            samples = int(len(audio_data) * 16000 / sample_rate)
-            audio_data = signal.resample(audio_data, samples)
-            sample_rate = 16000
+        # Load as mono float32 at 16kHz (Vosk works best at 16kHz); shares
+        # the decoded reference with QwenTTS when auto-transcribing
+        audio_data, _ = load_audio(audio_path, STT_SAMPLE_RATE)
 
         # Convert to PCM16 bytes
         audio_data = np.clip(audio_data, -1.0, 1.0)
@@ -120,39 +174,258 @@ class VoskSTT:
         audio_bytes = audio_int16.tobytes()
 
         # Transcribe
-        from vosk import KaldiRecognizer
-
-        recognizer = KaldiRecognizer(self._model, sample_rate)
-        recognizer.AcceptWaveform(audio_bytes)
-        result = json.loads(recognizer.FinalResult())
+        check_cancelled()
+        with metrics.timer("stt_recognize"):
+            recognizer = self._recognizer()
+            recognizer.AcceptWaveform(audio_bytes)
+            result = json.loads(recognizer.FinalResult())
+        metrics.count("stt_audio_seconds", len(audio_int16) / STT_SAMPLE_RATE)
 
         text = result.get("text", "")
+        if self.cache is not None:
+            self.cache.put(audio_path, self.language, self.model_name, text)
         return text
 
+    def transcribe_stream(
+        self,
+        audio_path: Path,
+        block_seconds: float = 10.0,
+        frame_ms: int = 250,
+        partials: bool = True,
+    ) -> Iterator[TranscriptSegment]:
+        """Transcribe an audio file incrementally with bounded memory.
+
+        The file is read ``block_seconds`` at a time and fed through an
+        ``IncrementalTranscriber``, so memory does not grow with file length.
+
+        Args:
+            audio_path: Path to audio file.
+            block_seconds: Seconds of audio decoded per read.
+            frame_ms: Milliseconds of audio per recognizer call.
+            partials: Also yield partial hypotheses as they change.
+
+        Yields:
+            Partial and final segments, with times in seconds.
+        """
+        audio_path = Path(audio_path)
+        if not audio_path.exists():
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+        native_rate = sf.info(str(audio_path)).samplerate
+        session = IncrementalTranscriber(self, native_rate, frame_ms, partials)
+
+        block_size = max(1, int(native_rate * block_seconds))
+        for block in sf.blocks(str(audio_path), blocksize=block_size, dtype="float32", always_2d=True):
+            check_cancelled()
+            yield from session.feed(block.mean(axis=1))
+        yield from session.finish()
+
+    @property
+    def runner(self) -> AsyncRunner:
+        """Thread pool behind the async methods (``async_workers`` recognitions at a time)."""
+        if self._runner is None:
+            self._runner = AsyncRunner(self.async_workers, "vosk-stt")
+        return self._runner
+
+    async def atranscribe(self, audio_path: Path) -> str:
+        """Async ``transcribe``, run on ``runner``.
+
+        Each runner thread keeps its own recognizer, so ``async_workers``
+        files are recognized in parallel.
+        """
+        return await self.runner.run(self.transcribe, audio_path)
+
+    async def atranscribe_stream(
+        self,
+        audio_path: Path,
+        block_seconds: float = 10.0,
+        frame_ms: int = 250,
+        partials: bool = True,
+    ) -> AsyncIterator[TranscriptSegment]:
+        """Async ``transcribe_stream``; stopping early stops decoding after the current block."""
+        segments = self.runner.iterate(self.transcribe_stream, audio_path, block_seconds, frame_ms, partials)
+        try:
+            async for segment in segments:
+                yield segment
+        finally:
+            await segments.aclose()
+
+    @property
+    def model_name(self) -> str:
+        """Name of the Vosk model directory."""
+        return Path(self._model_path).name
+
     @property
     def is_available(self) -> bool:
         """Check if engine is available."""
         return self._model is not None or self._model_path.exists()
 
 
-def download_model(language: str = "ja", target_dir: Optional[Path] = None) -> Path:
+class IncrementalTranscriber:
+    """Feed audio to a Vosk recognizer as it arrives (from a file or a microphone).
+
+    Input at any sample rate is resampled to 16kHz with state carried
+    across blocks and passed to the recognizer in fixed ``frame_ms`` PCM
+    frames.
+    """
+
+    def __init__(self, stt: VoskSTT, sample_rate: int, frame_ms: int = 250, partials: bool = True):
+        stt._ensure_model()
+        self.partials = partials
+        self.segments: list[TranscriptSegment] = []
+        self._recognizer = stt._recognizer()
+        self._resampler = StreamingResampler(sample_rate, STT_SAMPLE_RATE)
+        self._frame_samples = STT_SAMPLE_RATE * frame_ms // 1000
+        self._pending = np.zeros(0, dtype=np.int16)
+        self._fed = 0  # samples passed to the recognizer
+        self._segment_start = 0.0
+        self._last_partial = ""
+
+    @property
+    def text(self) -> str:
+        """Text of all final segments so far."""
+        return " ".join(segment.text for segment in self.segments)
+
+    def _final(self, result: dict) -> list[TranscriptSegment]:
+        # Word timings are exact; fall back to the audio fed so far
+        words = result.get("result") or []
+        start = words[0]["start"] if words else self._segment_start
+        end = words[-1]["end"] if words else self._fed / STT_SAMPLE_RATE
+        self._segment_start = self._fed / STT_SAMPLE_RATE
+        self._last_partial = ""
+        text = result.get("text", "")
+        if not text:
+            return []
+        segment = TranscriptSegment(text, start, end, final=True)
+        self.segments.append(segment)
+        return [segment]
+
+    def _feed_pcm(self, samples: np.ndarray, flush: bool = False) -> list[TranscriptSegment]:
+        out: list[TranscriptSegment] = []
+        pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+        self._pending = np.concatenate([self._pending, pcm])
+        while len(self._pending) >= self._frame_samples or (flush and len(self._pending)):
+            frame = self._pending[: self._frame_samples]
+            self._pending = self._pending[self._frame_samples :]
+            self._fed += len(frame)
+            if self._recognizer.AcceptWaveform(frame.tobytes()):
+                out.extend(self._final(json.loads(self._recognizer.Result())))
+            elif self.partials:
+                partial = json.loads(self._recognizer.PartialResult()).get("partial", "")
+                if partial and partial != self._last_partial:
+                    self._last_partial = partial
+                    end = self._fed / STT_SAMPLE_RATE
+                    out.append(TranscriptSegment(partial, self._segment_start, end, final=False))
+        return out
+
+    def feed(self, block: np.ndarray) -> list[TranscriptSegment]:
+        """Feed a mono float block; return any new partial or final segments."""
+        return self._feed_pcm(self._resampler.process(block))
+
+    def finish(self) -> list[TranscriptSegment]:
+        """Flush buffered audio and return the remaining final segments."""
+        out = self._feed_pcm(self._resampler.flush(), flush=True)
+        out.extend(self._final(json.loads(self._recognizer.FinalResult())))
+        return out
+
+
+def _mirror_url(mirror: str, model_name: str) -> str:
+    """Resolve a model archive URL inside a mirror directory or base URL."""
+    if "://" not in mirror:
+        mirror = Path(mirror).resolve().as_uri()
+    return f"{mirror.rstrip('/')}/{model_name}.zip"
+
+
+def _fetch(url: str, dest: Path, label: str, progress: bool = True) -> None:
+    """Stream a URL to ``dest``, resuming a partial file with an HTTP Range request."""
+    parsed = urlparse(url)
+    if parsed.scheme == "file":
+        src = Path(url2pathname(parsed.path))
+        with open(src, "rb") as fin, open(dest, "wb") as fout:
+            shutil.copyfileobj(fin, fout, DOWNLOAD_CHUNK_SIZE)
+        return
+
+    import requests
+
+    offset = dest.stat().st_size if dest.exists() else 0
+    headers = {"Range": f"bytes={offset}-"} if offset else {}
+    with requests.get(url, stream=True, headers=headers, timeout=30) as response:
+        if response.status_code == 416:
+            return  # Nothing left to fetch
+        response.raise_for_status()
+
+        if response.status_code != 206:
+            offset = 0  # Server ignored the Range header; start over
+        total_size = offset + int(response.headers.get("content-length", 0))
+        downloaded = offset
+
+        with open(dest, "ab" if offset else "wb") as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                downloaded += len(chunk)
+                if progress and total_size:
+                    percent = (downloaded / total_size) * 100
+                    print(f"\rDownloading {label}: {percent:.1f}%", end="", flush=True)
+        if progress:
+            print()
+
+    if total_size and downloaded != total_size:
+        raise IOError(f"Incomplete download of {label}: {downloaded} of {total_size} bytes")
+
+
+def _verify_archive(path: Path, sha256: Optional[str]) -> None:
+    """Check an archive against a known SHA-256, or its zip CRCs if none is known."""
+    if sha256:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        if digest.hexdigest() != sha256.lower():
+            path.unlink()
+            raise IOError(f"Checksum mismatch for {path.name}")
+        return
+
+    try:
+        with zipfile.ZipFile(path) as zf:
+            bad = zf.testzip()
+    except zipfile.BadZipFile as e:
+        path.unlink()
+        raise IOError(f"Corrupt archive {path.name}: {e}") from e
+    if bad is not None:
+        path.unlink()
+        raise IOError(f"Corrupt archive {path.name}: bad CRC for {bad}")
+
+
+def download_model(
+    language: str = "ja",
+    target_dir: Optional[Path] = None,
+    mirror: Optional[str] = None,
+    progress: bool = True,
+) -> Path:
     """Download Vosk model for specified language.
 
+    The archive is streamed to a ``.part`` file next to the model (so an
+    interrupted download resumes where it stopped), verified, extracted
+    into a temporary directory and atomically renamed into place.
+
     Args:
         language: Language code (ja, en, zh).
         target_dir: Target directory for model.
+        mirror: Directory or base URL (``file://``, ``http://``) holding
+            ``<model-name>.zip`` archives to use instead of the upstream URLs.
+            Defaults to ``$VOICE_CLONE_VOSK_MIRROR``.
+        progress: Print download progress.
 
     Returns:
         Path to downloaded model directory.
     """
-    import requests
-
     if language not in VOSK_MODELS:
         raise ValueError(f"Unsupported language: {language}. Supported: {list(VOSK_MODELS.keys())}")
 
     model_info = VOSK_MODELS[language]
     model_name = model_info["name"]
-    url = model_info["url"]
+    mirror = mirror or os.environ.get(VOSK_MIRROR_ENV)
+    url = _mirror_url(mirror, model_name) if mirror else model_info["url"]
 
     if target_dir is None:
         target_dir = DEFAULT_MODEL_DIR
@@ -167,28 +440,54 @@ def download_model(language: str = "ja", target_dir: Optional[Path] = None) -> P
         return model_path
 
     print(f"Downloading Vosk model from {url}...")
-    print("This may take a few minutes...")
-
-    response = requests.get(url, stream=True)
-    response.raise_for_status()
+    if progress:
+        print("This may take a few minutes...")
+
+    archive = target_dir / f".{model_name}.zip.part"
+    _fetch(url, archive, model_name, progress)
+    _verify_archive(archive, model_info.get("sha256"))
+
+    print(f"Extracting {model_name}...")
+    extract_dir = Path(tempfile.mkdtemp(prefix=f".{model_name}.", dir=target_dir))
+    try:
+        # Members are streamed from the archive on disk, never held in memory
+        with zipfile.ZipFile(archive) as zf:
+            zf.extractall(extract_dir)
+        extracted = extract_dir / model_name
+        if not extracted.is_dir():
+            raise IOError(f"Archive for {language} does not contain {model_name}/")
+        os.replace(extracted, model_path)
+    finally:
+        shutil.rmtree(extract_dir, ignore_errors=True)
+    archive.unlink()
 
-    # Get total size for progress
-    total_size = int(response.headers.get("content-length", 0))
-    downloaded = 0
-    chunks = []
+    print(f"Model downloaded to: {model_path}")
+    return model_path
 
-    for chunk in response.iter_content(chunk_size=8192):
-        chunks.append(chunk)
-        downloaded += len(chunk)
-        if total_size:
-            percent = (downloaded / total_size) * 100
-            print(f"\rDownloading: {percent:.1f}%", end="", flush=True)
 
-    print("\nExtracting...")
+def download_models(
+    languages: Iterable[str],
+    target_dir: Optional[Path] = None,
+    mirror: Optional[str] = None,
+) -> dict[str, Path]:
+    """Download several Vosk models concurrently.
 
-    content = b"".join(chunks)
-    with zipfile.ZipFile(io.BytesIO(content)) as zf:
-        zf.extractall(target_dir)
+    Args:
+        languages: Language codes (ja, en, zh).
+        target_dir: Target directory for models.
+        mirror: Mirror directory or base URL (see ``download_model``).
 
-    print(f"Model downloaded to: {model_path}")
-    return model_path
+    Returns:
+        Mapping of language code to model directory.
+    """
+    languages = list(dict.fromkeys(languages))
+    if len(languages) == 1:
+        return {languages[0]: download_model(languages[0], target_dir, mirror)}
+
+    with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+        # Interleaved progress bars are unreadable, so only report per model
+        futures = {
+            language: executor.submit(download_model, language, target_dir, mirror, False)
+            for language in languages
+        }
+        return {language: future.result() for language, future in futures.items()}
@@ -1,5 +1,13 @@
 """TTS module using Qwen3-TTS."""
 
-from .qwen_tts import QwenTTS
-
 __all__ = ["QwenTTS"]
+
+
+def __getattr__(name: str):
+    # Resolved lazily so that the cache, text and precision helpers can be
+    # imported without pulling in the model wrapper
+    if name == "QwenTTS":
+        from .qwen_tts import QwenTTS
+
+        return QwenTTS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
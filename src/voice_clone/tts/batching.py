@@ -0,0 +1,45 @@
+"""Batch planning for Qwen3-TTS generation."""
+
+
+def plan_batches(
+    texts: list[str],
+    max_batch_size: int = 8,
+    max_batch_chars: int = 0,
+) -> list[list[int]]:
+    """Group texts into model-level batches.
+
+    Texts are sorted by length so that each batch pads to a similar length,
+    then packed greedily. A batch is padded to its longest item, so its cost
+    is estimated as ``len(longest) * batch_size`` and kept under
+    ``max_batch_chars`` (the character count stands in for the token budget).
+
+    Args:
+        texts: Texts to synthesize
+        max_batch_size: Maximum number of texts per batch
+        max_batch_chars: Padded character budget per batch (0 = unlimited)
+
+    Returns:
+        Batches as lists of indices into ``texts``
+    """
+    max_batch_size = max(1, max_batch_size)
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+
+    batches: list[list[int]] = []
+    current: list[int] = []
+    longest = 0
+    for i in order:
+        # Sorted descending, so the first item of a batch is its longest
+        width = longest if current else len(texts[i])
+        fits = len(current) < max_batch_size and (
+            not max_batch_chars or width * (len(current) + 1) <= max_batch_chars
+        )
+        if current and not fits:
+            batches.append(current)
+            current = []
+            width = len(texts[i])
+        current.append(i)
+        longest = width
+
+    if current:
+        batches.append(current)
+    return batches
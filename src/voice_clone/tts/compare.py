@@ -0,0 +1,200 @@
+"""Speed, memory and quality comparison of model precisions.
+
+Each precision runs in its own spawned process so that load time and peak
+memory are measured from a clean start. All runs use the same seed, texts
+and references; quality is then judged against the fp32 outputs with
+objective proxies, since sampling makes sample-exact comparison meaningless
+once the numerics differ.
+"""
+
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import soundfile as sf
+
+from ..bench import peak_rss
+from ..config import TTSConfig
+
+DEFAULT_TEXTS = [
+    "こんにちは、今日もいい天気ですね。",
+    "本日の会議は午後三時から、第二会議室で行います。",
+    "まもなく一番線に、東京行きの電車が参ります。",
+]
+
+
+@dataclass
+class PrecisionResult:
+    """Measurements for one precision."""
+
+    precision: str  # As requested
+    resolved: str  # As loaded (bf16 may fall back to fp32)
+    load_seconds: float
+    synth_seconds: float
+    audio_seconds: float
+    peak_rss: int  # Bytes, whole process
+    spectral_distance: Optional[float] = None  # dB from fp32 (lower is closer)
+    cer: Optional[float] = None  # Character error rate of the Vosk transcript
+
+    @property
+    def rtf(self) -> float:
+        """Real-time factor: synthesis time / audio time."""
+        return self.synth_seconds / self.audio_seconds if self.audio_seconds else 0.0
+
+
+def _run_precision(
+    config: TTSConfig,
+    references: list[Path],
+    texts: list[str],
+    sample_rate: int,
+    output_dir: Path,
+) -> tuple[str, float, float, float, int, list[Path]]:
+    from .qwen_tts import QwenTTS
+
+    tts = QwenTTS(config=config)
+    start = time.perf_counter()
+    tts.load_model()
+    load_seconds = time.perf_counter() - start
+
+    # Voice prompts are not what is being compared; build them untimed
+    for reference in references:
+        tts.get_voice_prompt(reference)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    outputs = []
+    synth_seconds = audio_seconds = 0.0
+    for reference in references:
+        start = time.perf_counter()
+        audios = tts.synthesize(texts, reference, sample_rate)
+        synth_seconds += time.perf_counter() - start
+        for i, audio in enumerate(audios):
+            path = output_dir / f"{reference.stem}_{i:03d}.wav"
+            sf.write(path, audio, sample_rate)
+            outputs.append(path)
+            audio_seconds += len(audio) / sample_rate
+
+    return tts.precision, load_seconds, synth_seconds, audio_seconds, peak_rss(), outputs
+
+
+def _mel_filterbank(sample_rate: int, n_fft: int, n_mels: int) -> np.ndarray:
+    def to_mel(f):
+        return 2595 * np.log10(1 + f / 700)
+
+    edges = 700 * (10 ** (np.linspace(0, to_mel(sample_rate / 2), n_mels + 2) / 2595) - 1)
+    freqs = np.fft.rfftfreq(n_fft, 1 / sample_rate)
+    lower, center, upper = edges[:-2, None], edges[1:-1, None], edges[2:, None]
+    return np.maximum(0, np.minimum((freqs - lower) / (center - lower), (upper - freqs) / (upper - center)))
+
+
+def mel_profile(audio: np.ndarray, sample_rate: int, n_fft: int = 1024, n_mels: int = 40) -> np.ndarray:
+    """Long-term average log-mel spectrum (dB, mean removed) of the voiced frames.
+
+    Averaging over time makes it independent of timing and wording, so it
+    captures timbre and spectral artifacts rather than what was said.
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    if len(audio) < n_fft:
+        audio = np.pad(audio, (0, n_fft - len(audio)))
+    frames = np.lib.stride_tricks.sliding_window_view(audio, n_fft)[:: n_fft // 2]
+    power = np.abs(np.fft.rfft(frames * np.hanning(n_fft), axis=1)) ** 2
+    energy = power.sum(axis=1)
+    # Skip pauses so the silence share of each clip does not shift the profile
+    spectrum = power[energy > energy.max() * 1e-5].mean(axis=0)
+    db = 10 * np.log10(_mel_filterbank(sample_rate, n_fft, n_mels) @ spectrum + 1e-12)
+    return db - db.mean()
+
+
+def spectral_distance(a: np.ndarray, b: np.ndarray, sample_rate: int) -> float:
+    """RMS difference in dB between the mel profiles of two clips."""
+    return float(np.sqrt(np.mean((mel_profile(a, sample_rate) - mel_profile(b, sample_rate)) ** 2)))
+
+
+def character_error_rate(reference: str, hypothesis: str) -> float:
+    """Edit distance between two texts over the reference length, ignoring spaces and punctuation."""
+    ref = [c for c in reference if c.isalnum()]
+    hyp = [c for c in hypothesis if c.isalnum()]
+    if not ref:
+        return float(bool(hyp))
+    row = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        prev, row[0] = row[0], i
+        for j, h in enumerate(hyp, 1):
+            prev, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, prev + (r != h))
+    return row[-1] / len(ref)
+
+
+def compare_precisions(
+    references: list[Path],
+    precisions: list[str],
+    texts: Optional[list[str]] = None,
+    config: Optional[TTSConfig] = None,
+    output_dir: Path = Path("outputs/precision"),
+    sample_rate: int = 24000,
+    language: Optional[str] = "ja",
+) -> list[PrecisionResult]:
+    """Synthesize the same requests at each precision and compare them to fp32.
+
+    Args:
+        references: Reference voices
+        precisions: Precisions to compare (fp32 is always run as the baseline)
+        texts: Texts to synthesize per reference (default: ``DEFAULT_TEXTS``)
+        config: Base TTS configuration; its seed defaults to 0 here
+        output_dir: Outputs are kept under ``output_dir/<precision>/``
+        sample_rate: Output sample rate
+        language: Vosk language for the CER check (None, or no installed
+            model, skips it)
+
+    Returns:
+        One result per precision, fp32 first
+    """
+    texts = texts or DEFAULT_TEXTS
+    config = replace(config or TTSConfig(), output_cache_dir=None)
+    if config.seed is None:
+        config.seed = 0
+    precisions = ["fp32"] + [p for p in dict.fromkeys(precisions) if p != "fp32"]
+
+    results: list[PrecisionResult] = []
+    outputs: dict[str, list[Path]] = {}
+    spawn = multiprocessing.get_context("spawn")
+    for precision in precisions:
+        print(f"Running {precision}...")
+        # A fresh process per precision so peak memory is its own
+        with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as executor:
+            resolved, load_s, synth_s, audio_s, peak_rss, paths = executor.submit(
+                _run_precision,
+                replace(config, precision=precision),
+                [Path(r) for r in references],
+                texts,
+                sample_rate,
+                Path(output_dir) / precision,
+            ).result()
+        results.append(PrecisionResult(precision, resolved, load_s, synth_s, audio_s, peak_rss))
+        outputs[precision] = paths
+
+    baseline = [sf.read(path, dtype="float32")[0] for path in outputs["fp32"]]
+    for result in results:
+        result.spectral_distance = float(np.mean([
+            spectral_distance(sf.read(path, dtype="float32")[0], ref, sample_rate)
+            for path, ref in zip(outputs[result.precision], baseline)
+        ]))
+
+    if language:
+        from ..stt import VoskSTT
+
+        stt = VoskSTT(language=language)
+        if stt.is_available:
+            expected = texts * len(references)
+            for result in results:
+                result.cer = float(np.mean([
+                    character_error_rate(text, stt.transcribe(path))
+                    for path, text in zip(outputs[result.precision], expected)
+                ]))
+        else:
+            print(f"Vosk model for '{language}' not installed; skipping CER", file=sys.stderr)
+
+    return results
@@ -0,0 +1,162 @@
+"""Content-addressed cache of synthesized audio files."""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import soundfile as sf
+
+from ..metrics import metrics
+
+DEFAULT_OUTPUT_CACHE_DIR = Path.home() / ".voice-clone" / "outputs"
+DEFAULT_OUTPUT_CACHE_BYTES = 1 << 30
+
+
+def normalize_text(text: Optional[str]) -> Optional[str]:
+    """Normalize text so trivially different requests share a cache entry."""
+    if text is None:
+        return None
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def _place(src: Path, dest: Path) -> None:
+    """Hardlink ``src`` to ``dest`` (copying across filesystems), replacing ``dest``."""
+    tmp_path = dest.with_name(f".{dest.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dest)
+
+
+def detach(path: Path) -> None:
+    """Remove ``path`` before rewriting it.
+
+    A cache hit shares its inode with the cache entry, so writing over it
+    in place would silently change the cached audio too.
+    """
+    Path(path).unlink(missing_ok=True)
+
+
+def write_audio(path: Path, audio: np.ndarray, sample_rate: int) -> None:
+    """Write a generated file, replacing rather than overwriting any cache-linked one."""
+    with metrics.timer("write"):
+        detach(path)
+        sf.write(path, audio, sample_rate)
+
+
+class OutputCache:
+    """Size-bounded on-disk store of generated WAV files with LRU eviction.
+
+    Entries are keyed by the normalized request (see ``make_key``). Hits
+    are hardlinked (or copied) to the requested output path, so a repeated
+    request never runs the model. Recency is tracked through file mtimes,
+    which survive across processes.
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_OUTPUT_CACHE_DIR, max_bytes: int = DEFAULT_OUTPUT_CACHE_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Running size of the store; None until the first scan. Other
+        # processes may also add entries, so it is resynced on every evict()
+        self._size: Optional[int] = None
+
+    @staticmethod
+    def make_key(
+        text: str,
+        audio_digest: str,
+        ref_text: Optional[str],
+        model_name: str,
+        temperature: float,
+        sample_rate: int,
+        seed: Optional[int],
+        max_chars_per_segment: int,
+        crossfade_ms: float,
+    ) -> str:
+        """Build a cache key from everything that determines the output."""
+        payload = json.dumps(
+            [
+                normalize_text(text),
+                audio_digest,
+                normalize_text(ref_text),
+                model_name,
+                round(float(temperature), 4),
+                int(sample_rate),
+                seed,
+                max_chars_per_segment,
+                crossfade_ms,
+            ],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.wav"
+
+    def fetch(self, key: str, output_path: Path) -> bool:
+        """Place a cached entry at ``output_path``; returns False on a miss."""
+        path = self._path(key)
+        try:
+            _place(path, Path(output_path))
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return False
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def store(self, key: str, output_path: Path) -> None:
+        """Add a freshly generated file to the cache, evicting if it no longer fits."""
+        self.store_many([(key, output_path)])
+
+    def store_many(self, items: list[tuple[str, Path]]) -> None:
+        """Add freshly generated files, checking the size limit once for all of them."""
+        if not items:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        added = 0
+        for key, output_path in items:
+            path = self._path(key)
+            try:
+                added -= path.stat().st_size  # Replaced entry
+            except FileNotFoundError:
+                pass
+            _place(Path(output_path), path)
+            added += path.stat().st_size
+
+        with self._lock:
+            if self._size is not None:
+                self._size += added
+            over = self._size is None or self._size > self.max_bytes
+        if over:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the store fits in ``max_bytes``."""
+        entries = []
+        for path in self.cache_dir.glob("*.wav"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        with self._lock:
+            self._size = total
@@ -0,0 +1,308 @@
+"""Multi-process CPU worker pool for Qwen3-TTS synthesis.
+
+PyTorch intra-op threading scales poorly beyond a few cores for
+autoregressive decoding, so on CPU it is faster to run several model copies,
+each pinned to its own set of cores (kept within one NUMA node where
+possible), and shard jobs across them.
+"""
+
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from ..config import TTSConfig
+from .output_cache import write_audio
+from .precision import BYTES_PER_PARAM
+from .stitch import crossfade_concat
+from .text import segment_text
+
+DEFAULT_THREADS_PER_WORKER = 4
+
+# Set in each worker process by _init_worker
+_worker_tts = None
+
+
+def _available_cpus() -> list[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _parse_cpulist(text: str) -> list[int]:
+    cpus = []
+    for part in text.strip().split(","):
+        if "-" in part:
+            lo, hi = part.split("-")
+            cpus.extend(range(int(lo), int(hi) + 1))
+        elif part:
+            cpus.append(int(part))
+    return cpus
+
+
+def numa_nodes() -> list[list[int]]:
+    """List the usable CPUs of each NUMA node (a single node if unknown)."""
+    available = set(_available_cpus())
+    nodes = []
+    for cpulist in sorted(Path("/sys/devices/system/node").glob("node*/cpulist")):
+        cpus = [c for c in _parse_cpulist(cpulist.read_text()) if c in available]
+        if cpus:
+            nodes.append(cpus)
+    return nodes or [sorted(available)]
+
+
+def assign_cores(workers: int) -> list[list[int]]:
+    """Split the usable CPUs into one core set per worker.
+
+    Workers are spread across NUMA nodes in proportion to each node's CPU
+    count, and a worker's cores never span two nodes.
+    """
+    nodes = numa_nodes()
+    total = sum(len(n) for n in nodes)
+    if workers > total:
+        # More workers than cores: share cores round-robin
+        cpus = [c for n in nodes for c in n]
+        return [[cpus[i % total]] for i in range(workers)]
+
+    per_node = [max(1, round(workers * len(n) / total)) for n in nodes]
+    while sum(per_node) > workers:
+        # Take a worker from the node where workers get the fewest cores
+        i = min((i for i, c in enumerate(per_node) if c), key=lambda i: len(nodes[i]) / per_node[i])
+        per_node[i] -= 1
+    while sum(per_node) < workers:
+        # Give a worker to the node where it would get the most cores
+        i = max(range(len(nodes)), key=lambda i: len(nodes[i]) / (per_node[i] + 1))
+        per_node[i] += 1
+
+    assignments = []
+    for cpus, count in zip(nodes, per_node):
+        for chunk in np.array_split(np.array(cpus), count) if count else []:
+            assignments.append([int(c) for c in chunk])
+    return assignments
+
+
+def available_memory() -> Optional[int]:
+    """Available system memory in bytes, or None if unknown."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def estimate_weight_memory(model_name: str, precision: str = "fp32") -> int:
+    """Rough size of a model's weights, from the parameter count in its name."""
+    match = re.search(r"(\d+(?:\.\d+)?)B", model_name)
+    params = float(match.group(1)) * 1e9 if match else 1e9
+    return int(params * BYTES_PER_PARAM.get(precision, 4.0))
+
+
+def estimate_model_memory(model_name: str, precision: str = "fp32") -> int:
+    """Rough per-process RAM needed for a model, from the size in its name."""
+    # Weights plus activations, tokenizer and runtime overhead
+    return int(estimate_weight_memory(model_name, precision) * 1.5)
+
+
+def default_workers(config: Optional[TTSConfig] = None) -> int:
+    """Pick a worker count from the core count and available RAM."""
+    config = config or TTSConfig()
+    if config.device == "cuda":
+        return 1
+
+    by_cpu = max(1, len(_available_cpus()) // DEFAULT_THREADS_PER_WORKER)
+    memory = available_memory()
+    if memory is None:
+        return by_cpu
+    if config.shared_weights_dir is not None:
+        # Mapped weights are held once for all workers; each adds only its overhead
+        weights = estimate_weight_memory(config.model_name, config.precision)
+        by_ram = max(1, (memory - weights) // (estimate_model_memory(config.model_name, config.precision) - weights))
+    else:
+        by_ram = max(1, memory // estimate_model_memory(config.model_name, config.precision))
+    return int(min(by_cpu, by_ram))
+
+
+def _init_worker(config: TTSConfig, core_queue) -> None:
+    global _worker_tts
+
+    cores = core_queue.get()
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+
+    import torch
+
+    torch.set_num_threads(len(cores))
+
+    from .qwen_tts import QwenTTS
+
+    _worker_tts = QwenTTS(config=config)
+    _worker_tts.load_model()
+
+
+def _synthesize_job(
+    texts: list[str],
+    reference_audio: Path,
+    sample_rate: int,
+    ref_text: Optional[str],
+    temperature: float,
+    max_chars_per_segment: Optional[int],
+) -> list[np.ndarray]:
+    return _worker_tts.synthesize(
+        texts, reference_audio, sample_rate, ref_text, temperature, max_chars_per_segment
+    )
+
+
+def _write_job(
+    texts: list[str],
+    output_paths: list[Path],
+    reference_audio: Path,
+    sample_rate: int,
+    ref_text: Optional[str],
+    temperature: float,
+    max_chars_per_segment: Optional[int],
+) -> list[Path]:
+    audios = _worker_tts.synthesize(
+        texts, reference_audio, sample_rate, ref_text, temperature, max_chars_per_segment
+    )
+    for path, audio in zip(output_paths, audios):
+        write_audio(path, audio, sample_rate)
+    return output_paths
+
+
+class TTSWorkerPool:
+    """Pool of worker processes, each holding its own pinned QwenTTS model."""
+
+    def __init__(self, config: Optional[TTSConfig] = None, workers: Optional[int] = None):
+        self.config = config or TTSConfig()
+        self.workers = workers or default_workers(self.config)
+
+        ctx = multiprocessing.get_context("spawn")
+        core_queue = ctx.Queue()
+        for cores in assign_cores(self.workers):
+            core_queue.put(cores)
+
+        print(f"Starting {self.workers} TTS worker processes...")
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(self.config, core_queue),
+        )
+
+    def _shards(self, count: int) -> list[range]:
+        """Split item indices into contiguous shards, about one batch each."""
+        size = max(1, min(self.config.max_batch_size, -(-count // self.workers)))
+        return [range(i, min(i + size, count)) for i in range(0, count, size)]
+
+    def synthesize(
+        self,
+        texts: list[str],
+        reference_audio: Path,
+        sample_rate: int = 24000,
+        ref_text: Optional[str] = None,
+        temperature: float = 1.0,
+        max_chars_per_segment: Optional[int] = None,
+    ) -> list[np.ndarray]:
+        """Synthesize texts across the workers (see ``QwenTTS.synthesize``).
+
+        Returns:
+            One waveform per text, in input order
+        """
+        reference_audio = Path(reference_audio).resolve()
+        futures = [
+            self._executor.submit(
+                _synthesize_job,
+                [texts[i] for i in shard],
+                reference_audio,
+                sample_rate,
+                ref_text,
+                temperature,
+                max_chars_per_segment,
+            )
+            for shard in self._shards(len(texts))
+        ]
+        return [audio for future in futures for audio in future.result()]
+
+    def generate(
+        self,
+        text: str,
+        reference_audio: Path,
+        output_path: Path,
+        sample_rate: int = 24000,
+        ref_text: Optional[str] = None,
+        temperature: float = 1.0,
+        max_chars_per_segment: Optional[int] = None,
+    ) -> Path:
+        """Generate one long text with its segments sharded across the workers."""
+        if max_chars_per_segment is None:
+            max_chars_per_segment = self.config.max_chars_per_segment
+        segments = segment_text(text, max_chars_per_segment) or [text]
+        print(f"Generating {len(segments)} segments on {self.workers} workers")
+
+        wavs = self.synthesize(segments, reference_audio, sample_rate, ref_text, temperature, 0)
+        audio = crossfade_concat(wavs, sample_rate, self.config.crossfade_ms)
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        write_audio(output_path, audio, sample_rate)
+        print(f"Generated {len(audio) / sample_rate:.2f} seconds of audio to {output_path}")
+        return output_path
+
+    def generate_batch(
+        self,
+        texts: list[str],
+        reference_audio: Path,
+        output_dir: Path,
+        sample_rate: int = 24000,
+        prefix: str = "output",
+        ref_text: Optional[str] = None,
+        temperature: float = 1.0,
+    ) -> list[Path]:
+        """Generate one file per text, with workers writing their own shards.
+
+        As in ``QwenTTS.generate_batch``, each text is synthesized whole
+        (not segmented), so both paths produce the same file for a text.
+        """
+        output_dir = Path(output_dir).resolve()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        outputs = [output_dir / f"{prefix}_{i:03d}.wav" for i in range(len(texts))]
+
+        reference_audio = Path(reference_audio).resolve()
+        futures = [
+            self._executor.submit(
+                _write_job,
+                [texts[i] for i in shard],
+                [outputs[i] for i in shard],
+                reference_audio,
+                sample_rate,
+                ref_text,
+                temperature,
+                0,
+            )
+            for shard in self._shards(len(texts))
+        ]
+        for future in futures:
+            future.result()
+
+        print(f"Generated {len(outputs)} files in {output_dir}")
+        return outputs
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown()
+
+    def __enter__(self) -> "TTSWorkerPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,72 @@
+"""Numeric precision of the TTS model weights."""
+
+import sys
+from pathlib import Path
+
+PRECISIONS = ("auto", "fp32", "bf16", "int8")
+
+# Approximate weight bytes per parameter (int8 keeps embeddings and norms in fp32)
+BYTES_PER_PARAM = {"fp32": 4.0, "bf16": 2.0, "int8": 1.5}
+
+
+def cpu_supports_bf16() -> bool:
+    """Whether the CPU has native bfloat16 matmul (AVX512-BF16 or AMX)."""
+    import torch
+
+    try:
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except (AttributeError, RuntimeError):
+        pass
+    try:
+        flags = Path("/proc/cpuinfo").read_text()
+    except OSError:
+        return False
+    return "avx512_bf16" in flags or "amx_bf16" in flags
+
+
+def resolve_precision(precision: str, device: str) -> str:
+    """Turn a requested precision into the one used on ``device``.
+
+    ``auto`` keeps the previous behaviour: bf16 on CUDA, fp32 on CPU. bf16
+    on a CPU without native support is emulated and slower than fp32, so it
+    falls back to fp32 with a warning.
+    """
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unsupported precision: {precision}. Supported: {list(PRECISIONS)}")
+    if precision == "auto":
+        return "bf16" if device == "cuda" else "fp32"
+    if precision == "int8" and device != "cpu":
+        raise ValueError("int8 dynamic quantization is only available on CPU (use --device cpu)")
+    if precision == "bf16" and device == "cpu" and not cpu_supports_bf16():
+        print("Warning: this CPU has no native bf16 support; using fp32", file=sys.stderr)
+        return "fp32"
+    return precision
+
+
+def load_dtype(precision: str):
+    """Weight ``torch.dtype`` to load a model with for a resolved precision."""
+    import torch
+
+    return torch.bfloat16 if precision == "bf16" else torch.float32
+
+
+def torch_module(model):
+    """The ``torch.nn.Module`` holding the weights of a loaded model wrapper."""
+    import torch
+
+    module = model if isinstance(model, torch.nn.Module) else getattr(model, "model", None)
+    if not isinstance(module, torch.nn.Module):
+        raise TypeError(f"Cannot find the torch module of {type(model).__name__}")
+    return module
+
+
+def quantize_linear(model) -> None:
+    """Quantize the Linear layers of a loaded model to int8 in place.
+
+    Weights are stored as int8 and activations are quantized on the fly per
+    batch (dynamic quantization), so no calibration data is needed.
+    """
+    import torch
+
+    module = torch_module(model)
+    torch.ao.quantization.quantize_dynamic(module, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
@@ -0,0 +1,119 @@
+"""Voice-prompt cache for Qwen3-TTS voice cloning."""
+
+import hashlib
+import json
+import os
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+DEFAULT_PROMPT_CACHE_DIR = Path.home() / ".voice-clone" / "prompts"
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache."""
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.hits} hits ({self.disk_hits} from disk), "
+            f"{self.misses} misses, {self.evictions} evictions"
+        )
+
+
+class VoicePromptCache:
+    """LRU cache of precomputed voice-clone prompts.
+
+    Prompts hold the speaker x-vector and reference codec tokens, which are
+    expensive to compute but only depend on the reference audio, its
+    transcript and the model. Entries are kept in memory with LRU eviction
+    and, when ``cache_dir`` is set, also persisted to disk.
+    """
+
+    def __init__(self, max_entries: int = 16, cache_dir: Optional[Path] = None):
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+
+    @staticmethod
+    def make_key(audio_digest: str, ref_text: Optional[str], model_name: str) -> str:
+        """Build a cache key from the reference audio hash, ref_text and model."""
+        payload = json.dumps([audio_digest, ref_text, model_name], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{key}.pt"
+
+    def get(self, key: str, map_location: Optional[str] = None) -> Optional[Any]:
+        """Look up a prompt, checking memory first and then disk.
+
+        Args:
+            key: Cache key from ``make_key``
+            map_location: Device to load disk entries onto
+
+        Returns:
+            The cached prompt, or None on a miss
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return self._entries[key]
+
+        path = self._disk_path(key)
+        if path is not None and path.exists():
+            try:
+                import torch
+
+                prompt = torch.load(path, map_location=map_location, weights_only=False)
+            except Exception as e:
+                print(f"Ignoring unreadable prompt cache entry {path}: {e}", file=sys.stderr)
+            else:
+                self.stats.hits += 1
+                self.stats.disk_hits += 1
+                self._store(key, prompt)
+                return prompt
+
+        self.stats.misses += 1
+        return None
+
+    def put(self, key: str, prompt: Any) -> None:
+        """Store a prompt in memory and, if enabled, on disk."""
+        self._store(key, prompt)
+
+        path = self._disk_path(key)
+        if path is None:
+            return
+
+        import torch
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        torch.save(prompt, tmp_path)
+        os.replace(tmp_path, path)
+
+    def _store(self, key: str, prompt: Any) -> None:
+        self._entries[key] = prompt
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (disk entries are kept)."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
@@ -1,14 +1,27 @@
 """Qwen3-TTS wrapper for voice cloning."""
 
+import asyncio
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional
 
 import numpy as np
-import soundfile as sf
-import torch
 
+from ..aio import AsyncRunner, check_cancelled
+from ..audio.loader import file_digest, load_audio
+from ..audio.resample import resample
 from ..config import TTSConfig
+from ..metrics import memory_usage, metrics
+from .batching import plan_batches
+from .output_cache import OutputCache, write_audio
+from .precision import load_dtype, quantize_linear, resolve_precision
+from .prompt_cache import VoicePromptCache
+from .shared_weights import map_weights, save_weights, weights_path
+from .stitch import crossfade_concat
+from .stub import STUB_MODEL_NAME, StubTTSModel
+from .text import segment_text
+from .warm_start import SnapshotIndex
 
 
 class QwenTTS:
@@ -18,12 +31,26 @@ class QwenTTS:
         self.config = config or TTSConfig()
         self._model = None
         self._device = None
+        self.precision: Optional[str] = None  # Resolved on load
+        self.weights_path: Optional[Path] = None  # Mapped weights file, if shared
+        self._runner: Optional[AsyncRunner] = None  # Created by the first async call
+        self.prompt_cache = VoicePromptCache(
+            max_entries=self.config.prompt_cache_size,
+            cache_dir=self.config.prompt_cache_dir,
+        )
+        self.output_cache = None
+        if self.config.output_cache_dir is not None:
+            self.output_cache = OutputCache(
+                self.config.output_cache_dir, self.config.output_cache_max_bytes
+            )
 
     def _detect_device(self) -> str:
         """Detect the best available device."""
         if self.config.device != "auto":
             return self.config.device
 
+        import torch
+
         if torch.cuda.is_available():
             return "cuda"
         return "cpu"
@@ -34,27 +61,154 @@ class QwenTTS:
             return
 
         self._device = self._detect_device()
-        print(f"Loading model on {self._device}...")
+        precision = resolve_precision(self.config.precision, self._device)
+        stub = self.config.model_name == STUB_MODEL_NAME
+        shared = self.config.shared_weights_dir is not None and not stub
+        if shared and self._device != "cpu":
+            raise ValueError("Shared weights are only available on CPU (use --device cpu)")
+        if shared and precision == "int8":
+            raise ValueError("Shared weights cannot be combined with int8 (quantized weights are not mapped)")
+        print(f"Loading model on {self._device} ({precision})...")
+
+        source = self.config.model_name
+        load_kwargs = {}
+        snapshots = None
+        if self.config.warm_start_index is not None and not stub:
+            snapshots = SnapshotIndex(self.config.warm_start_index)
+            snapshot = snapshots.lookup(self.config.model_name)
+            if snapshot is not None:
+                source = str(snapshot)
+                # Keeps the remaining sub-model lookups of this load from reaching the Hub
+                load_kwargs["local_files_only"] = True
 
         try:
-            from qwen_tts import Qwen3TTSModel
-
-            dtype = torch.float32
-            if self._device == "cuda":
-                dtype = torch.bfloat16
-
-            self._model = Qwen3TTSModel.from_pretrained(
-                self.config.model_name,
-                device_map=self._device,
-                dtype=dtype,
-            )
-
-            print(f"Model loaded: {self.config.model_name}")
+            if stub:
+                model_class = StubTTSModel
+            else:
+                from qwen_tts import Qwen3TTSModel as model_class
+
+            with metrics.timer("tts_model_load"):
+                model = model_class.from_pretrained(
+                    source,
+                    device_map=self._device,
+                    dtype=load_dtype(precision),
+                    **load_kwargs,
+                )
+                if precision == "int8" and not stub:
+                    quantize_linear(model)
+
+            if shared:
+                path = weights_path(self.config.shared_weights_dir, self.config.model_name, precision)
+                with metrics.timer("weights_map"):
+                    if not path.exists():
+                        print(f"Saving shared weights to {path}...")
+                        save_weights(model, path)
+                    map_weights(model, path)
+                self.weights_path = path
+                print(f"Weights mapped from {path}: {memory_usage()}")
+
+            if snapshots is not None and source == self.config.model_name:
+                snapshots.record(self.config.model_name)
+
+            self._model = model
+            self.precision = precision
+            if source != self.config.model_name:
+                print(f"Model loaded: {self.config.model_name} (warm start from {source})")
+            else:
+                print(f"Model loaded: {self.config.model_name}")
 
         except Exception as e:
             print(f"Error loading model: {e}", file=sys.stderr)
+            if snapshots is not None and source != self.config.model_name:
+                # Do not keep failing on a broken snapshot; the next run resolves it again
+                snapshots.forget(self.config.model_name)
             raise
 
+    def prompt_key(self, reference_audio: Path, ref_text: Optional[str] = None) -> str:
+        """Get the voice-prompt cache key for a reference.
+
+        Args:
+            reference_audio: Path to reference audio for voice cloning
+            ref_text: Reference text (what was spoken in reference audio)
+
+        Returns:
+            Key from the reference audio content hash, ref_text and model name
+        """
+        reference_audio = Path(reference_audio)
+        if not reference_audio.exists():
+            raise FileNotFoundError(f"Reference audio not found: {reference_audio}")
+
+        return VoicePromptCache.make_key(
+            file_digest(reference_audio), ref_text, self.config.model_name
+        )
+
+    def output_key(
+        self,
+        text: str,
+        reference_audio: Path,
+        sample_rate: int = 24000,
+        ref_text: Optional[str] = None,
+        temperature: float = 1.0,
+        max_chars_per_segment: Optional[int] = None,
+    ) -> str:
+        """Get the output cache key for a synthesis request.
+
+        Without a configured seed, sampling is random and a cached file is
+        one valid rendition rather than the exact result a rerun would give.
+
+        Returns:
+            Key from the normalized text and ref_text, reference audio content
+            hash, model name, temperature, sample rate, seed and segmentation
+        """
+        if max_chars_per_segment is None:
+            max_chars_per_segment = self.config.max_chars_per_segment
+        return OutputCache.make_key(
+            text,
+            file_digest(Path(reference_audio)),
+            ref_text,
+            self.config.model_name,
+            temperature,
+            sample_rate,
+            self.config.seed,
+            max_chars_per_segment,
+            self.config.crossfade_ms,
+        )
+
+    def get_voice_prompt(self, reference_audio: Path, ref_text: Optional[str] = None):
+        """Get the voice-clone prompt for a reference, computing it on a cache miss.
+
+        The prompt (speaker x-vector and reference codec tokens) is keyed by
+        the reference audio content hash, ref_text and model name.
+
+        Args:
+            reference_audio: Path to reference audio for voice cloning
+            ref_text: Reference text (what was spoken in reference audio)
+
+        Returns:
+            Voice-clone prompt items accepted by ``generate_voice_clone``
+        """
+        self.load_model()
+
+        reference_audio = Path(reference_audio)
+        key = self.prompt_key(reference_audio, ref_text)
+        voice_prompt = self.prompt_cache.get(key, map_location=self._device)
+        if voice_prompt is not None:
+            metrics.count("prompt_cache_hits")
+            return voice_prompt
+        metrics.count("prompt_cache_misses")
+
+        # Load reference audio (decoded once per file via the shared cache)
+        ref_audio_data, ref_sr = load_audio(reference_audio)
+
+        with metrics.timer("prompt_build"):
+            voice_prompt = self._model.create_voice_clone_prompt(
+                ref_audio=(ref_audio_data, ref_sr),
+                ref_text=ref_text,
+                x_vector_only_mode=(ref_text is None),
+            )
+        self.prompt_cache.put(key, voice_prompt)
+        return voice_prompt
+
     def generate(
         self,
         text: str,
@@ -63,9 +217,16 @@ class QwenTTS:
         sample_rate: int = 24000,
         ref_text: Optional[str] = None,
         temperature: float = 1.0,
+        max_chars_per_segment: Optional[int] = None,
     ) -> Path:
         """Generate speech using voice cloning.
 
+        Text longer than ``max_chars_per_segment`` is split at sentence and
+        clause boundaries, the segments are synthesized as batches, and the
+        results are stitched back together in order with short crossfades.
+        With an output cache configured, an identical earlier request is
+        linked to ``output_path`` without loading or running the model.
+
         Args:
             text: Text to synthesize
             reference_audio: Path to reference audio for voice cloning
@@ -74,12 +235,11 @@ class QwenTTS:
             ref_text: Reference text (what was spoken in reference audio)
             temperature: Sampling temperature (higher = more energetic/varied, lower = more stable)
                         Default: 1.0, High tension: 1.2-1.5, Calm: 0.7-0.9
+            max_chars_per_segment: Segment length limit (default: config.max_chars_per_segment, 0 = no split)
 
         Returns:
             Path to the generated audio file
         """
-        self.load_model()
-
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -87,42 +247,214 @@ class QwenTTS:
         if not reference_audio.exists():
             raise FileNotFoundError(f"Reference audio not found: {reference_audio}")
 
+        key = None
+        if self.output_cache is not None:
+            key = self.output_key(
+                text, reference_audio, sample_rate, ref_text, temperature, max_chars_per_segment
+            )
+            if self.output_cache.fetch(key, output_path):
+                metrics.count("output_cache_hits")
+                print(f"Output cache hit: {output_path}")
+                return output_path
+            metrics.count("output_cache_misses")
+
+        self.load_model()
+
         print(f"Generating speech for: '{text}'")
         print(f"Using reference: {reference_audio}")
         if temperature != 1.0:
             print(f"Temperature: {temperature}")
 
-        # Load reference audio
-        ref_audio_data, ref_sr = sf.read(reference_audio)
-        if len(ref_audio_data.shape) > 1:
-            ref_audio_data = ref_audio_data.mean(axis=1)
-        ref_audio_data = ref_audio_data.astype(np.float32)
-
         # Generate using voice clone
-        wavs, sr = self._model.generate_voice_clone(
-            text=text,
-            language="auto",
-            ref_audio=(ref_audio_data, ref_sr),
-            ref_text=ref_text,
-            x_vector_only_mode=(ref_text is None),
-            temperature=temperature,
+        audio = self.synthesize(
+            [text], reference_audio, sample_rate, ref_text, temperature, max_chars_per_segment
+        )[0]
+
+        write_audio(output_path, audio, sample_rate)
+        if key is not None:
+            self.output_cache.store(key, output_path)
+        duration = len(audio) / sample_rate
+        print(f"Generated {duration:.2f} seconds of audio to {output_path}")
+
+        return output_path
+
+    def synthesize(
+        self,
+        texts: list[str],
+        reference_audio: Path,
+        sample_rate: int = 24000,
+        ref_text: Optional[str] = None,
+        temperature: float = 1.0,
+        max_chars_per_segment: Optional[int] = None,
+    ) -> list[np.ndarray]:
+        """Synthesize texts in memory.
+
+        Each text is segmented as in ``generate``; the segments of all texts
+        are batched together and each text's segments are stitched back into
+        one waveform.
+
+        Args:
+            texts: Texts to synthesize
+            reference_audio: Path to reference audio for voice cloning
+            sample_rate: Output sample rate
+            ref_text: Reference text (what was spoken in reference audio)
+            temperature: Sampling temperature
+            max_chars_per_segment: Segment length limit (default: config.max_chars_per_segment, 0 = no split)
+
+        Returns:
+            One mono float32 waveform at ``sample_rate`` per text, in order
+        """
+        self.load_model()
+        if not texts:
+            return []
+
+        voice_prompt = self.get_voice_prompt(reference_audio, ref_text)
+
+        if max_chars_per_segment is None:
+            max_chars_per_segment = self.config.max_chars_per_segment
+        segments: list[str] = []
+        owners: list[int] = []
+        for n, text in enumerate(texts):
+            for segment in segment_text(text, max_chars_per_segment) or [text]:
+                segments.append(segment)
+                owners.append(n)
+        if len(segments) > len(texts):
+            print(f"Long-form text: {len(segments)} segments")
+
+        parts: list[list[np.ndarray]] = [[] for _ in texts]
+        wavs: list[np.ndarray] = [None] * len(segments)
+        for i, wav, sr in self._synthesize_batched(segments, voice_prompt, temperature):
+            wavs[i] = wav
+        for owner, wav in zip(owners, wavs):
+            parts[owner].append(wav)
+
+        return [
+            self._resample(crossfade_concat(p, sr, self.config.crossfade_ms), sr, sample_rate)[0]
+            for p in parts
+        ]
+
+    def stream(
+        self,
+        text: str,
+        reference_audio: Path,
+        sample_rate: int = 24000,
+        ref_text: Optional[str] = None,
+        temperature: float = 1.0,
+    ) -> Iterator[np.ndarray]:
+        """Generate speech incrementally, yielding PCM chunks as they are decoded.
+
+        ``generate_voice_clone`` only returns complete waveforms, so the text
+        is split into sentences (long ones further split at clause boundaries,
+        see ``segment_text``) and each one is yielded as soon as it is
+        decoded. Time-to-first-audio is therefore the time to synthesize the
+        first sentence rather than the whole text.
+
+        Args:
+            text: Text to synthesize
+            reference_audio: Path to reference audio for voice cloning
+            sample_rate: Output sample rate
+            ref_text: Reference text (what was spoken in reference audio)
+            temperature: Sampling temperature
+
+        Yields:
+            Mono float32 chunks at ``sample_rate``
+        """
+        self.load_model()
+        voice_prompt = self.get_voice_prompt(reference_audio, ref_text)
+
+        for segment in segment_text(text, self.config.max_chars_per_segment, pack=False) or [text]:
+            wavs, sr = self._synthesize([segment], voice_prompt, temperature)
+            audio, _ = self._resample(wavs[0], sr, sample_rate)
+            yield audio.astype(np.float32, copy=False)
+
+    @property
+    def runner(self) -> AsyncRunner:
+        """Thread pool behind the async methods (``config.async_workers`` model calls at a time)."""
+        if self._runner is None:
+            self._runner = AsyncRunner(self.config.async_workers, "qwen-tts")
+        return self._runner
+
+    async def asynthesize(
+        self,
+        texts: list[str],
+        reference_audio: Path,
+        sample_rate: int = 24000,
+        ref_text: Optional[str] = None,
+        temperature: float = 1.0,
+        max_chars_per_segment: Optional[int] = None,
+    ) -> list[np.ndarray]:
+        """Async ``synthesize``.
+
+        Runs on ``runner``; cancelling the caller stops before the next
+        model-level batch and frees the slot.
+        """
+        return await self.runner.run(
+            self.synthesize, texts, reference_audio, sample_rate, ref_text, temperature, max_chars_per_segment
         )
 
-        audio = wavs[0]
+    async def agenerate(
+        self,
+        text: str,
+        reference_audio: Path,
+        output_path: Path,
+        sample_rate: int = 24000,
+        ref_text: Optional[str] = None,
+        temperature: float = 1.0,
+        max_chars_per_segment: Optional[int] = None,
+    ) -> Path:
+        """Async ``generate``.
 
-        # Resample if needed
-        if sr != sample_rate:
-            import scipy.signal as signal
-            samples = int(len(audio) * sample_rate / sr)
-            audio = signal.resample(audio, samples)
-            sr = sample_rate
+        Synthesis runs on ``runner``; hashing for the output cache and the
+        file write run in the event loop's default executor, so neither
+        blocks the loop nor holds an inference slot.
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        sf.write(output_path, audio, sr)
-        duration = len(audio) / sr
-        print(f"Generated {duration:.2f} seconds of audio to {output_path}")
+        reference_audio = Path(reference_audio)
+        if not reference_audio.exists():
+            raise FileNotFoundError(f"Reference audio not found: {reference_audio}")
 
+        key = None
+        if self.output_cache is not None:
+            key = await asyncio.to_thread(
+                self.output_key, text, reference_audio, sample_rate, ref_text, temperature, max_chars_per_segment
+            )
+            if await asyncio.to_thread(self.output_cache.fetch, key, output_path):
+                metrics.count("output_cache_hits")
+                return output_path
+            metrics.count("output_cache_misses")
+
+        audio = (await self.asynthesize(
+            [text], reference_audio, sample_rate, ref_text, temperature, max_chars_per_segment
+        ))[0]
+
+        await asyncio.to_thread(write_audio, output_path, audio, sample_rate)
+        if key is not None:
+            await asyncio.to_thread(self.output_cache.store, key, output_path)
         return output_path
 
+    async def astream(
+        self,
+        text: str,
+        reference_audio: Path,
+        sample_rate: int = 24000,
+        ref_text: Optional[str] = None,
+        temperature: float = 1.0,
+    ) -> AsyncIterator[np.ndarray]:
+        """Async ``stream``.
+
+        The stream holds one ``runner`` slot until it ends; if the consumer
+        stops early (``break``, ``aclose()`` or cancellation), decoding stops
+        after the current sentence.
+        """
+        chunks = self.runner.iterate(self.stream, text, reference_audio, sample_rate, ref_text, temperature)
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+
     def generate_batch(
         self,
         texts: list[str],
@@ -132,9 +464,19 @@ class QwenTTS:
         prefix: str = "output",
         ref_text: Optional[str] = None,
         temperature: float = 1.0,
+        max_batch_size: Optional[int] = None,
+        workers: int = 1,
     ) -> list[Path]:
         """Generate multiple audio files from a list of texts.
 
+        Texts are grouped into padded model-level batches (see
+        ``plan_batches``) that share one voice prompt, and the results are
+        split back out into one file per text in input order. With
+        ``workers`` other than 1, the texts are sharded across a
+        ``TTSWorkerPool`` of pinned worker processes instead. With an output
+        cache configured, texts already generated are linked from the cache
+        and only the rest are synthesized.
+
         Args:
             texts: List of texts to synthesize
             reference_audio: Path to reference audio
@@ -143,6 +485,8 @@ class QwenTTS:
             prefix: Filename prefix
             ref_text: Reference text
             temperature: Sampling temperature
+            max_batch_size: Texts per forward pass (default: config.max_batch_size)
+            workers: Worker processes (1 = this process, 0 = pick from cores and RAM)
 
         Returns:
             List of paths to generated audio files
@@ -150,17 +494,139 @@ class QwenTTS:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        outputs = []
-        for i, text in enumerate(texts):
-            output_path = output_dir / f"{prefix}_{i:03d}.wav"
-            self.generate(text, reference_audio, output_path, sample_rate, ref_text, temperature)
-            outputs.append(output_path)
-
+        outputs = [output_dir / f"{prefix}_{i:03d}.wav" for i in range(len(texts))]
+        todo = list(range(len(texts)))
+        keys: dict[int, str] = {}
+        if self.output_cache is not None and texts:
+            # Batch outputs are not segmented, so the key uses max_chars_per_segment=0
+            for i, text in enumerate(texts):
+                keys[i] = self.output_key(text, reference_audio, sample_rate, ref_text, temperature, 0)
+            todo = [i for i in todo if not self.output_cache.fetch(keys[i], outputs[i])]
+            metrics.count("output_cache_hits", len(texts) - len(todo))
+            metrics.count("output_cache_misses", len(todo))
+            if len(todo) < len(texts):
+                print(f"Output cache: {len(texts) - len(todo)} of {len(texts)} files reused")
+        if not todo:
+            return outputs
+
+        if workers != 1:
+            from .pool import TTSWorkerPool
+
+            with TTSWorkerPool(self.config, workers or None) as pool:
+                paths = pool.generate_batch(
+                    [texts[i] for i in todo], reference_audio, output_dir, sample_rate,
+                    f"{prefix}_pending", ref_text, temperature,
+                )
+            for i, path in zip(todo, paths):
+                Path(path).replace(outputs[i])
+        else:
+            self.load_model()
+            voice_prompt = self.get_voice_prompt(reference_audio, ref_text)
+
+            # Writes run on a background thread so they overlap the next batch
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                pending = []
+                for n, wav, sr in self._synthesize_batched(
+                    [texts[i] for i in todo], voice_prompt, temperature, max_batch_size
+                ):
+                    audio, out_sr = self._resample(wav, sr, sample_rate)
+                    pending.append(writer.submit(write_audio, outputs[todo[n]], audio, out_sr))
+                for future in pending:
+                    future.result()
+            print(f"Generated {len(todo)} files in {output_dir}")
+
+        if keys:
+            self.output_cache.store_many([(keys[i], outputs[i]) for i in todo])
         return outputs
 
+    def _synthesize_batched(
+        self,
+        texts: list[str],
+        voice_prompt,
+        temperature: float = 1.0,
+        max_batch_size: Optional[int] = None,
+    ) -> Iterator[tuple[int, np.ndarray, int]]:
+        """Synthesize texts as padded model-level batches.
+
+        Args:
+            texts: Texts to synthesize
+            voice_prompt: Prompt from ``get_voice_prompt``
+            temperature: Sampling temperature
+            max_batch_size: Texts per forward pass (default: config.max_batch_size)
+
+        Yields:
+            Tuples of (index into texts, waveform, model sample rate), batch by batch
+        """
+        batches = plan_batches(
+            texts,
+            max_batch_size=max_batch_size or self.config.max_batch_size,
+            max_batch_chars=self.config.max_batch_chars,
+        )
+        if len(batches) > 1:
+            print(f"Generating {len(texts)} texts in {len(batches)} batches")
+
+        for n, batch in enumerate(batches, 1):
+            if len(batches) > 1:
+                print(f"Batch {n}/{len(batches)}: {len(batch)} texts")
+            wavs, sr = self._synthesize([texts[i] for i in batch], voice_prompt, temperature)
+            for i, wav in zip(batch, wavs):
+                yield i, wav, sr
+
+    def _synthesize(
+        self,
+        texts: list[str],
+        voice_prompt,
+        temperature: float = 1.0,
+    ) -> tuple[list[np.ndarray], int]:
+        """Run one model-level batch through ``generate_voice_clone``.
+
+        Args:
+            texts: Texts to synthesize in a single forward pass
+            voice_prompt: Prompt from ``get_voice_prompt``
+            temperature: Sampling temperature
+
+        Returns:
+            Tuple of (one waveform per text, model sample rate)
+        """
+        check_cancelled()
+        if self.config.seed is not None:
+            import torch
+
+            # Reseeding per call makes a request reproducible given the same batching
+            torch.manual_seed(self.config.seed)
+        with metrics.timer("generate_voice_clone"):
+            if len(texts) == 1:
+                wavs, sr = self._model.generate_voice_clone(
+                    text=texts[0],
+                    language="auto",
+                    voice_clone_prompt=voice_prompt,
+                    temperature=temperature,
+                )
+            else:
+                wavs, sr = self._model.generate_voice_clone(
+                    text=list(texts),
+                    language=["auto"] * len(texts),
+                    voice_clone_prompt=list(voice_prompt) * len(texts),
+                    temperature=temperature,
+                )
+        wavs = [np.asarray(w, dtype=np.float32) for w in wavs]
+        metrics.count("tts_texts", len(texts))
+        metrics.count("tts_audio_seconds", sum(len(w) for w in wavs) / sr)
+        return wavs, sr
+
+    @staticmethod
+    def _resample(audio: np.ndarray, sr: int, sample_rate: int) -> tuple[np.ndarray, int]:
+        """Resample model output to the requested sample rate if needed."""
+        if sr == sample_rate:
+            return audio, sr
+
+        with metrics.timer("resample"):
+            return resample(audio, sr, sample_rate), sample_rate
+
     @property
     def device(self) -> str:
         """Get the current device."""
         if self._device is None:
             return self._detect_device()
         return self._device
+
@@ -0,0 +1,263 @@
+"""Dynamic micro-batching scheduler for concurrent synthesis requests."""
+
+import queue
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+class QueueFullError(RuntimeError):
+    """Raised when the scheduler queue is at capacity."""
+
+
+class SchedulerStoppedError(RuntimeError):
+    """Set on requests still queued when the scheduler stops."""
+
+
+@dataclass
+class _Request:
+    text: str
+    reference_audio: Path
+    ref_text: Optional[str]
+    temperature: float
+    sample_rate: int
+    max_chars_per_segment: Optional[int]
+    future: Future = field(default_factory=Future)
+    submitted: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class SchedulerMetrics:
+    """Queue, batch and wait-time counters for the scheduler."""
+
+    requests: int = 0
+    rejected: int = 0
+    failed: int = 0
+    batches: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    max_batch_size: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.requests / self.batches if self.batches else 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "batches": self.batches,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "mean_batch_size": round(self.mean_batch_size, 3),
+            "max_batch_size": self.max_batch_size,
+            "mean_wait_ms": round(self.mean_wait * 1000, 3),
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+        }
+
+
+class MicroBatchScheduler:
+    """Collects concurrent requests and runs compatible ones as one batch.
+
+    Requests arriving within ``window_ms`` of the first queued request are
+    grouped by voice prompt (reference audio hash, ref_text and model),
+    temperature bucket and output format, and each group is synthesized in a single
+    ``QwenTTS.synthesize`` call. Temperatures that round to the same multiple
+    of ``temperature_step`` may share a batch, which then runs at the
+    temperature most of its requests asked for; a request alone in its batch
+    always runs at exactly its own temperature.
+
+    The model is only ever used from the scheduler's worker thread.
+    """
+
+    def __init__(
+        self,
+        tts,
+        window_ms: float = 20.0,
+        max_batch_size: Optional[int] = None,
+        max_queue: int = 64,
+        temperature_step: float = 0.05,
+    ):
+        self.tts = tts
+        self.window = window_ms / 1000
+        self.max_batch_size = max_batch_size or tts.config.max_batch_size
+        self.temperature_step = temperature_step
+        self.metrics = SchedulerMetrics()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._metrics_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="voice-clone-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the worker thread after the current batch.
+
+        Requests still queued fail with ``SchedulerStoppedError`` so that
+        nobody waits on them forever.
+        """
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._drain()
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                request = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if not request.future.done():
+                request.future.set_exception(SchedulerStoppedError("Synthesis scheduler stopped"))
+        with self._metrics_lock:
+            self.metrics.queue_depth = 0
+
+    def submit(
+        self,
+        text: str,
+        reference_audio: Path,
+        sample_rate: int = 24000,
+        ref_text: Optional[str] = None,
+        temperature: float = 1.0,
+        max_chars_per_segment: Optional[int] = None,
+        block: bool = False,
+    ) -> Future:
+        """Queue a synthesis request.
+
+        Args:
+            text: Text to synthesize
+            reference_audio: Path to reference audio
+            sample_rate: Output sample rate
+            ref_text: Reference text
+            temperature: Sampling temperature
+            max_chars_per_segment: Segment length limit (see ``QwenTTS.generate``)
+            block: Wait for queue space instead of raising
+
+        Returns:
+            Future resolving to a mono float32 waveform at ``sample_rate``
+
+        Raises:
+            QueueFullError: The queue is full and ``block`` is False
+        """
+        request = _Request(
+            text, Path(reference_audio), ref_text, temperature, sample_rate, max_chars_per_segment
+        )
+        try:
+            self._queue.put(request, block=block)
+        except queue.Full:
+            with self._metrics_lock:
+                self.metrics.rejected += 1
+            raise QueueFullError(f"Synthesis queue is full ({self._queue.maxsize} requests)")
+        if self._stopping.is_set() and self._thread is None:
+            # Raced with stop(): nothing will run it
+            self._drain()
+
+        with self._metrics_lock:
+            depth = self._queue.qsize()
+            self.metrics.queue_depth = depth
+            self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, depth)
+        return request.future
+
+    def generate(self, text: str, reference_audio: Path, **kwargs) -> np.ndarray:
+        """Submit a request and wait for its waveform."""
+        return self.submit(text, reference_audio, **kwargs).result()
+
+    def _collect(self) -> list[_Request]:
+        """Wait for a request, then gather others arriving within the window."""
+        try:
+            first = self._queue.get(timeout=0.1)
+        except queue.Empty:
+            return []
+
+        pending = [first]
+        deadline = time.perf_counter() + self.window
+        while len(pending) < self._queue.maxsize:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                pending.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return pending
+
+    def _group(self, pending: list[_Request]) -> dict[tuple, list[_Request]]:
+        groups: dict[tuple, list[_Request]] = {}
+        for request in pending:
+            try:
+                prompt_key = self.tts.prompt_key(request.reference_audio, request.ref_text)
+            except Exception as e:
+                request.future.set_exception(e)
+                continue
+            bucket = round(request.temperature / self.temperature_step) * self.temperature_step
+            key = (prompt_key, round(bucket, 6), request.sample_rate, request.max_chars_per_segment)
+            groups.setdefault(key, []).append(request)
+        return groups
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            pending = self._collect()
+            if not pending:
+                continue
+
+            with self._metrics_lock:
+                self.metrics.queue_depth = self._queue.qsize()
+
+            for group in self._group(pending).values():
+                # Sorted so each batch spans as few distinct temperatures as possible
+                group.sort(key=lambda r: r.temperature)
+                for start in range(0, len(group), self.max_batch_size):
+                    self._run_batch(group[start : start + self.max_batch_size])
+
+    def _run_batch(self, batch: list[_Request]) -> None:
+        # A temperature that was actually requested: the most common one, ties to the lowest
+        temperature = Counter(r.temperature for r in batch).most_common(1)[0][0]
+        started = time.perf_counter()
+        waits = [started - r.submitted for r in batch]
+        with self._metrics_lock:
+            self.metrics.batches += 1
+            self.metrics.requests += len(batch)
+            self.metrics.max_batch_size = max(self.metrics.max_batch_size, len(batch))
+            self.metrics.total_wait += sum(waits)
+            self.metrics.max_wait = max([self.metrics.max_wait] + waits)
+
+        first = batch[0]
+        try:
+            audios = self.tts.synthesize(
+                [r.text for r in batch],
+                first.reference_audio,
+                sample_rate=first.sample_rate,
+                ref_text=first.ref_text,
+                temperature=temperature,
+                max_chars_per_segment=first.max_chars_per_segment,
+            )
+            for request, audio in zip(batch, audios):
+                request.future.set_result(audio)
+        except Exception as e:
+            print(f"Batch of {len(batch)} requests failed: {e}", file=sys.stderr)
+            with self._metrics_lock:
+                self.metrics.failed += len(batch)
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
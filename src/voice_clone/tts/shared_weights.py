@@ -0,0 +1,64 @@
+"""Memory-mapped model weights shared between processes.
+
+Each process that loads the model with ``from_pretrained`` holds its own
+copy of the weights in anonymous memory. Here the CPU weights are saved
+once, already converted to the load precision, as a torch state dict; every
+process then maps that file read-only and assigns the mapped tensors to its
+model in place of its own copies. The kernel backs all the mappings with
+the same page-cache pages, so N workers hold the weights once instead of N
+times.
+"""
+
+import gc
+import os
+import re
+from pathlib import Path
+
+from .precision import torch_module
+
+DEFAULT_SHARED_WEIGHTS_DIR = Path.home() / ".voice-clone" / "weights"
+
+
+def weights_path(weights_dir: Path, model_name: str, precision: str) -> Path:
+    """File holding the weights of ``model_name`` at ``precision``."""
+    name = re.sub(r"[^A-Za-z0-9._-]+", "--", model_name).strip("-")
+    return Path(weights_dir) / f"{name}-{precision}.pt"
+
+
+def save_weights(model, path: Path) -> None:
+    """Write the state dict of a loaded model to ``path`` unless another process already has.
+
+    Workers starting together take a lock, so the weights are written once
+    and every worker maps the same file.
+    """
+    import fcntl
+
+    import torch
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_suffix(".lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if path.exists():
+            return
+        state = {name: tensor.detach().contiguous() for name, tensor in torch_module(model).state_dict().items()}
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        torch.save(state, tmp_path)
+        os.replace(tmp_path, path)
+
+
+def map_weights(model, path: Path) -> None:
+    """Replace the weights of a loaded model with read-only mappings of ``path``.
+
+    The model's own copies are released; its tensors are backed by the page
+    cache from then on. Only valid for CPU inference that does not modify
+    the weights.
+    """
+    import torch
+
+    module = torch_module(model)
+    state = torch.load(path, map_location="cpu", mmap=True, weights_only=True)
+    # assign=True keeps the mapped tensors instead of copying into the existing ones
+    module.load_state_dict(state, assign=True)
+    del state
+    gc.collect()
@@ -0,0 +1,43 @@
+"""Joining synthesized segments into a single waveform."""
+
+import numpy as np
+
+
+def crossfade_concat(chunks: list[np.ndarray], sample_rate: int, crossfade_ms: float = 30.0) -> np.ndarray:
+    """Concatenate audio chunks with short equal-power crossfades.
+
+    Args:
+        chunks: Mono waveforms in playback order
+        sample_rate: Sample rate of the chunks
+        crossfade_ms: Overlap between adjacent chunks in milliseconds
+
+    Returns:
+        Single mono float32 waveform
+    """
+    chunks = [np.asarray(c, dtype=np.float32) for c in chunks if len(c)]
+    if not chunks:
+        return np.zeros(0, dtype=np.float32)
+
+    fade = int(sample_rate * crossfade_ms / 1000)
+    # Overlap cannot exceed the shortest chunk
+    fade = max(0, min([fade] + [len(c) for c in chunks]))
+
+    total = sum(len(c) for c in chunks) - fade * (len(chunks) - 1)
+    out = np.zeros(total, dtype=np.float32)
+
+    if fade:
+        t = np.linspace(0.0, np.pi / 2, fade, dtype=np.float32)
+        fade_in = np.sin(t)
+        fade_out = np.cos(t)
+
+    pos = 0
+    for i, chunk in enumerate(chunks):
+        if i > 0 and fade:
+            out[pos : pos + fade] *= fade_out
+            out[pos : pos + fade] += chunk[:fade] * fade_in
+            out[pos + fade : pos + len(chunk)] = chunk[fade:]
+        else:
+            out[pos : pos + len(chunk)] = chunk
+        pos += len(chunk) - fade
+
+    return out
@@ -0,0 +1,63 @@
+"""Stand-in for Qwen3TTSModel that needs no weights.
+
+Selected with the model name ``stub``. It follows the same call signatures
+and returns speech-length tones, so the pipeline around the model
+(prompt caching, segmentation, batching, resampling, writing) can be run
+and benchmarked on machines without the Qwen weights or a GPU.
+"""
+
+import hashlib
+from typing import Optional, Union
+
+import numpy as np
+
+STUB_MODEL_NAME = "stub"
+STUB_SAMPLE_RATE = 24000
+STUB_SECONDS_PER_CHAR = 0.15  # Roughly the pace of Japanese speech
+
+
+class StubTTSModel:
+    """Deterministic tone generator with the ``Qwen3TTSModel`` interface."""
+
+    @classmethod
+    def from_pretrained(cls, name: str, **kwargs) -> "StubTTSModel":
+        return cls()
+
+    def create_voice_clone_prompt(
+        self,
+        ref_audio: tuple[np.ndarray, int],
+        ref_text: Optional[str] = None,
+        x_vector_only_mode: bool = False,
+    ) -> list[dict]:
+        audio, sample_rate = ref_audio
+        # The pitch stands in for the speaker embedding
+        spectrum = np.abs(np.fft.rfft(np.asarray(audio, dtype=np.float32)[: sample_rate * 10]))
+        freqs = np.fft.rfftfreq(min(len(audio), sample_rate * 10), 1 / sample_rate)
+        band = (freqs >= 80) & (freqs <= 400)
+        pitch = float(freqs[band][np.argmax(spectrum[band])]) if band.any() else 150.0
+        return [{"pitch": pitch, "ref_text": ref_text, "x_vector_only_mode": x_vector_only_mode}]
+
+    def _tone(self, text: str, prompt: dict, temperature: float) -> np.ndarray:
+        n = max(1, int(len(text) * STUB_SECONDS_PER_CHAR * STUB_SAMPLE_RATE))
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:4], "little")
+        rng = np.random.default_rng(seed)
+        t = np.arange(n, dtype=np.float32) / STUB_SAMPLE_RATE
+        # Syllable-rate amplitude modulation and a little noise scaled by temperature
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4.0 * t)
+        tone = np.sin(2 * np.pi * prompt["pitch"] * t) + 0.5 * np.sin(4 * np.pi * prompt["pitch"] * t)
+        noise = rng.standard_normal(n).astype(np.float32) * 0.02 * temperature
+        return (0.2 * envelope * tone + noise).astype(np.float32)
+
+    def generate_voice_clone(
+        self,
+        text: Union[str, list[str]],
+        language: Union[str, list[str]] = "auto",
+        voice_clone_prompt: Optional[list[dict]] = None,
+        temperature: float = 1.0,
+        **kwargs,
+    ) -> tuple[list[np.ndarray], int]:
+        texts = [text] if isinstance(text, str) else list(text)
+        prompts = list(voice_clone_prompt or [{"pitch": 150.0}])
+        if len(prompts) == 1:
+            prompts = prompts * len(texts)
+        return [self._tone(t, p, temperature) for t, p in zip(texts, prompts)], STUB_SAMPLE_RATE
@@ -0,0 +1,83 @@
+"""Text segmentation for chunked synthesis."""
+
+import re
+
+# Sentence boundaries: after Japanese/full-width terminators (unless a closing
+# bracket or another terminator follows), after ASCII terminators followed by
+# whitespace, and at line breaks.
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[。！？])(?![」』）】！？。])|(?<=[.!?])(?=\s)|(?<=[」』）】])(?=\s)|\n+")
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text into sentences, keeping terminators attached.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Non-empty, stripped sentences in order
+    """
+    return [s.strip() for s in _SENTENCE_BOUNDARY.split(text) if s and s.strip()]
+
+
+# Clause boundaries used to break up sentences that are still too long
+_CLAUSE_BOUNDARY = re.compile(r"(?<=[、，,;；:：])")
+
+
+def _split_long(sentence: str, max_chars: int) -> list[str]:
+    """Split a sentence longer than max_chars at clause boundaries, then hard-wrap."""
+    pieces: list[str] = []
+    current = ""
+    for clause in _CLAUSE_BOUNDARY.split(sentence):
+        if not clause:
+            continue
+        if current and len(current) + len(clause) > max_chars:
+            pieces.append(current)
+            current = ""
+        current += clause
+        while len(current) > max_chars:
+            pieces.append(current[:max_chars])
+            current = current[max_chars:]
+    if current:
+        pieces.append(current)
+    return [p.strip() for p in pieces if p.strip()]
+
+
+def segment_text(text: str, max_chars: int = 120, pack: bool = True) -> list[str]:
+    """Split text into synthesis segments of at most max_chars characters.
+
+    Text is split at sentence boundaries (。！？ . ! ? and line breaks);
+    sentences longer than ``max_chars`` are split again at clause boundaries
+    (、，, ; :) and hard-wrapped as a last resort. With ``pack``, consecutive
+    short sentences are merged back together up to ``max_chars``.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum characters per segment (0 = no limit)
+        pack: Merge short consecutive sentences into one segment
+
+    Returns:
+        Segments in order
+    """
+    if max_chars <= 0:
+        return [text.strip()] if text.strip() else []
+
+    pieces: list[str] = []
+    for sentence in split_sentences(text):
+        if len(sentence) > max_chars:
+            pieces.extend(_split_long(sentence, max_chars))
+        else:
+            pieces.append(sentence)
+
+    if not pack:
+        return pieces
+
+    segments: list[str] = []
+    for piece in pieces:
+        if segments and len(segments[-1]) + len(piece) + 1 <= max_chars:
+            # ASCII sentences need a space when joined; CJK ones do not
+            sep = " " if piece[:1].isascii() and segments[-1][-1:].isascii() else ""
+            segments[-1] += sep + piece
+        else:
+            segments.append(piece)
+    return segments
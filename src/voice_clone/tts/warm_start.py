@@ -0,0 +1,75 @@
+"""Warm start: load the model from its resolved local snapshot.
+
+Given a Hub id, ``from_pretrained`` resolves every file against the Hub on
+each load, one metadata request per file even when all of them are
+already cached. After one successful load the resolved snapshot directory
+is recorded, and later loads pass that directory with ``local_files_only``, so
+a cold start only reads the local safetensors files (which transformers
+memory-maps).
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_SNAPSHOT_INDEX = Path.home() / ".voice-clone" / "snapshots.json"
+
+
+class SnapshotIndex:
+    """Model name -> local snapshot directory, persisted as JSON."""
+
+    def __init__(self, path: Path = DEFAULT_SNAPSHOT_INDEX):
+        self.path = Path(path)
+
+    def _read(self) -> dict:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Warning: ignoring unreadable snapshot index {self.path}: {e}", file=sys.stderr)
+            return {}
+
+    def _write(self, entries: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entries, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def lookup(self, model_name: str) -> Optional[Path]:
+        """Local snapshot recorded for ``model_name``, if it is still on disk."""
+        path = self._read().get(model_name)
+        if path and (Path(path) / "config.json").is_file():
+            return Path(path)
+        return None
+
+    def record(self, model_name: str) -> Optional[Path]:
+        """Resolve ``model_name`` in the local Hub cache and remember the directory.
+
+        Returns:
+            The snapshot directory, or None if it is not fully cached
+            (or huggingface_hub is not installed)
+        """
+        if Path(model_name).is_dir():
+            # Already a local path: nothing to resolve
+            return None
+        try:
+            from huggingface_hub import snapshot_download
+
+            path = Path(snapshot_download(model_name, local_files_only=True))
+        except Exception as e:
+            print(f"Warning: no local snapshot of {model_name} to warm-start from: {e}", file=sys.stderr)
+            return None
+
+        entries = self._read()
+        entries[model_name] = str(path)
+        self._write(entries)
+        return path
+
+    def forget(self, model_name: str) -> None:
+        """Drop the entry for ``model_name`` (e.g. after a failed load)."""
+        entries = self._read()
+        if entries.pop(model_name, None) is not None:
+            self._write(entries)